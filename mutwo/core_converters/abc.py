@@ -18,8 +18,12 @@
 """Defining the public API for any converter class."""
 
 import abc
+import asyncio
+import concurrent.futures
+import heapq
 import typing
 
+from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import core_utilities
@@ -45,23 +49,59 @@ class Converter(core_utilities.MutwoObject, abc.ABC):
     def __call__(self, *args, **kwargs) -> typing.Any:
         return self.convert(*args, **kwargs)
 
+    async def aconvert(
+        self, event_or_parameter_or_file_to_convert: typing.Any, *args, **kwargs
+    ) -> typing.Any:
+        """Asynchronous version of `convert`.
+
+        By default `convert` runs in a separate thread (see
+        :func:`asyncio.to_thread`), so that the event loop isn't blocked.
+        Converters which can convert cooperatively (for instance with
+        :func:`EventConverter._aconvert_event`) override this method.
+
+        **Example:**
+
+        >>> import asyncio
+        >>> from mutwo import core_converters, core_events
+        >>> converter = core_converters.ChrononToAttribute("duration", 0)
+        >>> asyncio.run(converter.aconvert(core_events.Chronon(2)))
+        DirectDuration(2.0)
+        """
+        return await asyncio.to_thread(
+            self.convert, event_or_parameter_or_file_to_convert, *args, **kwargs
+        )
+
 
 class EventConverter(Converter):
     """Abstract base class for Converter which handle mutwo events.
 
     This class helps building new classes which convert mutwo events
-    with few general private methods (and without adding any new public
-    method). Converting mutwo event often involves the same pattern:
-    due to the nested structure of an Event, the converter has
-    to iterate through the different layers until it reaches leaves
-    (any class that inherits from :class:`mutwo.core_events.Chronon`).
+    with few general private methods. Converting mutwo event often
+    involves the same pattern: due to the nested structure of an Event,
+    the converter has to iterate through the different layers until it
+    reaches leaves (any class that inherits from :class:`mutwo.core_events.Chronon`).
     This common iteration process and the different time treatment
     between :class:`mutwo.core_events.Consecution` and
     :class:`mutwo.core_events.Concurrence` are implemented in
     :class:`EventConverter`.  For writing a new EventConverter class,
     one only has to override the abstract method :func:`_convert_chronon`
     and the abstract method :func:`convert` (where one will perhaps call
-    :func:`_convert_event`.).
+    :func:`_convert_event`.). In the same way :func:`aconvert` can be
+    overridden with :func:`_aconvert_event`. :func:`stream` and
+    :func:`astream` lazily yield the converted data of each chronon.
+
+    :param executor: If set, the children of a top-level
+        :class:`mutwo.core_events.Concurrence` are converted concurrently
+        by this :class:`concurrent.futures.Executor` (for instance a
+        :class:`concurrent.futures.ThreadPoolExecutor` or a
+        :class:`concurrent.futures.ProcessPoolExecutor`). The results are
+        reassembled in the order of the children, so they are the same as
+        the results without an executor. Converters which change the
+        events they convert in place instead of returning converted data
+        can't be used with a process pool, because each process only
+        changes its own copy of the events. If ``None`` all events are
+        converted serially. Default to ``None``.
+    :type executor: typing.Optional[concurrent.futures.Executor]
 
     **Example:**
 
@@ -98,6 +138,29 @@ class EventConverter(Converter):
     D(5.9947745152): D(1.1502716523)
     """
 
+    # Subclasses which don't call 'EventConverter.__init__' convert serially.
+    _executor: typing.Optional[concurrent.futures.Executor] = None
+
+    # Methods which walk through an event. If a subclass overrides any of
+    # them, '_aconvert_event' and '_stream_event' wouldn't return the same
+    # as '_convert_event' and can't be used.
+    _walk_method_name_tuple = (
+        "_convert_event",
+        "_convert_consecution",
+        "_convert_concurrence",
+        "_convert_concurrence_children",
+    )
+
+    def __init__(self, executor: typing.Optional[concurrent.futures.Executor] = None):
+        self._executor = executor
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Executors can't be pickled, but converters need to be pickled
+        # if they are used with a process pool.
+        state = self.__dict__.copy()
+        state.pop("_executor", None)
+        return state
+
     @abc.abstractmethod
     def _convert_chronon(
         self,
@@ -107,6 +170,30 @@ class EventConverter(Converter):
     ) -> typing.Sequence[typing.Any]:
         """Convert instance of :class:`mutwo.core_events.Chronon`."""
 
+    def _convert_concurrence_children(
+        self,
+        concurrence: core_events.Concurrence,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+    ) -> list[typing.Any]:
+        """Convert each child of a :class:`mutwo.core_events.Concurrence`.
+
+        The children of the top-level concurrence are converted by the
+        executor of the converter (if there is any). Deeper nested
+        concurrences are always converted serially: otherwise tasks of
+        an executor would wait for other tasks of the same executor,
+        which could block all of its workers.
+        """
+        if self._executor is None or depth > 0:
+            return [
+                self._convert_event(e, absolute_time, depth + 1) for e in concurrence
+            ]
+        future_list = [
+            self._executor.submit(self._convert_event, e, absolute_time, depth + 1)
+            for e in concurrence
+        ]
+        return [future.result() for future in future_list]
+
     def _convert_concurrence(
         self,
         concurrence: core_events.Concurrence,
@@ -115,8 +202,10 @@ class EventConverter(Converter):
     ) -> typing.Sequence[typing.Any]:
         """Convert instance of :class:`mutwo.core_events.Concurrence`."""
         d: list[tuple[typing.Any]] = []
-        for e in concurrence:
-            d.extend(self._convert_event(e, absolute_time, depth + 1))
+        for data in self._convert_concurrence_children(
+            concurrence, absolute_time, depth
+        ):
+            d.extend(data)
         return tuple(d)
 
     def _convert_consecution(
@@ -156,25 +245,335 @@ class EventConverter(Converter):
             case core_events.Chronon():
                 f = self._convert_chronon
             case _:
-                raise TypeError(
-                    f"Can't convert object '{event_to_convert}' of type "
-                    f"'{type(event_to_convert)}' with EventConverter."
-                    " Supported types only include all inherited classes "
-                    f"from '{core_events.abc.Event}'."
-                )
+                raise _unsupported_type_error(event_to_convert)
         try:
             return f(event_to_convert, t, depth)
         except TypeError:
             return f(event_to_convert, t)
 
+    def _iter_chronon(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+    ) -> typing.Iterator[tuple[core_parameters.abc.Duration, int, core_events.Chronon]]:
+        """Lazily yield `(absolute_time, depth, chronon)` for each chronon.
+
+        The chronons are yielded in the same order as they are converted
+        by :func:`_convert_event`: nested events are visited depth-first.
+        """
+        e = event_to_convert
+        t = core_parameters.abc.Duration.from_any(absolute_time)
+        match e:
+            case core_events.Consecution():
+                for t_rel, e_child in _iter_start_time_and_child(e):
+                    yield from self._iter_chronon(e_child, t_rel + t, depth + 1)
+            case core_events.Concurrence():
+                for e_child in e:
+                    yield from self._iter_chronon(e_child, t, depth + 1)
+            case core_events.Chronon():
+                yield t, depth, e
+            case _:
+                raise _unsupported_type_error(e)
+
+    def _iter_chronon_by_time(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+    ) -> typing.Iterator[tuple[core_parameters.abc.Duration, int, core_events.Chronon]]:
+        """Lazily yield `(absolute_time, depth, chronon)` sorted by time.
+
+        Same as :func:`_iter_chronon`, but the chronons are yielded in
+        the order of their absolute times. The chronons of the children
+        of a :class:`~mutwo.core_events.Concurrence` are merged with a
+        heap which only holds the next chronon of each child, so no
+        child needs to be converted beforehand. Chronons with equal
+        absolute times are yielded in the order of their children.
+        """
+        e = event_to_convert
+        t = core_parameters.abc.Duration.from_any(absolute_time)
+        match e:
+            case core_events.Consecution():
+                # Children of a Consecution don't overlap, so they are
+                # already sorted.
+                for t_rel, e_child in _iter_start_time_and_child(e):
+                    yield from self._iter_chronon_by_time(e_child, t_rel + t, depth + 1)
+            case core_events.Concurrence():
+                yield from heapq.merge(
+                    *(
+                        self._iter_chronon_by_time(e_child, t, depth + 1)
+                        for e_child in e
+                    ),
+                    key=lambda item: item[0].beat_count,
+                )
+            case core_events.Chronon():
+                yield t, depth, e
+            case _:
+                raise _unsupported_type_error(e)
+
+    def _stream_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+        sort_by_time: bool = False,
+    ) -> typing.Iterator[typing.Any]:
+        """Streaming version of :func:`_convert_event`.
+
+        Instead of collecting the data of all chronons in tuples at each
+        nesting level, the data returned by :func:`_convert_chronon` is
+        yielded as soon as a chronon has been converted. So converting
+        very long or deep events only needs constant memory if the
+        caller consumes the data right away. The yielded items are the
+        same as the items of the tuple returned by :func:`_convert_event`,
+        as long as a converter only overrides :func:`_convert_chronon`.
+        If `sort_by_time` is ``True`` the chronons are converted in the
+        order of their absolute times (see :func:`_iter_chronon_by_time`).
+        """
+        for t, d, chronon in self._get_chronon_iterator(sort_by_time)(
+            event_to_convert, absolute_time, depth
+        ):
+            yield from self._convert_chronon_with_depth(chronon, t, d)
+
+    async def _aconvert_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+    ) -> typing.Any:
+        """Asynchronous version of :func:`_convert_event`.
+
+        After each
+        :const:`~mutwo.core_converters.configurations.ASYNC_CHRONON_COUNT_PER_YIELD`
+        converted chronons other tasks of the event loop can run, so many
+        conversions can run in the same event loop without blocking each
+        other. Each chronon is still converted synchronously, so a slow
+        :func:`_convert_chronon` blocks the event loop while it runs. The
+        children of a top-level :class:`~mutwo.core_events.Concurrence`
+        are converted by the executor of the converter (if there is
+        any). The result is the same as the result of
+        :func:`_convert_event`, as long as a converter only overrides
+        :func:`_convert_chronon`.
+        """
+        chronon_count = 0
+        chronon_count_per_yield = (
+            core_converters.configurations.ASYNC_CHRONON_COUNT_PER_YIELD
+        )
+
+        async def convert(e, t, d):
+            nonlocal chronon_count
+            match e:
+                case core_events.Consecution():
+                    child_list = [
+                        await convert(e_child, t_rel + t, d + 1)
+                        for t_rel, e_child in _iter_start_time_and_child(e)
+                    ]
+                case core_events.Concurrence():
+                    if self._executor is None or d > 0:
+                        child_list = [await convert(c, t, d + 1) for c in e]
+                    else:
+                        loop = asyncio.get_running_loop()
+                        child_list = await asyncio.gather(
+                            *(
+                                loop.run_in_executor(
+                                    self._executor, self._convert_event, c, t, d + 1
+                                )
+                                for c in e
+                            )
+                        )
+                case core_events.Chronon():
+                    data = self._convert_chronon_with_depth(e, t, d)
+                    chronon_count += 1
+                    if chronon_count % chronon_count_per_yield == 0:
+                        await asyncio.sleep(0)
+                    return data
+                case _:
+                    raise _unsupported_type_error(e)
+            return self._join_converted_children(e, child_list)
+
+        t = core_parameters.abc.Duration.from_any(absolute_time)
+        return await convert(event_to_convert, t, depth)
+
+    async def _astream_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+        sort_by_time: bool = False,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """Asynchronous version of :func:`_stream_event`.
+
+        Like :func:`_aconvert_event` other tasks of the event loop can
+        run after each
+        :const:`~mutwo.core_converters.configurations.ASYNC_CHRONON_COUNT_PER_YIELD`
+        yielded items. This method wraps the synchronous generator of
+        :func:`_stream_event`: the event loop is blocked while an item is
+        converted, so one slow conversion of a chronon still blocks all
+        other tasks.
+
+        **Example:**
+
+        >>> import asyncio
+        >>> from mutwo import core_converters, core_events
+        >>> class DurationConverter(core_converters.abc.EventConverter):
+        ...     def _convert_chronon(self, event_to_convert, absolute_time):
+        ...         return (event_to_convert.duration,)
+        ...     def convert(self, event_to_convert):
+        ...         return self._convert_event(event_to_convert, 0)
+        ...     async def aconvert(self, event_to_convert):
+        ...         return await self._aconvert_event(event_to_convert, 0)
+        >>> converter = DurationConverter()
+        >>> cns = core_events.Consecution(
+        ...     [core_events.Chronon(1), core_events.Chronon(2)]
+        ... )
+        >>> asyncio.run(converter.aconvert(cns))
+        (DirectDuration(1.0), DirectDuration(2.0))
+        >>> async def print_durations():
+        ...     async for duration in converter._astream_event(cns, 0):
+        ...         print(duration)
+        >>> asyncio.run(print_durations())
+        D(1.0)
+        D(2.0)
+        """
+        chronon_count_per_yield = (
+            core_converters.configurations.ASYNC_CHRONON_COUNT_PER_YIELD
+        )
+        for n, item in enumerate(
+            self._stream_event(event_to_convert, absolute_time, depth, sort_by_time), 1
+        ):
+            yield item
+            if n % chronon_count_per_yield == 0:
+                await asyncio.sleep(0)
+
+    def stream(
+        self, event_to_convert: core_events.abc.Event, sort_by_time: bool = False
+    ) -> typing.Iterator[typing.Any]:
+        """Lazily yield the converted data of each chronon of an event.
+
+        :param event_to_convert: The event which shall be converted.
+        :type event_to_convert: core_events.abc.Event
+        :param sort_by_time: If ``True`` the chronons are converted in the
+            order of their absolute times, otherwise in the order in
+            which they appear in the event. Default to ``False``.
+        :type sort_by_time: bool
+
+        If a converter only overrides :func:`_convert_chronon`, each
+        chronon is converted just before its data is yielded (see
+        :func:`_stream_event`), so long events can be converted with
+        constant memory. Otherwise the event is converted with
+        :func:`_convert_event` first (and `sort_by_time` is ignored).
+
+        **Example:**
+
+        >>> from mutwo import core_converters, core_events
+        >>> class DurationConverter(core_converters.abc.EventConverter):
+        ...     def _convert_chronon(self, event_to_convert, absolute_time):
+        ...         return ((absolute_time, event_to_convert.duration),)
+        ...     def convert(self, event_to_convert):
+        ...         return self._convert_event(event_to_convert, 0)
+        >>> cnc = core_events.Concurrence(
+        ...     [core_events.Chronon(1), core_events.Chronon(2)]
+        ... )
+        >>> for data in DurationConverter().stream(cnc):
+        ...     print(data)
+        (DirectDuration(0.0), DirectDuration(1.0))
+        (DirectDuration(0.0), DirectDuration(2.0))
+        """
+        if self._only_converts_chronon():
+            yield from self._stream_event(
+                event_to_convert, 0, sort_by_time=sort_by_time
+            )
+        else:
+            yield from self._convert_event(event_to_convert, 0)
+
+    async def astream(
+        self, event_to_convert: core_events.abc.Event, sort_by_time: bool = False
+    ) -> typing.AsyncIterator[typing.Any]:
+        """Asynchronous version of :func:`stream`.
+
+        If a converter only overrides :func:`_convert_chronon`, this
+        wraps :func:`_astream_event`: each chronon is converted in the
+        event loop, so a slow :func:`_convert_chronon` blocks other tasks
+        while it runs. Otherwise the event is converted with
+        :func:`_convert_event` in a separate thread first.
+        """
+        if self._only_converts_chronon():
+            async for data in self._astream_event(
+                event_to_convert, 0, sort_by_time=sort_by_time
+            ):
+                yield data
+        else:
+            for data in await asyncio.to_thread(
+                self._convert_event, event_to_convert, 0
+            ):
+                yield data
+
+    def _only_converts_chronon(self) -> bool:
+        cls = type(self)
+        return all(
+            getattr(cls, name) is getattr(EventConverter, name)
+            for name in self._walk_method_name_tuple
+        )
+
+    def _join_converted_children(
+        self, compound: core_events.abc.Compound, converted_child_list: list
+    ) -> typing.Any:
+        # Combine the converted children of a compound in the same way as
+        # '_convert_consecution' and '_convert_concurrence' do.
+        d: list[typing.Any] = []
+        for data in converted_child_list:
+            d.extend(data)
+        return tuple(d)
+
+    def _get_chronon_iterator(self, sort_by_time: bool) -> typing.Callable:
+        return self._iter_chronon_by_time if sort_by_time else self._iter_chronon
+
+    def _convert_chronon_with_depth(
+        self,
+        chronon: core_events.Chronon,
+        absolute_time: core_parameters.abc.Duration,
+        depth: int,
+    ) -> typing.Any:
+        try:
+            return self._convert_chronon(chronon, absolute_time, depth)
+        except TypeError:
+            return self._convert_chronon(chronon, absolute_time)
+
 
 class SymmetricalEventConverter(EventConverter):
     """Abstract base class for Converter which handle mutwo core_events.
 
     This converter is a more specified version of the :class:`EventConverter`.
     It helps for building converters which aim to return mutwo core_events.
+    For writing a new converter it is enough to override
+    :func:`_convert_chronon`: :func:`convert` converts the given event and
+    all its children, :func:`aconvert` does the same cooperatively in the
+    event loop and :func:`stream` and :func:`astream` lazily yield the
+    converted chronons.
+
+    **Example:**
+
+    >>> import asyncio
+    >>> from mutwo import core_converters, core_events
+    >>> class Double(core_converters.abc.SymmetricalEventConverter):
+    ...     def _convert_chronon(self, event_to_convert, absolute_time):
+    ...         chronon = event_to_convert.copy()
+    ...         return chronon.set_parameter("duration", lambda d: d * 2)
+    >>> cns = core_events.Consecution(
+    ...     [core_events.Chronon(1), core_events.Chronon(2)]
+    ... )
+    >>> Double().convert(cns).duration
+    DirectDuration(6.0)
+    >>> asyncio.run(Double().aconvert(cns)).duration
+    DirectDuration(6.0)
+    >>> [chronon.duration for chronon in Double().stream(cns)]
+    [DirectDuration(2.0), DirectDuration(4.0)]
     """
 
+    # Symmetrical converters also walk through an event in 'convert'.
+    _walk_method_name_tuple = ("convert",) + EventConverter._walk_method_name_tuple
+
     @abc.abstractmethod
     def _convert_chronon(
         self,
@@ -192,8 +591,9 @@ class SymmetricalEventConverter(EventConverter):
     ) -> core_events.Concurrence:
         """Convert instance of :class:`mutwo.core_events.Concurrence`."""
         cnc: core_events.Concurrence = concurrence.empty_copy()
-        for e in concurrence:
-            cnc.append(self._convert_event(e, absolute_time, depth + 1))
+        cnc.extend(
+            self._convert_concurrence_children(concurrence, absolute_time, depth)
+        )
         return cnc
 
     def _convert_consecution(
@@ -215,3 +615,127 @@ class SymmetricalEventConverter(EventConverter):
         depth: int = 0,
     ) -> core_events.abc.Compound[core_events.abc.Event]:
         return super()._convert_event(event_to_convert, absolute_time, depth)
+
+    def _join_converted_children(
+        self, compound: core_events.abc.Compound, converted_child_list: list
+    ) -> core_events.abc.Compound:
+        c = compound.empty_copy()
+        c.extend(converted_child_list)
+        return c
+
+    def _only_converts_chronon(self) -> bool:
+        cls = type(self)
+        return all(
+            getattr(cls, name) is getattr(SymmetricalEventConverter, name)
+            for name in self._walk_method_name_tuple
+        )
+
+    def _stream_event(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+        sort_by_time: bool = False,
+    ) -> typing.Iterator[core_events.Chronon]:
+        """Streaming version of :func:`_convert_event`.
+
+        Yields each converted chronon as soon as it has been converted,
+        instead of building the converted event.
+        """
+        for t, d, chronon in self._get_chronon_iterator(sort_by_time)(
+            event_to_convert, absolute_time, depth
+        ):
+            yield self._convert_chronon_with_depth(chronon, t, d)
+
+    def convert(self, event_to_convert: core_events.abc.Event) -> core_events.abc.Event:
+        """Convert event and all its children.
+
+        :param event_to_convert: The event which shall be converted.
+        :type event_to_convert: core_events.abc.Event
+        """
+        return self._convert_event(event_to_convert, 0)
+
+    async def aconvert(
+        self, event_to_convert: core_events.abc.Event, *args, **kwargs
+    ) -> core_events.abc.Event:
+        """Asynchronous version of `convert`.
+
+        If a converter only overrides :func:`_convert_chronon`, the event
+        is converted in the event loop with :func:`_aconvert_event`.
+        Otherwise `convert` runs in a separate thread (see
+        :func:`Converter.aconvert`).
+        """
+        if args or kwargs or not self._only_converts_chronon():
+            return await super().aconvert(event_to_convert, *args, **kwargs)
+        return await self._aconvert_event(event_to_convert, 0)
+
+    def stream(
+        self, event_to_convert: core_events.abc.Event, sort_by_time: bool = False
+    ) -> typing.Iterator[core_events.Chronon]:
+        """Lazily yield the converted chronons of an event.
+
+        :param event_to_convert: The event which shall be converted.
+        :type event_to_convert: core_events.abc.Event
+        :param sort_by_time: If ``True`` the chronons are yielded in the
+            order of their absolute times, otherwise in the order in
+            which they appear in the event. Default to ``False``.
+        :type sort_by_time: bool
+
+        If a converter only overrides :func:`_convert_chronon`, each
+        chronon is converted just before it's yielded (see
+        :func:`_stream_event`), so the converted event is never built.
+        Otherwise the event is converted first and then the chronons of
+        the converted event are yielded.
+        """
+        if self._only_converts_chronon():
+            yield from self._stream_event(
+                event_to_convert, 0, sort_by_time=sort_by_time
+            )
+        else:
+            for _, _, chronon in self._get_chronon_iterator(sort_by_time)(
+                self.convert(event_to_convert), 0
+            ):
+                yield chronon
+
+    async def astream(
+        self, event_to_convert: core_events.abc.Event, sort_by_time: bool = False
+    ) -> typing.AsyncIterator[core_events.Chronon]:
+        """Asynchronous version of :func:`stream`.
+
+        If a converter only overrides :func:`_convert_chronon`, this
+        wraps :func:`_astream_event`: each chronon is converted in the
+        event loop, so a slow :func:`_convert_chronon` blocks other tasks
+        while it runs. Otherwise the event is converted with
+        :func:`aconvert` first.
+        """
+        if self._only_converts_chronon():
+            async for chronon in self._astream_event(
+                event_to_convert, 0, sort_by_time=sort_by_time
+            ):
+                yield chronon
+        else:
+            for _, _, chronon in self._get_chronon_iterator(sort_by_time)(
+                await self.aconvert(event_to_convert), 0
+            ):
+                yield chronon
+
+
+def _iter_start_time_and_child(
+    consecution: core_events.Consecution,
+) -> typing.Iterator[tuple[core_parameters.abc.Duration, core_events.abc.Event]]:
+    # Start times are accumulated while walking through the consecution,
+    # so that streaming doesn't need to build the tuple of all start times
+    # first. They are summed up in the same way as 'absolute_time_tuple'.
+    t = core_parameters.DirectDuration(0)
+    for e in consecution:
+        yield t, e
+        t = t + e.duration
+
+
+def _unsupported_type_error(event_to_convert: typing.Any) -> TypeError:
+    return TypeError(
+        f"Can't convert object '{event_to_convert}' of type "
+        f"'{type(event_to_convert)}' with EventConverter."
+        " Supported types only include all inherited classes "
+        f"from '{core_events.abc.Event}'."
+    )
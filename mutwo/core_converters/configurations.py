@@ -24,3 +24,12 @@ DEFAULT_DURATION_TO_SEARCH_NAME = "duration"
 DEFAULT_DURATION_KEYWORD_NAME = "duration"
 """Default value for ``duration_keyword_name`` parameter in
 :class:`mutwo.core_converters.MutwoParameterDictToDuration`"""
+
+DEFAULT_TEMPO_CONVERTER_CACHE_MAXSIZE = 4096
+"""Default value for ``maxsize`` of the cache which is created by
+:class:`mutwo.core_converters.TempoConverter` if no ``cache`` is passed."""
+
+ASYNC_CHRONON_COUNT_PER_YIELD = 64
+"""How many chronons the asynchronous methods of
+:class:`mutwo.core_converters.abc.EventConverter` convert before they
+give other tasks of the event loop a chance to run."""
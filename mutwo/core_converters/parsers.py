@@ -85,6 +85,11 @@ class ChrononToAttribute(core_converters.abc.Converter):
             self._exception_value,
         )
 
+    async def aconvert(self, chronon_to_convert: core_events.Chronon) -> typing.Any:
+        # Fetching one attribute never blocks the event loop for long,
+        # so a separate thread would only slow us down.
+        return self.convert(chronon_to_convert)
+
 
 MutwoParameterDict: typing.TypeAlias = dict[str, typing.Any]
 
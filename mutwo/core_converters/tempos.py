@@ -19,12 +19,14 @@
 
 """
 
-import functools
+import concurrent.futures
+import itertools
 import typing
 
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
+from mutwo import core_utilities
 
 
 __all__ = ("TempoConverter", "EventToMetrizedEvent")
@@ -38,6 +40,17 @@ class TempoConverter(core_converters.abc.EventConverter):
     :param apply_converter_on_events_tempo: If set to `True` the
         converter adjusts the :attr:`tempo` attribute of each
         converted event. Default to `True`.
+    :param cache: Cache for integrals of the tempo. If ``None`` a new
+        :class:`~mutwo.core_utilities.LRUCache` with ``maxsize``
+        :const:`~mutwo.core_converters.configurations.DEFAULT_TEMPO_CONVERTER_CACHE_MAXSIZE`
+        is created. A cache can be shared by converters with equal tempos,
+        but it must not be shared by converters with different tempos.
+        The integrals of all chronons of a
+        :class:`~mutwo.core_events.Consecution` are calculated together
+        (unless all of them are cached already) and are then put into the
+        cache. So converting a chronon of a consecution counts as a hit,
+        even if its integral wasn't cached before. Default to ``None``.
+    :type cache: typing.Optional[core_utilities.LRUCache]
 
     **Example:**
 
@@ -47,38 +60,25 @@ class TempoConverter(core_converters.abc.EventConverter):
     ...     [[0, core_parameters.DirectTempo(60)], [3, 60], [3, 30], [5, 50]],
     ... )
     >>> c = core_converters.TempoConverter(tempo)
+    >>> c2 = core_converters.TempoConverter(tempo, cache=c.cache)
     """
 
-    # Define private envelope class which catches its absolute times
-    # and durations. With this we can improve the performance of the
-    # 'value_at' method and with this improvement we can have a faster
-    # converter.
-    #
-    # This is actually not safe, because the envelope is still mutable.
-    # But we trust that no one changes anything with our internal envelope
-    # and hope everything goes well.
-    class _CatchedEnvelope(core_events.Envelope):
-        @functools.cached_property
-        def _abstf_tuple_and_dur(self) -> tuple[tuple[float, ...], float]:
-            return super()._abstf_tuple_and_dur
-
-        @functools.cached_property
-        def _abst_tuple_and_dur(self) -> tuple[tuple[float, ...], float]:
-            return super()._abst_tuple_and_dur
-
     def __init__(
         self,
         tempo: core_parameters.abc.Tempo,
         apply_converter_on_events_tempo: bool = True,
+        cache: typing.Optional[core_utilities.LRUCache] = None,
     ):
         self._tempo = core_parameters.FlexTempo.from_parameter(tempo)
         self._beat_length_in_seconds_envelope = (
             TempoConverter._tempo_to_beat_length_in_seconds_envelope(self._tempo)
         )
         self._apply_converter_on_events_tempo = apply_converter_on_events_tempo
-        # Catches for better performance
-        self._start_and_end_to_tempo_converter_dict = {}
-        self._start_and_end_to_integration = {}
+        if cache is None:
+            cache = core_utilities.LRUCache(
+                core_converters.configurations.DEFAULT_TEMPO_CONVERTER_CACHE_MAXSIZE
+            )
+        self._cache = cache
 
     # ###################################################################### #
     #                          static methods                                #
@@ -87,48 +87,40 @@ class TempoConverter(core_converters.abc.EventConverter):
     @staticmethod
     def _tempo_to_beat_length_in_seconds_envelope(
         tempo: core_events.Envelope,
-    ) -> core_events.Envelope:
+    ) -> core_events.FrozenEnvelope:
         """Convert bpm / Tempo based env to beat-length-in-seconds env."""
         e = tempo
         value_list: list[float] = []
         for tp in e.parameter_tuple:
             value_list.append(tp.seconds)
 
-        return TempoConverter._CatchedEnvelope(
+        return core_events.Envelope(
             [
                 [t, v, cs]
                 for t, v, cs in zip(
                     e.absolute_time_tuple, value_list, e.curve_shape_tuple
                 )
             ]
-        )
+        ).freeze()
 
     # ###################################################################### #
     #                         private methods                                #
     # ###################################################################### #
 
-    def _start_and_end_to_tempo_converter(self, start, end):
-        key = (start.beat_count, end.beat_count)
-        try:
-            t = self._start_and_end_to_tempo_converter_dict[key]
-        except KeyError:
-            t = self._start_and_end_to_tempo_converter_dict[key] = TempoConverter(
-                self._tempo.copy().cut_out(
-                    start,
-                    end,
-                ),
-                apply_converter_on_events_tempo=False,
-            )
-        return t
+    @staticmethod
+    def _get_key(
+        start: core_parameters.abc.Duration, end: core_parameters.abc.Duration
+    ) -> tuple[float, float]:
+        return (start.beat_count, end.beat_count)
 
     def _integrate(
         self, start: core_parameters.abc.Duration, end: core_parameters.abc.Duration
     ):
-        key = (start.beat_count, end.beat_count)
+        key = self._get_key(start, end)
         try:
-            i = self._start_and_end_to_integration[key]
+            i = self._cache[key]
         except KeyError:
-            i = self._start_and_end_to_integration[
+            i = self._cache[
                 key
             ] = self._beat_length_in_seconds_envelope.integrate_interval(start, end)
         return i
@@ -139,36 +131,134 @@ class TempoConverter(core_converters.abc.EventConverter):
         absolute_time: core_parameters.abc.Duration | float | int,
         depth: int = 0,
     ) -> tuple[typing.Any, ...]:
+        # All chronons are converted here, also the chronons of a
+        # consecution (see '_convert_consecution'). Subclasses can
+        # override this method.
         chronon.duration = self._integrate(
             absolute_time, absolute_time + chronon.duration
         )
         return tuple([])
 
+    def _convert_consecution(
+        self,
+        consecution: core_events.Consecution,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+    ) -> tuple[typing.Any, ...]:
+        # Sweep line: we walk through the start times of all events and
+        # the beat-length envelope at once and carry the running integral
+        # forward. So we don't need to integrate each chronon from scratch.
+        # The sweep is skipped if the integrals of all chronons are already
+        # cached. Otherwise missing integrals are put into our cache, where
+        # '_integrate' finds them when '_convert_chronon' converts the
+        # chronons.
+        abstf = absolute_time.beat_count
+        abstf_list = [abstf + t for t in consecution.absolute_time_in_floats_tuple]
+        abstf_list.append(abstf + consecution.duration.beat_count)
+        start_list = [core_parameters.DirectDuration(t) for t in abstf_list[:-1]]
+        key_list = [
+            self._get_key(start, start + e.duration)
+            if isinstance(e, core_events.Chronon)
+            else None
+            for start, e in zip(start_list, consecution)
+        ]
+        cache = self._cache
+        if all(key is None or key in cache for key in key_list):
+            integral_iter: typing.Iterable = itertools.repeat(None)
+        else:
+            integral_iter = (
+                self._beat_length_in_seconds_envelope.integrate_consecutive_intervals(
+                    abstf_list
+                )
+            )
+        d: list[tuple[typing.Any]] = []
+        for start, e, key, integral in zip(
+            start_list, consecution, key_list, integral_iter
+        ):
+            if key is not None and integral is not None and key not in cache:
+                cache[key] = integral
+            d.extend(self._convert_event(e, start, depth + 1))
+        return tuple(d)
+
+    def _convert_tempo(
+        self,
+        tempo: core_parameters.FlexTempo,
+        start: core_parameters.abc.Duration,
+        end: core_parameters.abc.Duration,
+    ) -> core_parameters.FlexTempo:
+        # Apply converter on the tempo of an event which starts at 'start'
+        # and stops at 'end'. This is the same as applying the tempo
+        # between 'start' and 'end' on it, where the tempo at 'end' is
+        # hold afterwards. But we don't need to copy and cut our tempo.
+        tempo = tempo.destructive_copy()
+        startf, endf = start.beat_count, end.beat_count
+        abstf_list = [startf + t for t in tempo.absolute_time_in_floats_tuple]
+        abstf_list.append(startf + tempo.duration.beat_count)
+        envelope = self._beat_length_in_seconds_envelope
+        integral_tuple = envelope.integrate_consecutive_intervals(
+            [min(t, endf) for t in abstf_list]
+        )
+        value_at_end = envelope.value_at(endf)
+        for e, integral, t0, t1 in zip(
+            tempo, integral_tuple, abstf_list, abstf_list[1:]
+        ):
+            e.duration = integral + value_at_end * (max(t1, endf) - max(t0, endf))
+        return tempo
+
+    def _convert_events_tempo(
+        self,
+        event_to_convert: core_events.abc.Event,
+        absolute_time: core_parameters.abc.Duration | float | int,
+    ) -> typing.Optional[core_parameters.FlexTempo]:
+        # Returns the events tempo if it doesn't change the event,
+        # so that it can be reset after the event has been converted.
+        tempo = core_parameters.FlexTempo.from_parameter(event_to_convert.tempo)
+        if tempo.is_static and tempo.value_tuple[0] == 60:
+            return tempo
+        if self._apply_converter_on_events_tempo:
+            start = core_parameters.abc.Duration.from_any(absolute_time)
+            event_to_convert.tempo = self._convert_tempo(
+                tempo, start, start + event_to_convert.duration
+            )
+        return None
+
+    @staticmethod
+    def _reset_events_tempo(
+        event_to_convert: core_events.abc.Event, tempo: core_parameters.FlexTempo
+    ):
+        # Yes we simply override the tempo of the event which we
+        # just converted. This is because the TempoConverter copies the
+        # event at the start of the algorithm and simply mutates this
+        # copied event.
+        event_to_convert.tempo = tempo
+        event_to_convert.tempo.duration = event_to_convert.duration
+
     def _convert_event(
         self,
         event_to_convert: core_events.abc.Event,
         absolute_time: core_parameters.abc.Duration | float | int,
         depth: int = 0,
     ) -> core_events.abc.Compound[core_events.abc.Event]:
-        tempo = core_parameters.FlexTempo.from_parameter(event_to_convert.tempo)
-        is_tempo_effectless = tempo.is_static and tempo.value_tuple[0] == 60
-        if self._apply_converter_on_events_tempo and not is_tempo_effectless:
-            start, end = (
-                absolute_time,
-                absolute_time + event_to_convert.duration,
-            )
-            local_tempo_converter = self._start_and_end_to_tempo_converter(start, end)
-            event_to_convert.tempo = local_tempo_converter(tempo)
+        tempo = self._convert_events_tempo(event_to_convert, absolute_time)
         rvalue = super()._convert_event(event_to_convert, absolute_time, depth)
-        if is_tempo_effectless:
-            # Yes we simply override the tempo of the event which we
-            # just converted. This is because the TempoConverter copies the
-            # event at the start of the algorithm and simply mutates this
-            # copied event.
-            event_to_convert.tempo = tempo
-            event_to_convert.tempo.duration = event_to_convert.duration
+        if tempo is not None:
+            self._reset_events_tempo(event_to_convert, tempo)
         return rvalue
 
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def cache(self) -> core_utilities.LRUCache:
+        """The cache of the converter.
+
+        Use its ``hit_count`` and ``miss_count`` attributes to find out
+        how effective the cache is. Pass it to other converters with
+        the same tempo to share it.
+        """
+        return self._cache
+
     # ###################################################################### #
     #               public methods for interaction with the user             #
     # ###################################################################### #
@@ -202,13 +292,34 @@ class TempoConverter(core_converters.abc.EventConverter):
 
 
 class EventToMetrizedEvent(core_converters.abc.SymmetricalEventConverter):
-    """Apply tempo of event on copy of itself"""
+    """Apply tempo of event on copy of itself
+
+    :param skip_level_count: How many levels of the event are skipped
+        before tempos are applied. If ``None`` no level is skipped.
+        Default to ``None``.
+    :type skip_level_count: typing.Optional[int]
+    :param maxima_depth_count: Tempos of events which are nested deeper
+        than this are ignored. If ``None`` the tempos of all events are
+        applied. Default to ``None``.
+    :type maxima_depth_count: typing.Optional[int]
+    :param executor: Converts the children of a top-level
+        :class:`~mutwo.core_events.Concurrence` concurrently, see
+        :class:`~mutwo.core_converters.abc.EventConverter`. Metrizing is
+        pure Python code, so only a
+        :class:`concurrent.futures.ProcessPoolExecutor` can make it faster:
+        with a :class:`concurrent.futures.ThreadPoolExecutor` the children
+        are converted one after another anyway, because threads can't run
+        Python code at the same time. Default to ``None``.
+    :type executor: typing.Optional[concurrent.futures.Executor]
+    """
 
     def __init__(
         self,
         skip_level_count: typing.Optional[int] = None,
         maxima_depth_count: typing.Optional[int] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
     ):
+        super().__init__(executor)
         self._skip_level_count = skip_level_count
         self._maxima_depth_count = maxima_depth_count
 
@@ -237,6 +348,25 @@ class EventToMetrizedEvent(core_converters.abc.SymmetricalEventConverter):
             e = event_to_convert.destructive_copy()
         return super()._convert_event(e, absolute_time, depth)
 
+    def _convert_consecution(
+        self,
+        consecution: core_events.Consecution,
+        absolute_time: core_parameters.abc.Duration | float | int,
+        depth: int = 0,
+    ) -> core_events.Consecution:
+        # Metrizing an event doesn't depend on its absolute time, so the
+        # children of a top-level consecution are as independent from each
+        # other as the children of a concurrence and can be converted
+        # concurrently by our executor. Without executor we convert them
+        # like any other symmetrical converter.
+        if self._executor is None or depth > 0:
+            return super()._convert_consecution(consecution, absolute_time, depth)
+        cns: core_events.Consecution = consecution.empty_copy()
+        cns.extend(
+            self._convert_concurrence_children(consecution, absolute_time, depth)
+        )
+        return cns
+
     def convert(self, event_to_convert: core_events.abc.Event) -> core_events.abc.Event:
         """Apply tempo of event on copy of itself"""
         return self._convert_event(event_to_convert, 0, 0)
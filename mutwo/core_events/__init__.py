@@ -38,12 +38,15 @@ from . import abc
 
 from .basic import *
 from .envelopes import *
+from .columns import *
+from .indices import *
+from .codecs import *
 
-from . import basic, envelopes
+from . import basic, envelopes, columns, indices, codecs
 
 from mutwo import core_utilities
 
-__all__ = core_utilities.get_all(basic, envelopes)
+__all__ = core_utilities.get_all(basic, envelopes, columns, indices, codecs)
 
 # BBB: Before mutwo.core < 2.0.0, basic events had different
 # names. As this was the most stable, never touched part of mutwo during the
@@ -60,7 +63,7 @@ TaggedSimpleEvent = SimpleEvent = core_utilities.deprecated(
 )(Chronon)
 
 # Force flat structure
-del basic, core_utilities, envelopes
+del basic, codecs, columns, core_utilities, envelopes, indices
 
 from . import patchparameters
 
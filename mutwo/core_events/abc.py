@@ -20,7 +20,12 @@
 from __future__ import annotations
 
 import abc
-import functools
+import concurrent.futures
+import copy
+import copyreg
+import itertools
+import sys
+import threading
 import typing
 
 from mutwo import core_constants
@@ -32,6 +37,12 @@ from mutwo import core_utilities
 __all__ = ("Event", "Compound")
 
 
+# Shared children of copy-on-write copies are replaced by copies when
+# they are accessed. Those replacements (and the copies themselves) must
+# not interleave if multiple threads read the same compound.
+_cow_lock = threading.RLock()
+
+
 class Event(core_utilities.MutwoObject, abc.ABC):
     """Abstract Event-Object
 
@@ -43,6 +54,10 @@ class Event(core_utilities.MutwoObject, abc.ABC):
     :type tag: typing.Optional[str]
     """
 
+    # Empty slots allow chronons without instance dictionaries (see
+    # 'core_events.SlottedChronon').
+    __slots__ = ()
+
     # It looks tempting to drop the 'tempo' attribute of events.
     # It may look simpler (and therefore more elegant) if events are only
     # defined by one attribute: their duration. Let's remember why the
@@ -130,6 +145,15 @@ class Event(core_utilities.MutwoObject, abc.ABC):
     #     understanding of it, but by trying to be as true as possible to
     #     the original idea.
 
+    # Process wide counter which changes each time the tag of an existing
+    # event is changed. Compounds use it to know if their tag to index
+    # mapping is still valid (see 'Compound._tag_to_index'). It takes a
+    # new value from an 'itertools.count' for each change (and isn't
+    # incremented with '+= 1', which isn't atomic), so that it's safe to
+    # change tags from several threads.
+    _tag_mutation_count = 0
+    _tag_mutation_counter = itertools.count(1)
+
     def __init__(
         self,
         tempo: typing.Optional[core_parameters.abc.Tempo] = None,
@@ -138,6 +162,23 @@ class Event(core_utilities.MutwoObject, abc.ABC):
         self.tempo = tempo
         self.tag = tag
 
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __hash__(self) -> int:
+        return self.fingerprint
+
+    def __setstate__(self, state: typing.Any):
+        if type(state) is not dict:  # slots
+            self._set_slot_state(state)
+            return
+        # Pickles from before 'tag' was a property store the tag in the
+        # instance dict as 'tag' instead of '_tag'.
+        if "tag" in state:
+            state = {"_tag" if k == "tag" else k: v for k, v in state.items()}
+        self.__dict__.update(state)
+
     # ###################################################################### #
     #                        abstract properties                             #
     # ###################################################################### #
@@ -177,12 +218,71 @@ class Event(core_utilities.MutwoObject, abc.ABC):
         if t < 0:
             raise core_utilities.InvalidAbsoluteTime(t)
 
-    @functools.cached_property
+    @property
     def _event_to_metrized_event(self):
-        # Import in method to avoid circular import error
-        return __import__(
-            "mutwo.core_converters"
-        ).core_converters.EventToMetrizedEvent()
+        # The converter has no state, so one instance is shared by all
+        # events. It's stored on the class and not cached per instance,
+        # because slotted events have no '__dict__'.
+        if (converter := Event.__dict__.get("_metrized_event_converter")) is None:
+            # Import in method to avoid circular import error
+            converter = Event._metrized_event_converter = __import__(
+                "mutwo.core_converters"
+            ).core_converters.EventToMetrizedEvent()
+        return converter
+
+    @staticmethod
+    def _hash_parameter(value: typing.Any) -> int:
+        # Hash a parameter value, so that equal values get equal hashes.
+        # Parameters and lists aren't hashable by themselves.
+        match value:
+            # Test parameters first: parameters which are also events
+            # (e.g. 'FlexTempo') are compared like parameters.
+            case core_parameters.abc.SingleNumberParameter():
+                v = float(value)
+                if (n := value.digit_to_round_to_count) is not None:
+                    v = core_utilities.round_floats(v, n)
+                return hash(v)
+            case Event():
+                return value.fingerprint
+            case core_parameters.abc.SingleValueParameter():
+                return Event._hash_parameter(getattr(value, value.value_name))
+            case list() | tuple():
+                return hash(tuple(Event._hash_parameter(v) for v in value))
+            case dict():
+                return hash(
+                    frozenset(
+                        (Event._hash_parameter(k), Event._hash_parameter(v))
+                        for k, v in value.items()
+                    )
+                )
+        try:
+            return hash(value)
+        # Any unhashable object gets the same hash: equal objects still
+        # have equal hashes.
+        except TypeError:
+            return 0
+
+    def _hash_attribute(self, attribute_name: str) -> int:
+        # Don't set the default tempo (see 'reset_tempo') only to hash it.
+        if attribute_name == "tempo" and self._tempo is None:
+            return self._hash_parameter(core_parameters.DirectTempo(60))
+        return self._hash_parameter(getattr(self, attribute_name))
+
+    def _is_shareable(self) -> bool:
+        """Test if a copy-on-write copy can share the event.
+
+        This is the case if nothing outside of the compound which contains
+        the event can refer to the event or its content. Each compound
+        tracks this explicitly (see ``Compound._is_lent``): the parent of
+        the event tests itself if it handed out the event. This is used by
+        copy-on-write copies (see :meth:`Compound.copy`) to find out which
+        children can be shared.
+        """
+        return False
+
+    @abc.abstractmethod
+    def _get_fingerprint(self) -> int:
+        ...
 
     @abc.abstractmethod
     def _set_parameter(
@@ -218,6 +318,45 @@ class Event(core_utilities.MutwoObject, abc.ABC):
     def tempo(self, tempo: typing.Optional[core_parameters.abc.Tempo]):
         self._tempo = core_parameters.abc.Tempo.from_any(tempo) if tempo else None
 
+    @property
+    def fingerprint(self) -> int:
+        """Hash of the parameters and children of an event.
+
+        Equal events always have equal fingerprints, so fingerprints can
+        be used to quickly find events which may be equal. The fingerprint
+        of each :class:`~mutwo.core_events.Chronon` is cached until one of
+        its parameters is set again or its duration changes. Other changes
+        of parameters in place (e.g. ``chronon.pitch.append(1)``) aren't
+        noticed, use :meth:`mutate_parameter` or assign the
+        parameter again instead. Equality tests (``==``) don't depend on
+        cached fingerprints.
+
+        Events are hashed by their fingerprint, so they can be used as
+        keys in dictionaries or as items of sets. Don't change an event
+        while it's used as a key.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> chn0, chn1 = core_events.Chronon(1), core_events.Chronon(1)
+        >>> chn0.fingerprint == chn1.fingerprint
+        True
+        >>> {chn0: 'a'}[chn1]
+        'a'
+        """
+        return self._get_fingerprint()
+
+    @property
+    def tag(self) -> typing.Optional[str]:
+        """The name of an event."""
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: typing.Optional[str]):
+        if hasattr(self, "_tag"):  # in-place change
+            Event._tag_mutation_count = next(Event._tag_mutation_counter)
+        self._tag = tag
+
     # ###################################################################### #
     #                           public methods                               #
     # ###################################################################### #
@@ -521,23 +660,31 @@ class Event(core_utilities.MutwoObject, abc.ABC):
         if not absolute_time:
             raise core_utilities.NoSplitTimeError()
 
-        abst_list = list(
-            sorted([core_parameters.abc.Duration.from_any(t) for t in absolute_time])
+        abstf_list = sorted(
+            core_parameters.abc.Duration.from_any(t).beat_count for t in absolute_time
         )
         # Already sorted => check if smallest t < 0
-        self._assert_valid_absolute_time(abst_list[0])
-        if 0 not in abst_list:
-            abst_list.insert(0, core_parameters.DirectDuration(0))
-
-        if (dur := self.duration) > abst_list[-1]:
-            abst_list.append(dur)
-        elif dur < abst_list[-1] and not ignore_invalid_split_point:
-            raise core_utilities.SplitError(abst_list[-1])
-
+        self._assert_valid_absolute_time(abstf_list[0])
+        if 0 not in abstf_list:
+            abstf_list.insert(0, 0.0)
+
+        if (durf := self.duration.beat_count) > abstf_list[-1]:
+            abstf_list.append(durf)
+        elif durf < abstf_list[-1]:
+            if not ignore_invalid_split_point:
+                raise core_utilities.SplitError(abstf_list[-1])
+            # Segments after our duration can't be cut out anyway:
+            # skip them before we copy ourselves for each segment.
+            abstf_list = [t for t in abstf_list if t < durf] + [durf]
+
+        t_pair_list = list(zip(abstf_list, abstf_list[1:]))
         split_event_list = []
-        for t0, t1 in zip(abst_list, abst_list[1:]):
+        # Each segment needs its own deep copy: the segments are
+        # independent events, which can be changed without changing the
+        # other segments (or us). But we only serialise ourselves once.
+        for e, (t0, t1) in zip(self._copy_n(len(t_pair_list)), t_pair_list):
             try:
-                split_event_list.append(self.copy().cut_out(t0, t1))
+                split_event_list.append(e.cut_out(t0, t1))
             except (
                 core_utilities.InvalidStartAndEndValueError,
                 core_utilities.InvalidCutOutStartAndEndValuesError,
@@ -559,6 +706,35 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
 
     _short_name_length = 4
 
+    # Children which are shared with other compounds due to a copy-on-write
+    # copy (see 'core_events.configurations.COPY_ON_WRITE'). The dict maps
+    # the id of a shared child to a list with the child and how often it
+    # appears in the compound. Keeping the child itself makes sure that
+    # its id can't be reused by another object. Each compound has its own
+    # dict: a child is removed from it as soon as the compound doesn't
+    # contain the shared child anymore.
+    _cow_dict: typing.Optional[dict[int, list]] = None
+
+    # Chronons which are shared by 'deduplicate'. The dict maps the id of
+    # an interned chronon to the chronon. Unlike shared children of
+    # copy-on-write copies, they are only copied before the compound
+    # changes them in place (see '_copy_interned_chronons').
+    _interned_dict: typing.Optional[dict[int, T]] = None
+
+    # 'True' as soon as the compound handed out its children (e.g. via
+    # indexing, iteration or slicing), because then they may be referred
+    # to from elsewhere. Children which weren't handed out only belong to
+    # the compound, so copy-on-write copies can share them (see
+    # '_is_shareable'). Events which are added to a compound belong to it,
+    # too: they aren't tracked.
+    _is_lent: bool = False
+
+    # Maps the tag of each child to its index, so that children can be
+    # found by their tag without searching (see '_tag_to_index'). It's
+    # stored together with the value of 'Event._tag_mutation_count' at the
+    # time it was created and is 'None' if it needs to be rebuilt.
+    _tag_index: typing.Optional[tuple[int, dict[str, int]]] = None
+
     def __init__(
         self,
         iterable: typing.Iterable[T] = [],
@@ -602,13 +778,59 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
     def __add__(self, event: list[T]) -> Compound[T]:
         e = self.empty_copy()
         e.extend(super().__add__(event))
+        e._inherit_cow_dict(self, event)
+        # Both compounds contain the same children.
+        self._is_lent = e._is_lent = True
         return e
 
     def __mul__(self, factor: int) -> Compound[T]:
         e = self.empty_copy()
         e.extend(super().__mul__(factor))
+        e._inherit_cow_dict(self)
+        self._is_lent = e._is_lent = True
         return e
 
+    def __iter__(self) -> typing.Iterator[T]:
+        self._is_lent = True
+        if self._cow_dict:
+            return self._cow_iter()
+        return super().__iter__()
+
+    def __reversed__(self) -> typing.Iterator[T]:
+        self._is_lent = True
+        if self._cow_dict:
+            return (self._cow_get(i) for i in reversed(range(len(self))))
+        return super().__reversed__()
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = self.__dict__.copy()
+        state.pop("_cow_dict", None)
+        state.pop("_interned_dict", None)
+        state.pop("_is_lent", None)
+        state.pop("_tag_index", None)
+        return state
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex):
+        if protocol < 2 or type(self).__reduce__ is not object.__reduce__:
+            return super().__reduce_ex__(protocol)
+        # Same as the default reduction, but pickling doesn't hand out
+        # our children, so we don't use our own iterator (see
+        # '_is_lent'). Shared children are pickled as they are: after
+        # unpickling they aren't shared with other compounds anymore.
+        state = self.__getstate__()
+        # But an interned chronon is still one object after unpickling,
+        # so it needs to stay interned.
+        if interned_dict := self._interned_dict:
+            state = dict(state or {})
+            state["_interned_chronon_tuple"] = tuple(interned_dict.values())
+        return copyreg.__newobj__, (type(self),), state, super().__iter__(), None
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        interned_chronon_tuple = state.pop("_interned_chronon_tuple", None)
+        super().__setstate__(state)
+        if interned_chronon_tuple:
+            self._interned_dict = {id(e): e for e in interned_chronon_tuple}
+
     @typing.overload
     def __getitem__(self, index_or_slice_or_tag: int) -> T:
         ...
@@ -624,6 +846,9 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
     def __getitem__(
         self, index_or_slice_or_tag: int | slice | str
     ) -> T | Compound[T]:
+        # Test this before reading children: another thread may copy a
+        # shared child in the meantime (see '_cow_get').
+        is_shared = bool(self._cow_dict)
         try:
             event = super().__getitem__(index_or_slice_or_tag)
         except TypeError as error:
@@ -632,10 +857,20 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
             # It can't be a tag, therefore simply raise
             # original exception.
             raise error
+        self._is_lent = True
         if isinstance(index_or_slice_or_tag, slice):
             empty_event = self.empty_copy()
-            empty_event.extend(event)
+            empty_event._is_lent = True
+            if is_shared:
+                with _cow_lock:
+                    empty_event.extend(list.__getitem__(self, index_or_slice_or_tag))
+                    empty_event._inherit_cow_dict(self)
+            else:
+                empty_event.extend(event)
+                empty_event._inherit_cow_dict(self)
             return empty_event
+        elif is_shared:
+            return self._cow_get(index_or_slice_or_tag)
         else:
             return event
 
@@ -655,6 +890,8 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
         self, index_or_slice_or_tag: int | slice | str, event: core_events.abc.Event
     ):
         try:
+            if self._cow_dict:
+                replaced = list.__getitem__(self, index_or_slice_or_tag)
             super().__setitem__(index_or_slice_or_tag, event)
         except TypeError as error:
             if isinstance(index_or_slice_or_tag, str):
@@ -664,6 +901,13 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
             # It can't be a tag, therefore simply raise
             # original exception.
             raise error
+        if isinstance(index_or_slice_or_tag, slice):
+            # Slice assignments don't iterate compounds, so shared children
+            # of 'event' may be added.
+            self._inherit_cow_dict(self, event)
+        elif self._cow_dict:
+            self._cow_discard(replaced)
+        self._tag_index = None
 
     # We write custom __delitem__ to support deletion via tag.
     @typing.overload
@@ -680,6 +924,8 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
 
     def __delitem__(self, index_or_slice_or_tag: int | slice | str):
         try:
+            if self._cow_dict:
+                deleted = list.__getitem__(self, index_or_slice_or_tag)
             super().__delitem__(index_or_slice_or_tag)
         except TypeError as error:
             if isinstance(index_or_slice_or_tag, str):
@@ -687,6 +933,73 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
             # It can't be a tag, therefore simply raise
             # original exception.
             raise error
+        if self._cow_dict:
+            if isinstance(index_or_slice_or_tag, slice):
+                self._inherit_cow_dict(self)
+            else:
+                self._cow_discard(deleted)
+        self._tag_index = None
+
+    # All list methods which mutate a compound in place keep the tag index
+    # up to date: adding children at the end only adds new tags, all other
+    # changes can move children, so the index is rebuilt the next time
+    # it's needed.
+
+    def __iadd__(self, event: typing.Iterable[T]) -> Compound[T]:
+        index = len(self)
+        r = super().__iadd__(event)
+        self._update_tag_index(index)
+        return r
+
+    def __imul__(self, factor: int) -> Compound[T]:
+        r = super().__imul__(factor)
+        if self._cow_dict:
+            self._inherit_cow_dict(self)
+        self._tag_index = None
+        return r
+
+    def append(self, event: T):
+        super().append(event)
+        self._update_tag_index(len(self) - 1)
+
+    def extend(self, event: typing.Iterable[T]):
+        index = len(self)
+        super().extend(event)
+        self._update_tag_index(index)
+
+    def insert(self, index: int, event: T):
+        super().insert(index, event)
+        self._tag_index = None
+
+    def pop(self, index: int = -1) -> T:
+        e = super().pop(index)
+        self._tag_index = None
+        # The child may appear more than once in the compound.
+        self._is_lent = True
+        if self._cow_dict and id(e) in self._cow_dict:
+            with _cow_lock:
+                self._cow_discard(e)
+                e = self._cow_copy_child(e)
+        return e
+
+    def remove(self, event: T):
+        super().remove(event)
+        if self._cow_dict:
+            self._inherit_cow_dict(self)
+        self._tag_index = None
+
+    def clear(self):
+        super().clear()
+        self._cow_dict = self._interned_dict = None
+        self._tag_index = None
+
+    def reverse(self):
+        super().reverse()
+        self._tag_index = None
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._tag_index = None
 
     def __eq__(self, other: typing.Any) -> bool:
         """Test for checking if two objects are equal."""
@@ -704,11 +1017,13 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
     def __ne__(self, other: typing.Any):
         return not self.__eq__(other)
 
+    __hash__ = Event.__hash__
+
     def __repr_content__(self):
         return list.__repr__(self)
 
     def __str_content__(self):
-        return ", ".join([str(e) for e in self])
+        return ", ".join([str(e) for e in self._read_only_iter()])
 
     # ###################################################################### #
     #                           properties                                   #
@@ -745,10 +1060,216 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
         # Find index of an event by its tag.
         # param tag: The `tag` of the event which shall be found.
         # type tag: str
-        for i, e in enumerate(self):
-            if tag == e.tag:
-                return i
-        raise KeyError(f"No event found with tag = '{tag}'.")
+        try:
+            return self._get_tag_dict()[tag]
+        except KeyError:
+            raise KeyError(f"No event found with tag = '{tag}'.")
+
+    def _get_tag_dict(self) -> dict[str, int]:
+        # Return mapping of tags to the index of the first child with
+        # this tag. The mapping is rebuilt if our children were moved
+        # or if the tag of any event changed.
+        tag_index = self._tag_index
+        if tag_index is None or tag_index[0] != Event._tag_mutation_count:
+            tag_dict: dict[str, int] = {}
+            for i, e in enumerate(self._read_only_iter()):
+                if (tag := e.tag) is not None and tag not in tag_dict:
+                    tag_dict[tag] = i
+            self._tag_index = tag_index = (Event._tag_mutation_count, tag_dict)
+        return tag_index[1]
+
+    def _update_tag_index(self, index: int):
+        # Add tags of children which were appended at 'index'.
+        tag_index = self._tag_index
+        if tag_index is None or tag_index[0] != Event._tag_mutation_count:
+            return
+        tag_dict = tag_index[1]
+        for i in range(index, len(self)):
+            e = list.__getitem__(self, i)
+            if (tag := e.tag) is not None and tag not in tag_dict:
+                tag_dict[tag] = i
+
+    def _get_fingerprint(self) -> int:
+        # A compound can't notice if its children change, so its
+        # fingerprint is always built again from the (cached) fingerprints
+        # of its children.
+        return hash(
+            (
+                tuple(
+                    self._hash_attribute(attribute_name)
+                    for attribute_name in sorted(
+                        set(self._class_specific_side_attribute_tuple)
+                    )
+                ),
+                tuple(e.fingerprint for e in self._read_only_iter()),
+            )
+        )
+
+    @staticmethod
+    def _get_freed_byte_count(
+        event: core_events.Chronon, shared_event: core_events.Chronon
+    ) -> int:
+        # Estimate how many bytes are freed if 'event' is replaced
+        # by 'shared_event'.
+        def get_byte_count(o: typing.Any) -> int:
+            byte_count = sys.getsizeof(o)
+            if (attribute_dict := getattr(o, "__dict__", None)) is not None:
+                byte_count += sys.getsizeof(attribute_dict)
+            return byte_count
+
+        shared_attribute_dict = shared_event._get_attribute_dict()
+        return get_byte_count(event) + sum(
+            get_byte_count(value)
+            for name, value in event._get_attribute_dict().items()
+            if shared_attribute_dict.get(name) is not value
+        )
+
+    def _dumps(self) -> bytes:
+        # Faster and more compact than pickle for event trees.
+        return core_events.dumps(self)
+
+    @staticmethod
+    def _loads(data: bytes) -> Compound:
+        return core_events.loads(data)
+
+    def _read_only_iter(self) -> typing.Iterator[T]:
+        """Iterate over children without copying shared children.
+
+        Only use this if the children are neither mutated nor returned,
+        otherwise the copy-on-write mode breaks.
+        """
+        if self._cow_dict:
+            return super().__iter__()
+        return iter(self)
+
+    def _is_shareable(self) -> bool:
+        if self._is_lent:
+            return False
+        # Our own shared children are never handed out and interned
+        # chronons are never changed, so only the other children need to
+        # be tested.
+        cow_dict = self._cow_dict or {}
+        interned_dict = self._interned_dict or {}
+        return all(
+            (e_id := id(e)) in cow_dict or e_id in interned_dict or e._is_shareable()
+            for e in list.__iter__(self)
+        )
+
+    def _cow_copy(self) -> Compound[T]:
+        """Make a copy which shares its children with the present compound."""
+        # Copies of multiple threads mustn't interleave with copying our
+        # shared children on access (see '_cow_get').
+        with _cow_lock:
+            e = type(self).__new__(type(self))
+            for name, value in self.__getstate__().items():
+                if isinstance(value, core_utilities.MutwoObject):
+                    value = value.copy()
+                else:
+                    value = copy.deepcopy(value)
+                e.__dict__[name] = value
+            shared_dict = self._cow_dict or {}
+            interned_dict = self._interned_dict or {}
+            cow_dict: dict[int, list] = {}
+            copy_dict: dict[int, T] = {}
+            is_lent = self._is_lent
+            for c in super().__iter__():
+                # Interned chronons are already protected (see
+                # 'deduplicate').
+                if (c_id := id(c)) in interned_dict:
+                    list.append(e, c)
+                    continue
+                # Children which we handed out (e.g. to a variable which
+                # was assigned before the copy was made) can't be shared:
+                # changing them would also change the copy.
+                if c_id in shared_dict or (not is_lent and c._is_shareable()):
+                    if entry := cow_dict.get(c_id):
+                        entry[1] += 1
+                    else:
+                        cow_dict[c_id] = [c, 1]
+                elif (c_copy := copy_dict.get(c_id)) is None:
+                    c = copy_dict[c_id] = self._cow_copy_child(c)
+                else:
+                    c = c_copy
+                list.append(e, c)
+            # From now on both compounds need to copy a shared child
+            # before it can be changed.
+            self._cow_dict = cow_dict
+            e._cow_dict = {c_id: entry.copy() for c_id, entry in cow_dict.items()}
+            if interned_dict:
+                e._interned_dict = dict(interned_dict)
+            return e
+
+    def _cow_copy_child(self, event: T) -> T:
+        if isinstance(event, Compound):
+            return event._cow_copy()
+        return event.copy()
+
+    def _copy_interned_chronons(self):
+        """Replace each interned chronon of the compound by a copy.
+
+        Call this before the compound changes its chronons in place, so
+        that other places where the chronons are used don't change.
+        """
+        if interned_dict := self._interned_dict:
+            for i, e in enumerate(list.__iter__(self)):
+                if id(e) in interned_dict:
+                    list.__setitem__(self, i, e.copy())
+            self._interned_dict = None
+
+    def _cow_discard(self, event: T):
+        """Forget one appearance of a shared child in the compound."""
+        if entry := self._cow_dict.get(event_id := id(event)):
+            entry[1] -= 1
+            if not entry[1]:
+                del self._cow_dict[event_id]
+
+    def _cow_get(self, index: int) -> T:
+        """Get child at index and copy it before if it's shared."""
+        # Each copy of a shared child replaces the child before it's
+        # forgotten: if we don't have any shared children anymore, the
+        # child at the index can't be replaced by another thread.
+        if not self._cow_dict:
+            return list.__getitem__(self, index)
+        with _cow_lock:
+            e = list.__getitem__(self, index)
+            if self._cow_dict and id(e) in self._cow_dict:
+                list.__setitem__(self, index, e_copy := self._cow_copy_child(e))
+                self._cow_discard(e)
+                e = e_copy
+        return e
+
+    def _cow_iter(self) -> typing.Iterator[T]:
+        i = 0
+        while i < len(self):
+            yield self._cow_get(i)
+            i += 1
+
+    def _inherit_cow_dict(self, *event: typing.Any):
+        """Mark children as shared if they are shared in any given event.
+
+        This is needed if children are moved from one compound to
+        another one without iterating them (e.g. by slicing). The
+        present compound may be one of the given events. Both children
+        shared by copy-on-write and interned chronons are inherited.
+        """
+        shared_dict, all_interned_dict = {}, {}
+        for e in event:
+            if getattr(e, "_cow_dict", None):
+                shared_dict.update(e._cow_dict)
+            if getattr(e, "_interned_dict", None):
+                all_interned_dict.update(e._interned_dict)
+        cow_dict: dict[int, list] = {}
+        interned_dict: dict[int, T] = {}
+        if shared_dict or all_interned_dict:
+            for c in list.__iter__(self):
+                if entry := cow_dict.get(c_id := id(c)):
+                    entry[1] += 1
+                elif c_id in shared_dict:
+                    cow_dict[c_id] = [c, 1]
+                elif c_id in all_interned_dict:
+                    interned_dict[c_id] = c
+        self._cow_dict = cow_dict or None
+        self._interned_dict = interned_dict or None
 
     def _assert_start_in_range(
         self, start: core_parameters.abc.Duration | core_constants.Real
@@ -763,6 +1284,7 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
     def _apply_once_per_event(
         self, method_name: str, *args, id_set: set[int], **kwargs
     ) -> Compound[T]:
+        self._copy_interned_chronons()
         for e in self:
             if (e_id := id(e)) not in id_set:
                 id_set.add(e_id)
@@ -845,11 +1367,111 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
     #                           public methods                               #
     # ###################################################################### #
 
+    def copy(self) -> Compound[T]:
+        if core_events.configurations.COPY_ON_WRITE:
+            return self._cow_copy()
+        return super().copy()
+
+    def _copy_n(self, n: int) -> list[Compound[T]]:
+        if core_events.configurations.COPY_ON_WRITE:
+            return [self._cow_copy() for _ in range(n)]
+        return super()._copy_n(n)
+
     def destructive_copy(self) -> Compound[T]:
         empty_copy = self.empty_copy()
-        empty_copy.extend([event.destructive_copy() for event in self])
+        empty_copy.extend(
+            [event.destructive_copy() for event in self._read_only_iter()]
+        )
         return empty_copy
 
+    def deduplicate(self, pool: typing.Optional[dict[int, list]] = None) -> int:
+        """Replace equal chronons by one shared chronon.
+
+        :param pool: The chronons which were already found. Pass the same
+            (initially empty) dictionary to multiple calls in order to
+            share chronons between different compounds. If ``None`` a new
+            pool is used. Default to ``None``.
+        :type pool: typing.Optional[dict[int, list]]
+        :return: Estimated number of bytes which are freed: the size of
+            each removed chronon, its attribute dictionary and those of its
+            parameters which aren't used by the shared chronon.
+
+        Generated scores often repeat the same chronon many times. After
+        deduplication all chronons of the same type with equal parameters
+        are the same object. Reading them (e.g. via indexing, iteration or
+        :meth:`get_parameter`) returns this shared chronon, so it must not
+        be changed directly. Methods of compounds which change their
+        chronons in place (e.g. :meth:`set_parameter`,
+        :meth:`mutate_parameter`, :meth:`tie_by` or ``cut_out``) work as
+        usual: they first replace the shared chronons of the compound by
+        copies, so the other places where a chronon is used don't change.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> cns = core_events.Consecution([core_events.Chronon(1) for _ in range(3)])
+        >>> cns.deduplicate() > 0
+        True
+        >>> cns[0] is cns[2]
+        True
+        >>> cns = cns.squash_in(0, core_events.Chronon(0.5))
+        >>> [float(d) for d in cns.get_parameter('duration')]
+        [0.5, 0.5, 1.0, 1.0]
+        """
+        if pool is None:
+            pool = {}
+        # Each pool entry is a list with a chronon, the compounds which
+        # contain this chronon and if the chronon is already shared.
+        shared_dict: dict[int, tuple[Compound, dict[int, Event]]] = {}
+
+        def share(compound: Compound, chronon: Event):
+            shared_dict.setdefault(id(compound), (compound, {}))[1][
+                id(chronon)
+            ] = chronon
+
+        byte_count = 0
+        compound_list: list[Compound] = [self]
+        while compound_list:
+            compound = compound_list.pop()
+            cow_dict = compound._cow_dict or {}
+            # Read our children directly: we don't want to copy them.
+            for i, e in enumerate(list.__iter__(compound)):
+                # Children of copy-on-write copies are still used by other
+                # compounds, which we mustn't change.
+                if id(e) in cow_dict:
+                    e = compound._cow_get(i)
+                if isinstance(e, Compound):
+                    compound_list.append(e)
+                    continue
+                # Don't cache fingerprints: this would need more memory
+                # for each chronon which is kept.
+                entry_list = pool.setdefault(e._compute_fingerprint(), [])
+                for entry in entry_list:
+                    chronon, compound_dict, is_shared = entry
+                    if chronon is e:
+                        break
+                    if type(chronon) is type(e) and chronon == e:
+                        list.__setitem__(compound, i, chronon)
+                        byte_count += self._get_freed_byte_count(e, chronon)
+                        if not is_shared:
+                            for c in compound_dict.values():
+                                share(c, chronon)
+                            entry[2] = True
+                        break
+                else:
+                    entry_list.append(entry := [e, {}, False])
+                entry[1][id(compound)] = compound
+                if entry[2]:
+                    share(compound, entry[0])
+        for compound, chronon_dict in shared_dict.values():
+            # Forget chronons which were interned by previous calls, but
+            # which aren't used by the compound anymore.
+            chronon_dict.update(compound._interned_dict or {})
+            compound._interned_dict = {
+                id(e): e for e in list.__iter__(compound) if id(e) in chronon_dict
+            }
+        return byte_count
+
     def empty_copy(self) -> Compound[T]:
         """Make a copy of the `Compound` without any child events.
 
@@ -976,6 +1598,7 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
         # Nothing to tie if no child events exist
         if not self:
             return self
+        self._copy_interned_chronons()
 
         def tie_by_if_available(e: Event):
             if hasattr(e, "tie_by"):
@@ -1013,8 +1636,29 @@ class Compound(Event, abc.ABC, list[T], typing.Generic[T]):
 
         return self
 
-    def metrize(self) -> Compound:
-        metrized_event = self._event_to_metrized_event(self)
+    def metrize(self, workers: typing.Optional[int] = None) -> Compound:
+        """Apply tempo of event on itself
+
+        :param workers: If set, the children of the event are metrized
+            concurrently by a :class:`concurrent.futures.ProcessPoolExecutor`
+            with this many processes. Each child is pickled to and from
+            its process, so this only pays off if metrizing the children
+            takes longer than copying them: for instance for long events
+            with many nested tempos and a machine with several cores. For
+            small events it is slower than metrizing them in the current
+            process. If ``None`` the event is metrized in the current
+            process. Default to ``None``.
+        :type workers: typing.Optional[int]
+
+        See :meth:`Event.metrize` for more information.
+        """
+        if workers is None:
+            metrized_event = self._event_to_metrized_event(self)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                metrized_event = __import__(
+                    "mutwo.core_converters"
+                ).core_converters.EventToMetrizedEvent(executor=executor)(self)
         self.tempo = metrized_event.tempo
         self[:] = metrized_event[:]
         return self
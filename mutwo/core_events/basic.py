@@ -36,31 +36,48 @@ from mutwo import core_parameters
 from mutwo import core_utilities
 
 
-__all__ = ("Chronon", "Consecution", "Concurrence")
+__all__ = ("Chronon", "SlottedChronon", "Consecution", "Concurrence")
 
 
-class Chronon(core_events.abc.Event):
-    """A :class:`Chronon` is an event that cannot be further subdivided (a leaf of a tree).
+# Time calculations inside hot loops are done with floats: creating
+# duration objects for each intermediate result is much slower.
 
-    :param duration: The duration of the ``Chronon``. Mutwo converts
-        the incoming object to a :class:`mutwo.core_parameters.abc.Duration` object
-        with the global `core_parameters.abc.Duration.from_any`
-        callable.
-    :param *args: Arguments parsed to :class:`mutwo.core_events.abc.Event`.
-    :param **kwargs: Keyword arguments parsed to :class:`mutwo.core_events.abc.Event`.
 
-    **Example:**
+def _to_floats(*duration: core_parameters.abc.Duration.Type) -> tuple[float, ...]:
+    # Most times are already floats (e.g. the split times of 'split_at'):
+    # they are rounded like 'DirectDuration' does, without creating one.
+    return tuple(
+        _round(float(d))
+        if type(d) is float or type(d) is int
+        else core_parameters.abc.Duration.from_any(d).beat_count
+        for d in duration
+    )
 
-    >>> from mutwo import core_events
-    >>> chronon = core_events.Chronon(2)
-    >>> chronon
-    Chronon(duration=DirectDuration(2.0))
-    >>> print(chronon)  # pretty print for debugging
-    C(dur=D(2.0))
+
+def _round(durf: float) -> float:
+    return round(durf, core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS)
+
+
+# Marks attributes which are declared in '__slots__', but not set yet.
+_unset = object()
+
+
+class _Chronon(core_events.abc.Event):
+    """Base class of :class:`Chronon` and :class:`SlottedChronon`.
+
+    It doesn't define where attributes are stored: :class:`Chronon` has an
+    instance dictionary and :class:`SlottedChronon` has slots.
     """
 
+    __slots__ = ()
+
     parameter_to_exclude_from_representation_tuple = ("tempo", "tag")
 
+    # Cached fingerprints start with this object. It's copied when a
+    # chronon is pickled, so that fingerprints aren't used in other
+    # processes (where strings may have different hashes).
+    _fingerprint_token = object()
+
     def __init__(self, duration: core_parameters.abc.Duration.Type, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.duration = duration
@@ -82,6 +99,8 @@ class Chronon(core_events.abc.Event):
             self, other, tuple(parameter_to_compare_set)
         )
 
+    __hash__ = core_events.abc.Event.__hash__
+
     def __repr_content__(self) -> str:
         return ", ".join([f"{attr}={repr(v)}" for attr, v in self._print_data.items()])
 
@@ -118,8 +137,94 @@ class Chronon(core_events.abc.Event):
     ) -> Chronon:
         if (p := self.get_parameter(parameter_name)) is not None:
             function(p)
+            try:
+                del self._fingerprint_cache
+            except AttributeError:
+                pass
         return self
 
+    @staticmethod
+    @functools.cache
+    def _get_slot_tuple(cls: typing.Type[_Chronon]) -> tuple[str, ...]:
+        """Names of all slots of a chronon class which hold attributes."""
+        slot_list = []
+        for c in reversed(cls.__mro__):
+            slot_tuple = c.__dict__.get("__slots__", ())
+            for slot in (slot_tuple,) if isinstance(slot_tuple, str) else slot_tuple:
+                if slot not in ("__dict__", "__weakref__", "_fingerprint_cache"):
+                    slot_list.append(slot)
+        return tuple(slot_list)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_shared_name_tuple(name_tuple: tuple[str, ...]) -> tuple[str, ...]:
+        # Chronons with the same attribute names share one tuple of names
+        # in their cached fingerprints. Only recently used tuples are kept.
+        return name_tuple
+
+    def _get_attribute_dict(self) -> dict[str, typing.Any]:
+        """Return all attributes of the chronon (like :func:`vars`)."""
+        attribute_dict = {}
+        for name in _Chronon._get_slot_tuple(type(self)):
+            try:
+                attribute_dict[name] = object.__getattribute__(self, name)
+            except AttributeError:  # unset slot
+                pass
+        if (instance_dict := getattr(self, "__dict__", None)) is not None:
+            attribute_dict.update(instance_dict)
+            attribute_dict.pop("_fingerprint_cache", None)
+        return attribute_dict
+
+    def _get_cached_fingerprint(self) -> typing.Optional[int]:
+        try:
+            (
+                token,
+                durf,
+                name_tuple,
+                value_tuple,
+                fingerprint,
+            ) = self._fingerprint_cache
+        except AttributeError:
+            return None
+        # The fingerprint is valid as long as no attribute was set again
+        # and our duration wasn't changed in place. Compare attributes by
+        # identity: this is fast and works with any parameter.
+        attribute_dict = self._get_attribute_dict()
+        if (
+            token is _Chronon._fingerprint_token
+            and durf == self.duration.beat_count
+            and name_tuple == tuple(attribute_dict)
+            and all(v0 is v1 for v0, v1 in zip(value_tuple, attribute_dict.values()))
+        ):
+            return fingerprint
+        return None
+
+    def _is_shareable(self) -> bool:
+        # Only our parent can hand us out.
+        return True
+
+    def _compute_fingerprint(self) -> int:
+        return hash(
+            tuple(
+                (name, self._hash_attribute(name))
+                for name in sorted(self._parameter_to_compare_tuple)
+            )
+        )
+
+    def _get_fingerprint(self) -> int:
+        if (fingerprint := self._get_cached_fingerprint()) is None:
+            fingerprint = self._compute_fingerprint()
+            attribute_dict = self._get_attribute_dict()
+            name_tuple = tuple(attribute_dict)
+            self._fingerprint_cache = (
+                _Chronon._fingerprint_token,
+                self.duration.beat_count,
+                _Chronon._get_shared_name_tuple(name_tuple),
+                tuple(attribute_dict.values()),
+                fingerprint,
+            )
+        return fingerprint
+
     # ###################################################################### #
     #                           properties                                   #
     # ###################################################################### #
@@ -156,9 +261,12 @@ class Chronon(core_events.abc.Event):
             # no private attributes
             if attribute[0] != "_"
             # no redundant comparisons
-            and attribute not in ("parameter_to_exclude_from_representation_tuple",)
+            and attribute
+            not in ("parameter_to_exclude_from_representation_tuple", "fingerprint")
+            # no declared, but unset slots
+            and (value := getattr(self, attribute, _unset)) is not _unset
             # no methods
-            and not isinstance(getattr(self, attribute), types.MethodType)
+            and not isinstance(value, types.MethodType)
         )
 
     @property
@@ -242,25 +350,25 @@ class Chronon(core_events.abc.Event):
         start: core_parameters.abc.Duration.Type,
         end: core_parameters.abc.Duration.Type,
     ) -> Chronon:
-        start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
+        start, end = _to_floats(start, end)
         self._assert_valid_absolute_time(start)
         self._assert_correct_start_and_end_values(
             start, end, condition=lambda start, end: start < end
         )
 
-        dur = self.duration
-        diff: core_parameters.DirectDuration = core_parameters.DirectDuration(0)
+        durf = self.duration.beat_count
+        diff = 0.0
 
         if start > 0:
             diff += start
-        if end < dur:
-            diff += dur - end
-        if diff >= dur:
+        if end < durf:
+            diff += durf - end
+        if _round(diff) >= durf:
             raise core_utilities.InvalidCutOutStartAndEndValuesError(
-                start, end, self, dur
+                start, end, self, durf
             )
 
-        self.duration -= diff
+        self._subtract_from_duration(durf, diff)
         return self
 
     def cut_off(  # type: ignore
@@ -268,18 +376,90 @@ class Chronon(core_events.abc.Event):
         start: core_parameters.abc.Duration.Type,
         end: core_parameters.abc.Duration.Type,
     ) -> Chronon:
-        start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
+        start, end = _to_floats(start, end)
 
         self._assert_valid_absolute_time(start)
         self._assert_correct_start_and_end_values(start, end)
 
-        duration = self.duration
-        if start < duration:
-            if end > duration:
-                end = duration
-            self.duration -= end - start
+        durf = self.duration.beat_count
+        if start < durf:
+            if end > durf:
+                end = durf
+            self._subtract_from_duration(durf, end - start)
         return self
 
+    def _subtract_from_duration(self, durf: float, diff: float):
+        # Only create a new 'DirectDuration' from floats if our duration
+        # already is one: other duration types (e.g. 'RatioDuration') are
+        # kept by using their own arithmetic.
+        if type(duration := self.duration) is core_parameters.DirectDuration:
+            self.duration = durf - diff
+        else:
+            self.duration = duration - diff
+
+
+class Chronon(_Chronon):
+    """A :class:`Chronon` is an event that cannot be further subdivided (a leaf of a tree).
+
+    :param duration: The duration of the ``Chronon``. Mutwo converts
+        the incoming object to a :class:`mutwo.core_parameters.abc.Duration` object
+        with the global `core_parameters.abc.Duration.from_any`
+        callable.
+    :param *args: Arguments parsed to :class:`mutwo.core_events.abc.Event`.
+    :param **kwargs: Keyword arguments parsed to :class:`mutwo.core_events.abc.Event`.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> chronon = core_events.Chronon(2)
+    >>> chronon
+    Chronon(duration=DirectDuration(2.0))
+    >>> print(chronon)  # pretty print for debugging
+    C(dur=D(2.0))
+    """
+
+
+class SlottedChronon(_Chronon):
+    """A :class:`Chronon` without instance dictionary.
+
+    :param duration: The duration of the ``SlottedChronon``.
+    :param *args: Arguments parsed to :class:`mutwo.core_events.abc.Event`.
+    :param **kwargs: Keyword arguments parsed to :class:`mutwo.core_events.abc.Event`.
+
+    A :class:`Chronon` can have any parameter, because its parameters are
+    stored in its instance dictionary. A ``SlottedChronon`` only has the
+    parameters which are declared in the ``__slots__`` of its class. Each
+    declared parameter only needs the space of one reference, so slotted
+    chronons need much less memory and their parameters can be read and
+    set a bit faster. Use them for scores with many chronons which share
+    the same parameters. Setting an undeclared parameter raises an
+    :class:`AttributeError`, a declared but unset parameter is ``None``
+    for :meth:`get_parameter`.
+
+    Slotted chronons are chronons: ``isinstance(event, Chronon)`` is
+    ``True``.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> class Note(core_events.SlottedChronon):
+    ...     __slots__ = ("pitch", "volume")
+    >>> note = Note(1).set("pitch", 60)
+    >>> note
+    Note(duration=DirectDuration(1.0), pitch=60)
+    >>> note.get_parameter("volume") is None
+    True
+    >>> isinstance(note, core_events.Chronon)
+    True
+    """
+
+    __slots__ = ("_duration", "_tempo", "_tag", "_fingerprint_cache")
+
+
+# 'SlottedChronon' can't inherit from 'Chronon', because 'Chronon' has an
+# instance dictionary.
+Chronon.register(SlottedChronon)
+
 
 T = typing.TypeVar("T", bound=core_events.abc.Event)
 
@@ -297,6 +477,40 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         e.extend(event)
         return e
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Cached absolute times can always be calculated again, so they
+        # aren't persisted.
+        state = super().__getstate__()
+        state.pop("_abstf_cache", None)
+        return state
+
+    def append(self, event: T):
+        super().append(event)
+        # Patch cached absolute times instead of calculating them again:
+        # appending is by far the most common way to build a consecution.
+        # If the cache was already outdated, the patched cache is outdated,
+        # too, and is calculated again the next time it's needed.
+        try:
+            (
+                (durf_tuple, duration_type_tuple),
+                (abstf_tuple, durf),
+                durf_unrounded,
+                is_direct,
+            ) = self._abstf_cache
+        except AttributeError:
+            return
+        duration = event.duration
+        durf_unrounded += duration.beat_count
+        self._abstf_cache = (
+            (
+                durf_tuple + (duration.beat_count,),
+                duration_type_tuple + (type(duration),),
+            ),
+            (abstf_tuple + (durf,), _round(durf_unrounded)),
+            durf_unrounded,
+            is_direct and type(duration) is core_parameters.DirectDuration,
+        )
+
     # ###################################################################### #
     #                    private static methods                              #
     # ###################################################################### #
@@ -329,25 +543,27 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         end: core_parameters.abc.Duration,
         cut_off_duration: typing.Optional[core_parameters.abc.Duration] = None,
     ) -> Consecution[T]:
+        start, end = _to_floats(start, end)
         if cut_off_duration is None:
-            cut_off_duration = end - start
+            cut_off_duration = _round(end - start)
+        else:
+            (cut_off_duration,) = _to_floats(cut_off_duration)
+        self._copy_interned_chronons()
         # Collect events which are only active within the cut_off - range
         event_to_delete_list = []
-        abst_tuple = self.absolute_time_tuple
+        abstf_tuple, durf = self._abstf_tuple_and_dur
         for i, t0, t1, e in zip(
-            range(len(self)), abst_tuple, abst_tuple[1:] + (None,), self
+            range(len(self)), abstf_tuple, abstf_tuple[1:] + (durf,), self
         ):
-            if t1 is None:
-                t1 = t0 + e.duration
             if t0 >= start and t1 <= end:
                 event_to_delete_list.append(i)
             # Shorten event which are partly active within the
             # cut_off - range
             elif t0 <= start and t1 >= start:
-                diff = start - t0
+                diff = _round(start - t0)
                 e.cut_off(diff, diff + cut_off_duration)
             elif t0 < end and t1 > end:
-                diff = t0 - start
+                diff = _round(t0 - start)
                 e.cut_off(0, cut_off_duration - diff)
         for i in reversed(event_to_delete_list):
             del self[i]
@@ -376,29 +592,40 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         elif abstf == abstf_tuple[event_index]:
             return event_index
 
-        try:
-            end = abstf_tuple[event_index + 1]
-        except IndexError:
-            end = durf
-
-        difference = end - abstf
+        difference = abstf - abstf_tuple[event_index]
         split_event = self[event_index].split_at(difference)
         split_event_count = len(split_event)
         match split_event_count:
             case 1:
                 pass
             case 2:
-                self[event_index] = split_event[0]
-                self.insert(event_index, split_event[1])
+                self[event_index] = split_event[1]
+                self.insert(event_index, split_event[0])
             case _:
                 raise RuntimeError("Unexpected event count!")
 
         return event_index + 1
 
+    def _get_duration_key(self) -> tuple[tuple[float, ...], tuple[type, ...]]:
+        """Return the durations of all children as floats and their types."""
+        duration_list = [e.duration for e in self._read_only_iter()]
+        return (
+            tuple([d.beat_count for d in duration_list]),
+            tuple(map(type, duration_list)),
+        )
+
     # ###################################################################### #
     #                        private   properties                            #
     # ###################################################################### #
 
+    # The start times of all children are needed by many methods (e.g.
+    # 'get_event_index_at', 'split_at', 'squash_in' or any EventConverter).
+    # Summing and rounding them needs many float operations, so we cache
+    # them. The cache is only valid as long as the durations of our
+    # children don't change. We can't be told about each change (e.g. a
+    # nested event or a duration may be changed in place), so we compare
+    # the durations each time with the durations of the cache instead.
+
     @property
     def _abst_tuple_and_dur(
         self,
@@ -408,7 +635,7 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         This property helps to improve performance of various functions
         which uses duration and absolute_time_tuple attribute.
         """
-        d_iter = (e.duration for e in self)
+        d_iter = (e.duration for e in self._read_only_iter())
         abst_tuple = tuple(
             core_utilities.accumulate_from_n(d_iter, core_parameters.DirectDuration(0))
         )
@@ -423,7 +650,18 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         This property helps to improve performance of various functions
         which uses duration and absolute_time_tuple attribute.
         """
-        d_iter = (e.duration.beat_count for e in self)
+        duration_key = self._get_duration_key()
+        try:
+            cached_duration_key, abstf_tuple_and_dur, *_ = self._abstf_cache
+        except AttributeError:
+            pass
+        else:
+            if cached_duration_key == duration_key:
+                return abstf_tuple_and_dur
+        durf_tuple, duration_type_tuple = duration_key
+        # We keep the unrounded sum, so that 'append' can patch the cache
+        # with exactly the same result as a full recalculation.
+        durf_unrounded_tuple = tuple(core_utilities.accumulate_from_n(durf_tuple, 0))
         abstf_tuple = tuple(
             # We need to round each duration again after accumulation,
             # because floats were summed which could lead to
@@ -435,10 +673,20 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
                     d,
                     core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS,
                 ),
-                core_utilities.accumulate_from_n(d_iter, 0),
+                durf_unrounded_tuple,
             )
         )
-        return abstf_tuple[:-1], abstf_tuple[-1]
+        abstf_tuple_and_dur = abstf_tuple[:-1], abstf_tuple[-1]
+        self._abstf_cache = (
+            duration_key,
+            abstf_tuple_and_dur,
+            durf_unrounded_tuple[-1],
+            # If all children have a 'DirectDuration', our duration can be
+            # created from the float sum of their durations. Otherwise the
+            # durations need to be added, so that their type is kept.
+            all(t is core_parameters.DirectDuration for t in duration_type_tuple),
+        )
+        return abstf_tuple_and_dur
 
     # ###################################################################### #
     #                           properties                                   #
@@ -446,11 +694,12 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
 
     @core_events.abc.Compound.duration.getter
     def duration(self) -> core_parameters.abc.Duration:
-        try:
-            return functools.reduce(operator.add, (e.duration for e in self))
-        # If Consecution is empty
-        except TypeError:
-            return core_parameters.DirectDuration(0)
+        # Use the (cached) float sum of all durations, this is much faster
+        # than adding duration objects.
+        _, durf = self._abstf_tuple_and_dur
+        if self._abstf_cache[3]:
+            return core_parameters.DirectDuration(durf)
+        return functools.reduce(operator.add, (e.duration for e in self))
 
     @property
     def absolute_time_tuple(self) -> tuple[core_parameters.abc.Duration, ...]:
@@ -467,11 +716,8 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         self,
     ) -> tuple[ranges.Range, ...]:
         """Return start and end time for each event."""
-        d_iter = (e.duration for e in self)
-        abst_tuple = tuple(
-            core_utilities.accumulate_from_n(d_iter, core_parameters.DirectDuration(0))
-        )
-        return tuple(ranges.Range(*t) for t in zip(abst_tuple, abst_tuple[1:]))
+        abst_tuple, dur = self._abst_tuple_and_dur
+        return tuple(ranges.Range(*t) for t in zip(abst_tuple, abst_tuple[1:] + (dur,)))
 
     # ###################################################################### #
     #                           public methods                               #
@@ -543,27 +789,26 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         start: core_parameters.abc.Duration.Type,
         end: core_parameters.abc.Duration.Type,
     ) -> Consecution[T]:
-        start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
+        start, end = _to_floats(start, end)
         self._assert_valid_absolute_time(start)
         self._assert_correct_start_and_end_values(start, end)
+        self._copy_interned_chronons()
 
         event_to_remove_index_list = []
-        for i, t0, e in zip(range(len(self)), self.absolute_time_tuple, self):
-            event_duration = e.duration
-            t1 = t0 + event_duration
-            cut_out_start: core_parameters.DirectDuration = (
-                core_parameters.DirectDuration(0)
-            )
-            cut_out_end = event_duration
+        abstf_tuple, _ = self._abstf_tuple_and_dur
+        for i, t0, e in zip(range(len(self)), abstf_tuple, self):
+            durf = e.duration.beat_count
+            t1 = _round(t0 + durf)
+            cut_out_start, cut_out_end = 0.0, durf
             if t0 < start:
-                cut_out_start += start - t0
+                cut_out_start = _round(start - t0)
             if t1 > end:
-                cut_out_end -= t1 - end
+                cut_out_end = _round(durf - (t1 - end))
             if cut_out_start < cut_out_end:
                 e.cut_out(cut_out_start, cut_out_end)
             elif not (
                 # Support special case of events with duration = 0.
-                e.duration == 0
+                durf == 0
                 and t0 >= start
                 and t0 <= end
             ):
@@ -652,7 +897,8 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         except ValueError:  # Only one event => start == duration.
             self.append(event_to_slide_in)
         else:
-            self.extend([event_to_slide_in] + b)
+            self.append(event_to_slide_in)
+            self.extend(b)
         return self
 
     def split_child_at(
@@ -670,52 +916,81 @@ class Consecution(core_events.abc.Compound, typing.Generic[T]):
         if not absolute_time:
             raise core_utilities.NoSplitTimeError()
 
-        split_abstf_list = [
-            core_parameters.abc.Duration.from_any(t).beat_count for t in absolute_time
-        ]
+        split_abstf_list = sorted(_to_floats(*absolute_time))
+        # First is smallest, check if t < 0
+        self._assert_valid_absolute_time(split_abstf_list[0])
 
         abstf_tuple, durf = self._abstf_tuple_and_dur
-        abstf_list = list(abstf_tuple)
-        c = self.copy()
+        # There isn't any child after our duration.
+        if split_abstf_list[-1] > durf:
+            if not ignore_invalid_split_point:
+                raise core_utilities.SplitError(split_abstf_list[-1])
+            split_abstf_list = [t for t in split_abstf_list if t <= durf]
+
+        if not self:
+            return tuple([])
 
-        index_list = []
-        is_first = True
-        for t in sorted(split_abstf_list):
-            if is_first:  # First is smallest, check if t < 0
-                self._assert_valid_absolute_time(t)
-                is_first = False
-            # Improve performance: don't try to split if we know it is
-            # already split here. We also need to be sure to not
-            # add any duplicates to 'absolute_time_list', so we need
-            # to check anyway.
-            if t in abstf_list:
-                index_list.append(abstf_list.index(t))
+        # We walk once through the children and the sorted split times
+        # (merge-like) and distribute the children into the slices. Only
+        # children which are active at a split time are split (with all
+        # of their split times at once).
+        c = self.copy()
+        slice_list: list[list[T]] = [[]]
+        split_count, split_index = len(split_abstf_list), 0
+        # A split time at 0 is the start of the first slice.
+        is_first_slice_started = False
+        for t0, t1, e in zip(abstf_tuple, abstf_tuple[1:] + (durf,), c):
+            # Fast path for children without any split time.
+            if split_index == split_count or split_abstf_list[split_index] > t1:
+                slice_list[-1].append(e)
+                is_first_slice_started = True
                 continue
-            # It's okay to ignore, this is still within the given event
-            # (if we don't continue 'split_child_at' raises an error).
-            if t == durf:
+
+            # Split times at the start of a child (or duplicates of
+            # previous split times) start a new slice before the child.
+            while split_index < split_count and (
+                _round(split_abstf_list[split_index] - t0) <= 0
+            ):
+                if is_first_slice_started or slice_list[0]:
+                    slice_list.append([])
+                is_first_slice_started = True
+                split_index += 1
+            is_first_slice_started = True
+
+            # Collect split times which are within the child.
+            durf_e = e.duration.beat_count
+            split_position_list, duplicate_count_list = [], []
+            while split_index < split_count and (
+                (p := _round(split_abstf_list[split_index] - t0)) < durf_e
+            ):
+                if split_position_list and p == split_position_list[-1]:
+                    duplicate_count_list[-1] += 1
+                else:
+                    split_position_list.append(p)
+                    duplicate_count_list.append(0)
+                split_index += 1
+
+            if not split_position_list:
+                slice_list[-1].append(e)
                 continue
-            try:
-                i = c._split_child_at(t, tuple(abstf_list), durf)
-            except core_utilities.SplitUnavailableChildError:
-                if not ignore_invalid_split_point:
-                    raise core_utilities.SplitError(t)
-                # We can stop, because if there isn't any child at this time
-                # there won't be any child at a later time (remember: our
-                # absolute times are sorted).
-                break
-            index_list.append(i)
-            abstf_list.append(t)
-            abstf_list.sort()
-
-        # Add frame indices (if not already present)
-        if 0 not in index_list:
-            index_list.insert(0, 0)
-
-        if (event_count := len(c)) not in index_list:
-            index_list.append(event_count)
-
-        return tuple(c[i0:i1] for i0, i1 in zip(index_list, index_list[1:]))
+
+            split_event_tuple = e.split_at(*split_position_list)
+            slice_list[-1].append(split_event_tuple[0])
+            for split_event, duplicate_count in zip(
+                split_event_tuple[1:], duplicate_count_list
+            ):
+                slice_list.extend([] for _ in range(duplicate_count))
+                slice_list.append([split_event])
+
+        # Remaining split times are equal to our duration: they are
+        # still within the consecution, but don't start a new slice.
+
+        consecution_list = []
+        for event_list in slice_list:
+            consecution = self.empty_copy()
+            consecution.extend(event_list)
+            consecution_list.append(consecution)
+        return tuple(consecution_list)
 
     def extend_until(
         self,
@@ -814,11 +1089,19 @@ class Concurrence(core_events.abc.Compound, typing.Generic[T]):
 
     @core_events.abc.Compound.duration.getter
     def duration(self) -> core_parameters.abc.Duration:
-        try:
-            return max(e.duration for e in self)
+        duration_list = [e.duration for e in self._read_only_iter()]
         # If Concurrence is empty
-        except ValueError:
+        if not duration_list:
             return core_parameters.DirectDuration(0)
+        # Compare floats, but return the duration of the longest child.
+        i = max(range(len(duration_list)), key=lambda i: duration_list[i].beat_count)
+        duration = duration_list[i]
+        # Shared children (see 'Compound._cow_dict' and
+        # 'Compound._interned_dict') mustn't be changed.
+        e_id = id(list.__getitem__(self, i))
+        if e_id in (self._cow_dict or ()) or e_id in (self._interned_dict or ()):
+            return duration.copy()
+        return duration
 
     # ###################################################################### #
     #                           public methods                               #
@@ -832,6 +1115,7 @@ class Concurrence(core_events.abc.Compound, typing.Generic[T]):
         start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
         self._assert_valid_absolute_time(start)
         self._assert_correct_start_and_end_values(start, end)
+        self._copy_interned_chronons()
         [e.cut_out(start, end) for e in self]
         return self
 
@@ -843,6 +1127,7 @@ class Concurrence(core_events.abc.Compound, typing.Generic[T]):
         start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
         self._assert_valid_absolute_time(start)
         self._assert_correct_start_and_end_values(start, end)
+        self._copy_interned_chronons()
         [e.cut_off(start, end) for e in self]
         return self
 
@@ -918,6 +1203,7 @@ class Concurrence(core_events.abc.Compound, typing.Generic[T]):
         # we raise an error, to avoid confusion by the user.
         if not self:
             raise core_utilities.IneffectiveExtendUntilError(self)
+        self._copy_interned_chronons()
         for e in self:
             try:
                 e.extend_until(duration, duration_to_white_space, prolong_chronon)
@@ -1108,16 +1394,17 @@ class Concurrence(core_events.abc.Compound, typing.Generic[T]):
         if not absolute_time:
             raise core_utilities.NoSplitTimeError()
 
-        abst_list = sorted(
-            [core_parameters.abc.Duration.from_any(t) for t in absolute_time]
-        )
-        self._assert_valid_absolute_time(abst_list[0])
-        if abst_list[-1] > self.duration and not ignore_invalid_split_point:
-            raise core_utilities.SplitError(abst_list[-1])
+        # Duplicates would lead to different slice counts of our children
+        # (e.g. chronons ignore them, consecutions return empty slices).
+        abstf_list = sorted(set(_to_floats(*absolute_time)))
+        self._assert_valid_absolute_time(abstf_list[0])
+        durf = self.duration.beat_count
+        if abstf_list[-1] > durf and not ignore_invalid_split_point:
+            raise core_utilities.SplitError(abstf_list[-1])
 
         def slice_tuple_to_event(slice_tuple):
             e = self.empty_copy()
             e[:] = slice_tuple
             return e
 
-        return self._make_event_slice_tuple(abst_list, slice_tuple_to_event)
+        return self._make_event_slice_tuple(abstf_list, slice_tuple_to_event)
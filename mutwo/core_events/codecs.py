@@ -0,0 +1,524 @@
+# This file is part of mutwo, ecosystem for time-based arts.
+#
+# Copyright (C) 2020-2024
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compact binary format for event trees.
+
+:func:`pickle.dumps` stores each event and each duration as a separate
+object with its class and its attribute dictionary. For big event trees
+this is slow and needs much space. :func:`dumps` takes the tree apart
+instead:
+
+- a type table with all classes of the tree,
+- the tree shape as one array of integers,
+- the durations of all chronons as one array of floats,
+- a table with the attribute names of all chronons, so that each name
+  is only stored once,
+- one list with the remaining values (parameters of chronons and the
+  state of compounds), which is pickled at once.
+
+Events which can't be taken apart (e.g. events which define how they
+are pickled) are pickled as they are.
+
+:func:`dump` writes an event tree to a file, which can be opened with
+:class:`EventFile`. Each compound with nested compounds is stored with
+the position of its children inside the file, all other events are
+stored with :func:`dumps`. :class:`EventFile` maps the file into memory
+and only loads the requested parts of the event tree.
+"""
+
+from __future__ import annotations
+
+import array
+import copyreg
+import functools
+import mmap
+import pickle
+import struct
+import typing
+
+from mutwo import core_events
+from mutwo import core_parameters
+from mutwo import core_utilities
+
+
+__all__ = ("dumps", "loads", "dump", "EventFile")
+
+_MAGIC = b"MWEV"
+_VERSION = 1
+
+_FILE_MAGIC = b"MWEF"
+_FILE_VERSION = 1
+
+# Position of an event inside a file: offset, size and if the event is
+# stored as a branch (compound with positions of its children) or with
+# 'dumps'.
+_Position: typing.TypeAlias = tuple[int, int, bool]
+_POSITION_STRUCT = struct.Struct("<QQ?")
+_FILE_HEADER_SIZE = len(_FILE_MAGIC) + 1 + _POSITION_STRUCT.size
+
+# Each node of the tree shape starts with '(index << 2) | kind'. The
+# index of chronons refers to their layout (class and attribute names),
+# the index of compounds to their class. Compound nodes are followed by
+# their number of children and reference nodes by the number of the
+# referenced event.
+_CHRONON, _COMPOUND, _REFERENCE, _OBJECT = range(4)
+
+_PICKLE_HOOK_TUPLE = (
+    "__reduce_ex__",
+    "__reduce__",
+    "__getstate__",
+    "__setstate__",
+    "__getnewargs_ex__",
+    "__getnewargs__",
+)
+
+_new = object.__new__
+_set_beat_count = core_parameters.DirectDuration._beat_count.__set__  # type: ignore
+
+
+@functools.cache
+def _has_slots(cls: type) -> typing.Optional[bool]:
+    # Return if chronons of 'cls' have slots or 'None' if they don't use
+    # the default pickle protocol (and we therefore can't take them apart).
+    # 'Event.__setstate__' only reads old pickles, so it's the default, too.
+    if (
+        not hasattr(cls, "_get_slot_tuple")
+        or cls.__new__ is not object.__new__
+        or any(
+            getattr(cls, name, None) is not getattr(core_events.abc.Event, name, None)
+            for name in _PICKLE_HOOK_TUPLE
+        )
+    ):
+        return None
+    return bool(cls._get_slot_tuple(cls))
+
+
+def _reduce_compound(
+    compound: core_events.abc.Compound,
+) -> typing.Optional[tuple[typing.Any, list[core_events.abc.Event]]]:
+    # Return state and children of 'compound' or 'None' if it doesn't
+    # use the default pickle protocol (and we therefore can't take it apart).
+    reduced = compound.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    if (
+        len(reduced) < 4
+        or reduced[0] is not copyreg.__newobj__  # type: ignore
+        or reduced[1] != (type(compound),)
+        or reduced[3] is None
+        or (len(reduced) > 4 and reduced[4] is not None)
+    ):
+        return None
+    state = reduced[2]
+    if isinstance(state, dict) and "_interned_chronon_tuple" in state:
+        state = {k: v for k, v in state.items() if k != "_interned_chronon_tuple"}
+    return state, list(reduced[3])
+
+
+def _set_state(o: typing.Any, state: typing.Any):
+    # Same as 'BUILD' of pickle.
+    if (setstate := getattr(o, "__setstate__", None)) is not None:
+        setstate(state)
+        return
+    slot_state = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slot_state = state
+    if state:
+        o.__dict__.update(state)
+    if slot_state:
+        for name, value in slot_state.items():
+            setattr(o, name, value)
+
+
+class _Encoder:
+    def __init__(self):
+        self.class_list: list[type] = []
+        self.class_to_index: dict[type, int] = {}
+        self.node_array = array.array("q")
+        self.durf_array = array.array("d")
+        # Class index, attribute names and position of the duration
+        # (or -1 if the duration isn't stored in 'durf_array').
+        self.layout_list: list[tuple[int, tuple[str, ...], int]] = []
+        self.layout_to_index: dict[tuple[type, tuple[str, ...], bool], int] = {}
+        self.value_list: list[typing.Any] = []
+        self.id_to_number: dict[int, int] = {}
+
+    def add_class(self, cls: type) -> int:
+        try:
+            return self.class_to_index[cls]
+        except KeyError:
+            self.class_list.append(cls)
+            index = self.class_to_index[cls] = len(self.class_list) - 1
+            return index
+
+    def add_chronon(self, chronon: core_events.Chronon, has_slots: bool):
+        if has_slots:
+            attribute_dict = chronon._get_attribute_dict()
+        else:
+            attribute_dict = chronon.__dict__
+            if "_fingerprint_cache" in attribute_dict:
+                attribute_dict = chronon._get_attribute_dict()
+        duration = attribute_dict.get("_duration")
+        is_direct = type(duration) is core_parameters.DirectDuration
+        name_tuple = tuple(attribute_dict)
+        key = (type(chronon), name_tuple, is_direct)
+        try:
+            index = self.layout_to_index[key]
+        except KeyError:
+            self.layout_list.append(
+                (
+                    self.add_class(type(chronon)),
+                    name_tuple,
+                    name_tuple.index("_duration") if is_direct else -1,
+                )
+            )
+            index = self.layout_to_index[key] = len(self.layout_list) - 1
+        value_list = self.value_list
+        value_list.extend(attribute_dict.values())
+        if is_direct:
+            self.durf_array.append(duration._beat_count)
+            value_list[self.layout_list[index][2] - len(name_tuple)] = None
+        self.node_array.append((index << 2) | _CHRONON)
+
+    def add_compound(self, compound: core_events.abc.Compound) -> bool:
+        if compound._interned_dict:  # interned chronons need pickle
+            return False
+        if (reduced := _reduce_compound(compound)) is None:
+            return False
+        state, child_list = reduced
+        self.value_list.append(state)
+        self.node_array.append((self.add_class(type(compound)) << 2) | _COMPOUND)
+        self.node_array.append(len(child_list))
+        for child in child_list:
+            self.add(child)
+        return True
+
+    def add(self, o: typing.Any):
+        id_to_number = self.id_to_number
+        if (number := id_to_number.get(id(o))) is not None:
+            self.node_array.append(_REFERENCE)
+            self.node_array.append(number)
+            return
+        id_to_number[id(o)] = len(id_to_number)
+        if isinstance(o, core_events.Chronon):
+            if (has_slots := _has_slots(type(o))) is not None:
+                self.add_chronon(o, has_slots)
+                return
+        elif isinstance(o, core_events.abc.Compound):
+            if self.add_compound(o):
+                return
+        self.value_list.append(o)
+        self.node_array.append(_OBJECT)
+
+    def dumps(self) -> bytes:
+        return (
+            _MAGIC
+            + bytes([_VERSION])
+            + pickle.dumps(
+                (
+                    tuple(self.class_list),
+                    self.node_array,
+                    self.durf_array,
+                    tuple(self.layout_list),
+                    self.value_list,
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        )
+
+
+def dumps(o: typing.Any) -> bytes:
+    """Serialize an event tree to bytes.
+
+    :param o: The event which shall be serialized. Any other object is
+        pickled.
+    :type o: typing.Any
+    :return: The serialized event. Use :func:`loads` to get the event
+        back.
+
+    Like :mod:`pickle` this keeps the identity of objects: if the same
+    event appears twice inside the tree it's still the same event after
+    loading it. Don't load data from untrusted sources, because the
+    parameters of the events are pickled.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> cns = core_events.Consecution(
+    ...     [core_events.Chronon(1), core_events.Chronon(2).set("pitch", 3)]
+    ... )
+    >>> data = core_events.dumps(cns)
+    >>> core_events.loads(data)
+    Consecution([Chronon(duration=DirectDuration(1.0)), Chronon(duration=DirectDuration(2.0), pitch=3)])
+    """
+    encoder = _Encoder()
+    encoder.add(o)
+    return encoder.dumps()
+
+
+def loads(data: bytes) -> typing.Any:
+    """Load an event tree which was serialized with :func:`dumps`.
+
+    :param data: The serialized event.
+    :type data: bytes
+    """
+    header_size = len(_MAGIC) + 1
+    if data[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("Data wasn't created by 'core_events.dumps'.")
+    if (version := data[len(_MAGIC)]) != _VERSION:
+        raise ValueError(f"Unsupported version '{version}' of event data.")
+    (
+        class_tuple,
+        node_array,
+        durf_array,
+        layout_tuple,
+        value_list,
+    ) = pickle.loads(memoryview(data)[header_size:])
+
+    chronon_layout_tuple = tuple(
+        (
+            cls := class_tuple[class_index],
+            name_tuple,
+            len(name_tuple),
+            duration_index,
+            _has_slots(cls),
+        )
+        for class_index, name_tuple, duration_index in layout_tuple
+    )
+    next_node = iter(node_array).__next__
+    next_durf = iter(durf_array).__next__
+    value_index = 0
+    event_list: list[typing.Any] = []
+    direct_duration = core_parameters.DirectDuration
+
+    def load() -> typing.Any:
+        nonlocal value_index
+        node = next_node()
+        kind = node & 3
+        if kind == _CHRONON:
+            cls, name_tuple, n, duration_index, has_slots = chronon_layout_tuple[
+                node >> 2
+            ]
+            o = _new(cls)
+            event_list.append(o)
+            chronon_value_list = value_list[value_index : value_index + n]
+            value_index += n
+            if duration_index >= 0:
+                chronon_value_list[duration_index] = duration = _new(direct_duration)
+                _set_beat_count(duration, next_durf())
+            if has_slots:
+                for name, value in zip(name_tuple, chronon_value_list):
+                    setattr(o, name, value)
+            else:
+                o.__dict__ = dict(zip(name_tuple, chronon_value_list))
+        elif kind == _COMPOUND:
+            cls = class_tuple[node >> 2]
+            o = cls.__new__(cls)
+            event_list.append(o)
+            _set_state(o, value_list[value_index])
+            value_index += 1
+            list.extend(o, [load() for _ in range(next_node())])
+        elif kind == _REFERENCE:
+            return event_list[next_node()]
+        else:
+            o = value_list[value_index]
+            value_index += 1
+            event_list.append(o)
+        return o
+
+    return load()
+
+
+def _write(event: typing.Any, file: typing.BinaryIO) -> _Position:
+    # Write children before their parent, so that the parent knows
+    # where its children are.
+    if (
+        isinstance(event, core_events.abc.Compound)
+        and (reduced := _reduce_compound(event)) is not None
+        and any(isinstance(e, core_events.abc.Compound) for e in reduced[1])
+    ):
+        state, child_list = reduced
+        data = pickle.dumps(
+            (
+                type(event),
+                tuple(e.tag for e in child_list),
+                tuple(_write(e, file) for e in child_list),
+                pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL),
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        is_branch = True
+    else:
+        data, is_branch = dumps(event), False
+    offset = file.tell()
+    file.write(data)
+    return offset, len(data), is_branch
+
+
+def dump(event: typing.Any, path: str):
+    """Write an event tree to a file.
+
+    :param event: The event which shall be written.
+    :type event: typing.Any
+    :param path: Where to write the file.
+    :type path: str
+
+    Use :class:`EventFile` to read the file.
+    """
+    with open(path, "wb") as file:
+        file.write(bytes(_FILE_HEADER_SIZE))
+        position = _write(event, file)
+        file.seek(0)
+        file.write(
+            _FILE_MAGIC + bytes([_FILE_VERSION]) + _POSITION_STRUCT.pack(*position)
+        )
+
+
+class EventFile(core_utilities.MutwoObject):
+    """Read an event tree lazily from a file which was written by :func:`dump`.
+
+    :param path: The path of the file.
+    :type path: str
+
+    The file is mapped into memory and only the requested events are
+    loaded: getting one child of a huge :class:`~mutwo.core_events.Concurrence`
+    doesn't load its siblings. Each call returns a new event, so changing
+    a loaded event neither changes the file nor other loaded events.
+    Call :meth:`close` (or use the file as a context manager) when it's
+    no longer needed.
+
+    **Example:**
+
+    >>> import os
+    >>> from mutwo import core_events
+    >>> score = core_events.Concurrence(
+    ...     [
+    ...         core_events.Consecution([core_events.Chronon(2)], tag="violin"),
+    ...         core_events.Consecution([core_events.Chronon(4)], tag="cello"),
+    ...     ]
+    ... )
+    >>> core_events.dump(score, "score.mwef")
+    >>> with core_events.EventFile("score.mwef") as event_file:
+    ...     event_file["cello"]
+    ...     event_file.get_event_from_index_sequence((0, 0))
+    Consecution([Chronon(duration=DirectDuration(4.0))])
+    Chronon(duration=DirectDuration(2.0))
+    >>> os.remove("score.mwef")
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = self._mmap[:_FILE_HEADER_SIZE]
+            if header[: len(_FILE_MAGIC)] != _FILE_MAGIC:
+                raise ValueError(f"File '{path}' wasn't created by 'core_events.dump'.")
+            if (version := header[len(_FILE_MAGIC)]) != _FILE_VERSION:
+                raise ValueError(f"Unsupported version '{version}' of file '{path}'.")
+        except Exception:
+            self._mmap.close()
+            raise
+        self._root: _Position = _POSITION_STRUCT.unpack(header[len(_FILE_MAGIC) + 1 :])
+        self._branch_dict: dict[int, tuple] = {}
+
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __repr_content__(self) -> str:
+        return f"path={repr(self.path)}"
+
+    def __reduce__(self):
+        return type(self), (self.path,)
+
+    def __enter__(self) -> EventFile:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        if self._root[2]:
+            return len(self._get_branch(self._root)[2])
+        return len(self.load())
+
+    def __getitem__(self, index_or_tag: int | str) -> core_events.abc.Event:
+        return self.get_event_from_index_sequence((index_or_tag,))
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _read(self, position: _Position, load: typing.Callable) -> typing.Any:
+        offset, size, _ = position
+        with memoryview(self._mmap) as view, view[offset : offset + size] as data:
+            return load(data)
+
+    def _get_branch(self, position: _Position) -> tuple:
+        # Class, child tags, child positions and pickled state.
+        try:
+            return self._branch_dict[position[0]]
+        except KeyError:
+            branch = self._branch_dict[position[0]] = self._read(position, pickle.loads)
+            return branch
+
+    def _load(self, position: _Position) -> typing.Any:
+        if not position[2]:
+            return self._read(position, loads)
+        cls, _, position_tuple, state = self._get_branch(position)
+        o = cls.__new__(cls)
+        _set_state(o, pickle.loads(state))
+        list.extend(o, [self._load(p) for p in position_tuple])
+        return o
+
+    # ###################################################################### #
+    #                           public methods                               #
+    # ###################################################################### #
+
+    def load(self) -> typing.Any:
+        """Load the complete event tree."""
+        return self._load(self._root)
+
+    def get_event_from_index_sequence(
+        self, index_sequence: typing.Sequence[int | str]
+    ) -> core_events.abc.Event:
+        """Load nested event from a sequence of indices.
+
+        :param index_sequence: The indices (or tags) of the nested event.
+        :type index_sequence: typing.Sequence[int | str]
+
+        Only the requested event is loaded.
+        """
+        index_tuple = tuple(index_sequence)
+        position = self._root
+        for n, index in enumerate(index_tuple):
+            if not position[2]:
+                return core_utilities.get_nested_item_from_index_sequence(
+                    index_tuple[n:], self._load(position)
+                )
+            _, tag_tuple, position_tuple, _ = self._get_branch(position)
+            if isinstance(index, str):
+                try:
+                    index = tag_tuple.index(index)
+                except ValueError:
+                    raise KeyError(f"No event found with tag = '{index}'.")
+            position = position_tuple[index]
+        return self._load(position)
+
+    def close(self):
+        """Close the file."""
+        self._mmap.close()
+        self._branch_dict.clear()
@@ -0,0 +1,533 @@
+# This file is part of mutwo, ecosystem for time-based arts.
+#
+# Copyright (C) 2020-2024
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Events which store their children in columns"""
+
+from __future__ import annotations
+
+import array
+import operator
+import sys
+import typing
+
+from mutwo import core_events
+from mutwo import core_parameters
+from mutwo import core_utilities
+
+
+__all__ = ("ColumnConsecution",)
+
+
+class ColumnConsecution(
+    core_events.Consecution,
+    class_specific_side_attribute_tuple=("parameter_name_tuple",),
+):
+    """A :class:`~mutwo.core_events.Consecution` which stores its chronons in columns.
+
+    :param iterable: The :class:`~mutwo.core_events.Chronon` objects
+        which are hosted by the consecution.
+    :param parameter_name_tuple: Names of the parameters which get their
+        own column. Parameters which aren't part of this tuple are still
+        supported, but are stored less compact in one dictionary per
+        chronon. Default to an empty tuple.
+    :param tempo: The tempo of the consecution.
+    :param tag: The tag of the consecution.
+
+    Large flat voices with hundred thousands of chronons need a lot of
+    memory and are slow to copy, because each chronon is a python object
+    with its own dictionary and its own duration object. A
+    ``ColumnConsecution`` only saves one float per chronon for its duration
+    (in an :class:`array.array`) and one list for each parameter of
+    ``parameter_name_tuple``. Chronons are only created on demand: when
+    indexing or iterating a ``ColumnConsecution``, a lightweight view on a
+    row of the columns is returned. This view behaves like a
+    :class:`~mutwo.core_events.Chronon` and all changes of its
+    parameters are written back to the columns. Therefore all methods of
+    :class:`~mutwo.core_events.Consecution` and all converters which
+    mutate chronons in place keep working.
+
+    There are some differences to a :class:`~mutwo.core_events.Consecution`:
+
+        - A ``ColumnConsecution`` can only host plain
+          :class:`~mutwo.core_events.Chronon` objects (no subclasses
+          and no nested compounds).
+        - Durations are always returned as
+          :class:`~mutwo.core_parameters.DirectDuration`. Changing a
+          duration of a view in place (e.g. ``view.duration.add(1)``)
+          has no effect, assign a new duration instead or use
+          :meth:`mutate_parameter`.
+        - A parameter which is ``None`` is treated as undefined.
+        - A view is only valid as long as no chronon is inserted or
+          removed before it. Copies of views (e.g. via
+          :meth:`~mutwo.core_events.Chronon.copy` or :meth:`pop`) are
+          independent :class:`~mutwo.core_events.Chronon` objects.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> cns = core_events.ColumnConsecution(
+    ...     [core_events.Chronon(1), core_events.Chronon(2)],
+    ...     parameter_name_tuple=("pitch",),
+    ... )
+    >>> cns.set_parameter("pitch", 440)
+    ColumnConsecution([Chronon(duration=DirectDuration(1.0), pitch=440), Chronon(duration=DirectDuration(2.0), pitch=440)])
+    >>> cns[1].duration = 3
+    >>> cns.get_parameter("duration")
+    (DirectDuration(1.0), DirectDuration(3.0))
+    """
+
+    def __init__(
+        self,
+        iterable: typing.Iterable[core_events.Chronon] = [],
+        parameter_name_tuple: typing.Sequence[str] = tuple([]),
+        *,
+        tempo: typing.Optional[core_parameters.abc.Tempo] = None,
+        tag: typing.Optional[str] = None,
+    ):
+        # We don't call 'list.__init__': the underlying list always
+        # stays empty, our children are exclusively stored in columns.
+        core_events.abc.Event.__init__(self, tempo, tag)
+        self._parameter_name_tuple = tuple(parameter_name_tuple)
+        self._durf_array = array.array("d")
+        self._column_dict: dict[str, list[typing.Any]] = {
+            parameter_name: [] for parameter_name in self._parameter_name_tuple
+        }
+        # Parameters without their own column: 'None' if a chronon
+        # doesn't have any of those parameters.
+        self._extra_list: list[typing.Optional[dict[str, typing.Any]]] = []
+        self.extend(iterable)
+
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __reduce__(self):
+        # 'list' would pickle our (empty) list items and python would
+        # call 'extend' before our columns are restored. Therefore we
+        # only pickle the state of the consecution.
+        return (type(self), (), self.__getstate__())
+
+    def __len__(self) -> int:
+        return len(self._durf_array)
+
+    def __iter__(self) -> typing.Iterator[core_events.Chronon]:
+        return (_ChrononView(self, i) for i in range(len(self)))
+
+    def __reversed__(self) -> typing.Iterator[core_events.Chronon]:
+        return (_ChrononView(self, i) for i in reversed(range(len(self))))
+
+    def __contains__(self, event: typing.Any) -> bool:
+        return any(e == event for e in self)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        # Compare side attributes (the children of the underlying lists
+        # are always equal, because they are always empty).
+        if not super().__eq__(other) or len(self) != len(other):
+            return False
+        if (
+            self._durf_array == other._durf_array
+            and self._column_dict == other._column_dict
+            and self._extra_list == other._extra_list
+        ):
+            return True
+        # Slow path: chronons may be equal even if their columns are
+        # not (e.g. durations which only differ after rounding).
+        return all(e0 == e1 for e0, e1 in zip(self, other))
+
+    __hash__ = core_events.Consecution.__hash__
+
+    def __repr_content__(self) -> str:
+        return repr(list(self))
+
+    def __getitem__(
+        self, index_or_slice_or_tag: int | slice | str
+    ) -> core_events.Chronon | ColumnConsecution:
+        match index_or_slice_or_tag:
+            case str():
+                return self[self._tag_to_index(index_or_slice_or_tag)]
+            case slice():
+                e = self.empty_copy()
+                e._durf_array = self._durf_array[index_or_slice_or_tag]
+                for parameter_name, column in self._column_dict.items():
+                    e._column_dict[parameter_name] = column[index_or_slice_or_tag]
+                e._extra_list = [
+                    extra and extra.copy()
+                    for extra in self._extra_list[index_or_slice_or_tag]
+                ]
+                return e
+            case _:
+                return _ChrononView(self, self._get_row_index(index_or_slice_or_tag))
+
+    def __setitem__(
+        self,
+        index_or_slice_or_tag: int | slice | str,
+        event: core_events.Chronon | typing.Iterable[core_events.Chronon],
+    ):
+        match index_or_slice_or_tag:
+            case str():
+                return self.__setitem__(
+                    self._tag_to_index(index_or_slice_or_tag), event
+                )
+            case slice():
+                durf_tuple, column_value_tuple_tuple, extra_tuple = self._to_columns(
+                    event
+                )
+                self._durf_array[index_or_slice_or_tag] = array.array("d", durf_tuple)
+                for column, column_value_tuple in zip(
+                    self._column_dict.values(), column_value_tuple_tuple
+                ):
+                    column[index_or_slice_or_tag] = column_value_tuple
+                self._extra_list[index_or_slice_or_tag] = extra_tuple
+            case _:
+                i = self._get_row_index(index_or_slice_or_tag)
+                durf, column_value_tuple, extra = self._to_row(event)
+                self._durf_array[i] = durf
+                for column, column_value in zip(
+                    self._column_dict.values(), column_value_tuple
+                ):
+                    column[i] = column_value
+                self._extra_list[i] = extra
+
+    def __delitem__(self, index_or_slice_or_tag: int | slice | str):
+        if isinstance(index_or_slice_or_tag, str):
+            return self.__delitem__(self._tag_to_index(index_or_slice_or_tag))
+        del self._durf_array[index_or_slice_or_tag]
+        for column in self._column_dict.values():
+            del column[index_or_slice_or_tag]
+        del self._extra_list[index_or_slice_or_tag]
+
+    def __iadd__(
+        self, event: typing.Iterable[core_events.Chronon]
+    ) -> ColumnConsecution:
+        self.extend(event)
+        return self
+
+    def __imul__(self, factor: int) -> ColumnConsecution:
+        if factor < 1:
+            self.clear()
+        else:
+            self.extend(list(self) * (factor - 1))
+        return self
+
+    def __mul__(self, factor: int) -> ColumnConsecution:
+        e = self.copy()
+        e *= factor
+        return e
+
+    # ###################################################################### #
+    #                           private methods                              #
+    # ###################################################################### #
+
+    def _get_row_index(self, index: typing.SupportsIndex) -> int:
+        row_index = operator.index(index)
+        if row_index < 0:
+            row_index += len(self)
+        if not 0 <= row_index < len(self):
+            raise IndexError("list index out of range")
+        return row_index
+
+    def _to_row(
+        self, event: core_events.Chronon
+    ) -> tuple[float, tuple[typing.Any, ...], typing.Optional[dict[str, typing.Any]]]:
+        if isinstance(event, _ChrononView):
+            parameter_dict = event._parameter_dict
+        elif type(event) is core_events.Chronon:
+            parameter_dict = {
+                parameter_name: value
+                for parameter_name, value in event._get_attribute_dict().items()
+                if value is not None
+                and (parameter_name[0] != "_" or parameter_name in ("_tempo", "_tag"))
+            }
+        else:
+            raise TypeError(
+                f"'{type(self).__name__}' can only host objects of type "
+                f"'Chronon', but got '{event}' of type '{type(event).__name__}'."
+            )
+        column_value_tuple = tuple(
+            parameter_dict.pop(parameter_name, None)
+            for parameter_name in self._parameter_name_tuple
+        )
+        return event.duration.beat_count, column_value_tuple, parameter_dict or None
+
+    def _to_columns(
+        self, event_iterable: typing.Iterable[core_events.Chronon]
+    ) -> tuple[
+        tuple[float, ...],
+        tuple[tuple[typing.Any, ...], ...],
+        tuple[typing.Optional[dict[str, typing.Any]], ...],
+    ]:
+        # Convert all events before changing any column: 'event_iterable'
+        # may iterate over ourselves.
+        row_tuple = tuple(self._to_row(e) for e in event_iterable)
+        if not row_tuple:
+            return (), tuple(() for _ in self._parameter_name_tuple), ()
+        durf_tuple, column_value_tuple_tuple, extra_tuple = zip(*row_tuple)
+        return durf_tuple, tuple(zip(*column_value_tuple_tuple)), extra_tuple
+
+    def _cow_copy(self) -> ColumnConsecution:
+        # Our children only exist as views on our columns and can't be
+        # shared. But copying plain column values is already cheap.
+        return core_utilities.MutwoObject.copy(self)
+
+    def _is_shareable(self) -> bool:
+        # Our views don't tell us if they are handed out.
+        return False
+
+    def _get_duration_key(self) -> tuple[tuple[float, ...], tuple[type, ...]]:
+        # Durations are stored as floats, so they are all 'DirectDuration'.
+        return tuple(self._durf_array), ()
+
+    def _tag_to_index(self, tag: str) -> int:
+        # Tags are stored in our columns and can be changed without
+        # noticing us, so we can't keep a tag index.
+        for i, e in enumerate(self):
+            if tag == e.tag:
+                return i
+        raise KeyError(f"No event found with tag = '{tag}'.")
+
+    def _set_parameter(  # type: ignore
+        self,
+        parameter_name: str,
+        object_or_function: typing.Callable[[typing.Any], typing.Any] | typing.Any,
+        set_unassigned_parameter: bool,
+        id_set: set[int],
+    ) -> ColumnConsecution:
+        # Our chronons are never shared, so we can ignore 'id_set' and
+        # directly change the columns.
+        is_function = hasattr(object_or_function, "__call__")
+        if parameter_name == "duration":
+            durf_array = self._durf_array
+            for i, durf in enumerate(durf_array):
+                duration = (
+                    object_or_function(core_parameters.DirectDuration(durf))
+                    if is_function
+                    else object_or_function
+                )
+                durf_array[i] = core_parameters.abc.Duration.from_any(
+                    duration
+                ).beat_count
+        elif (column := self._column_dict.get(parameter_name)) is not None:
+            for i, value in enumerate(column):
+                if set_unassigned_parameter or value is not None:
+                    column[i] = (
+                        object_or_function(value) if is_function else object_or_function
+                    )
+        else:
+            for e in self:
+                e._set_parameter(
+                    parameter_name, object_or_function, set_unassigned_parameter, id_set
+                )
+        return self
+
+    def _mutate_parameter(  # type: ignore
+        self,
+        parameter_name: str,
+        function: typing.Callable[[typing.Any], None] | typing.Any,
+        id_set: set[int],
+    ) -> ColumnConsecution:
+        if parameter_name == "duration":
+            durf_array = self._durf_array
+            for i, durf in enumerate(durf_array):
+                function(duration := core_parameters.DirectDuration(durf))
+                durf_array[i] = duration.beat_count
+        elif (column := self._column_dict.get(parameter_name)) is not None:
+            for value in column:
+                if value is not None:
+                    function(value)
+        else:
+            for e in self:
+                e._mutate_parameter(parameter_name, function, id_set)
+        return self
+
+    # ###################################################################### #
+    #                           properties                                   #
+    # ###################################################################### #
+
+    @core_events.Consecution.duration.getter
+    def duration(self) -> core_parameters.abc.Duration:
+        return core_parameters.DirectDuration(self._abstf_tuple_and_dur[1])
+
+    @property
+    def parameter_name_tuple(self) -> tuple[str, ...]:
+        """Names of all parameters which are stored in their own column."""
+        return self._parameter_name_tuple
+
+    # ###################################################################### #
+    #                           public methods                               #
+    # ###################################################################### #
+
+    def append(self, event: core_events.Chronon):
+        self.insert(len(self), event)
+
+    def extend(self, event: typing.Iterable[core_events.Chronon]):
+        durf_tuple, column_value_tuple_tuple, extra_tuple = self._to_columns(event)
+        self._durf_array.extend(durf_tuple)
+        for column, column_value_tuple in zip(
+            self._column_dict.values(), column_value_tuple_tuple
+        ):
+            column.extend(column_value_tuple)
+        self._extra_list.extend(extra_tuple)
+
+    def insert(self, index: int, event: core_events.Chronon):
+        durf, column_value_tuple, extra = self._to_row(event)
+        self._durf_array.insert(index, durf)
+        for column, column_value in zip(self._column_dict.values(), column_value_tuple):
+            column.insert(index, column_value)
+        self._extra_list.insert(index, extra)
+
+    def pop(self, index: int = -1) -> core_events.Chronon:
+        e = self[index].copy()
+        del self[index]
+        return e
+
+    def index(
+        self, event: core_events.Chronon, start: int = 0, stop: int = sys.maxsize
+    ) -> int:
+        for i in range(len(self))[start:stop]:
+            if self[i] == event:
+                return i
+        raise ValueError(f"{event} is not in {type(self).__name__}")
+
+    def count(self, event: core_events.Chronon) -> int:
+        return sum(e == event for e in self)
+
+    def remove(self, event: core_events.Chronon):
+        del self[self.index(event)]
+
+    def clear(self):
+        del self[:]
+
+    def reverse(self):
+        self._durf_array.reverse()
+        for column in self._column_dict.values():
+            column.reverse()
+        self._extra_list.reverse()
+
+    def sort(self, *args, **kwargs):
+        chronon_list = [e.copy() for e in self]
+        chronon_list.sort(*args, **kwargs)
+        self[:] = chronon_list
+
+    def get_parameter(
+        self, parameter_name: str, flat: bool = False, filter_undefined: bool = False
+    ) -> tuple[typing.Any, ...]:
+        if parameter_name == "duration":
+            value_iter = map(core_parameters.DirectDuration, self._durf_array)
+        elif (column := self._column_dict.get(parameter_name)) is not None:
+            value_iter = iter(column)
+        else:
+            return super().get_parameter(parameter_name, flat, filter_undefined)
+        if filter_undefined:
+            value_iter = filter(lambda v: v is not None, value_iter)
+        return tuple(value_iter)
+
+
+class _ChrononView(core_events.Chronon):
+    """A :class:`~mutwo.core_events.Chronon` which represents one row of a
+    :class:`ColumnConsecution`.
+
+    All parameters are read from and written to the columns of the
+    consecution.
+    """
+
+    def __init__(self, column_consecution: ColumnConsecution, index: int):
+        # We can't use 'setattr', because this is redirected to our columns.
+        self.__dict__["_column_consecution"] = column_consecution
+        self.__dict__["_index"] = index
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex):
+        # Copies of a view are independent chronons.
+        chronon = core_events.Chronon(self.duration)
+        for parameter_name, value in self._parameter_dict.items():
+            setattr(chronon, parameter_name, value)
+        return chronon.__reduce_ex__(protocol)
+
+    def __getattr__(self, attribute_name: str) -> typing.Any:
+        # This is only called if no regular attribute is found.
+        if attribute_name[:2] == "__" or attribute_name in (
+            "_column_consecution",
+            "_index",
+        ):
+            raise AttributeError(attribute_name)
+        c, i = self._column_consecution, self._index
+        try:
+            value = c._column_dict[attribute_name][i]
+        except KeyError:
+            value = (c._extra_list[i] or {}).get(attribute_name, None)
+        if value is None:
+            # Each event has a tempo and a tag, they are only 'None'
+            # if they have never been set.
+            if attribute_name in ("_tempo", "_tag"):
+                return None
+            raise AttributeError(
+                f"'Chronon' object has no attribute '{attribute_name}'"
+            )
+        return value
+
+    def __setattr__(self, attribute_name: str, value: typing.Any):
+        # Use properties of 'Chronon' (e.g. 'duration' or 'tempo').
+        if isinstance(getattr(type(self), attribute_name, None), property):
+            return object.__setattr__(self, attribute_name, value)
+        c, i = self._column_consecution, self._index
+        try:
+            c._column_dict[attribute_name][i] = value
+        except KeyError:
+            extra = c._extra_list[i]
+            if value is None:
+                if extra:
+                    extra.pop(attribute_name, None)
+            elif extra is None:
+                c._extra_list[i] = {attribute_name: value}
+            else:
+                extra[attribute_name] = value
+
+    def __dir__(self) -> list[str]:
+        return list(super().__dir__()) + list(self._parameter_dict)
+
+    @property
+    def __cls_name__(self) -> str:
+        return "Chronon"
+
+    def _get_fingerprint(self) -> int:
+        # Our parameters live in the columns, so we can't notice if they
+        # change.
+        return self._compute_fingerprint()
+
+    @property
+    def _parameter_dict(self) -> dict[str, typing.Any]:
+        """All defined parameters of the row except of its duration."""
+        c, i = self._column_consecution, self._index
+        parameter_dict = {
+            parameter_name: value
+            for parameter_name, column in c._column_dict.items()
+            if (value := column[i]) is not None
+        }
+        if extra := c._extra_list[i]:
+            parameter_dict.update(extra)
+        return parameter_dict
+
+    @property
+    def duration(self) -> core_parameters.abc.Duration:
+        return core_parameters.DirectDuration(
+            self._column_consecution._durf_array[self._index]
+        )
+
+    @duration.setter
+    def duration(self, duration: core_parameters.abc.Duration.Type):
+        self._column_consecution._durf_array[
+            self._index
+        ] = core_parameters.abc.Duration.from_any(duration).beat_count
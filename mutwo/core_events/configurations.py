@@ -32,4 +32,17 @@ DEFAULT_DURATION_TO_WHITE_SPACE = lambda duration: __simpleEvent()(duration)
 returns a :class:`mutwo.core_events.Chronon` with the given
 duration."""
 
+COPY_ON_WRITE = False
+"""If set to ``True``, :meth:`mutwo.core_events.abc.Compound.copy` returns
+a copy which shares its children with the original compound. A shared
+child is only copied as soon as it's accessed (e.g. via indexing or
+iteration) from either the original compound or the copy. This makes
+copies of large event trees cheap if only a few children of the copy are
+changed later. Children which the compound already handed out before
+the copy is made (e.g. an event or a parameter which was assigned to a
+variable via indexing or iteration) are copied immediately, so changing
+them never changes the copy. Events which are added to a compound belong
+to it: change them only via the compound afterwards, otherwise the
+change may also show up in copy-on-write copies. Default to ``False``."""
+
 del functools
@@ -26,13 +26,18 @@ import typing
 
 import ranges
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from mutwo import core_constants
 from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import core_utilities
 
 
-__all__ = ("Envelope",)
+__all__ = ("Envelope", "FrozenEnvelope")
 
 T = typing.TypeVar("T", bound=core_events.abc.Event)
 
@@ -62,6 +67,11 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
     value at each `env0.value_at(x) == env1.value_at(x)` for each possible
     `x`). Such a test is not implemented yet.
 
+    Values and integrals are calculated with a cached frozen version of the
+    envelope (see :meth:`freeze`). The cache is dropped as soon as a value,
+    a curve shape or a duration of the envelope's events differs from the
+    ones it was created from.
+
     **Example:**
 
     >>> from mutwo import core_events
@@ -123,6 +133,11 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
             )
         super().__setitem__(index_or_slice, event_or_sequence)  # type: ignore
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = super().__getstate__()
+        state.pop("_frozen_envelope_cache", None)
+        return state
+
     # ###################################################################### #
     #                    private static methods                              #
     # ###################################################################### #
@@ -217,9 +232,10 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         if e_idx is not None:
             e = self[e_idx]
             cs = self.event_to_curve_shape(e)
+            # Any part of an exponential curve is again an exponential
+            # curve, its curve shape is proportional to its duration.
             csx = ((abst - abst_tuple[e_idx]) / e.duration).beat_count * cs
             cs_at_abst = cs - csx
-            self.apply_curve_shape_on_event(e, csx)
         else:
             cs_at_abst = 0
         return cs_at_abst
@@ -299,6 +315,36 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
             point = (abst, self._event_to_value(e), self.event_to_curve_shape(e))
         return point
 
+    # ###################################################################### #
+    #                        private properties                              #
+    # ###################################################################### #
+
+    # Frozen envelopes allow fast evaluation of values and integrals, so we
+    # cache the frozen version of our envelope. Values and curve shapes can
+    # be assigned directly to our events (e.g. 'envelope[0].value = 1'),
+    # which nothing notices. Therefore the cache is only valid as long as
+    # the values, curve shapes and durations, from which it was created,
+    # didn't change. Collecting them is much cheaper than freezing the
+    # envelope again.
+
+    @property
+    def _frozen_envelope(self) -> FrozenEnvelope:
+        key = (
+            self.value_tuple,
+            self.curve_shape_tuple,
+            tuple(e.duration.beat_count for e in self),
+        )
+        try:
+            cached_key, frozen_envelope = self._frozen_envelope_cache
+        except AttributeError:
+            pass
+        else:
+            if cached_key == key:
+                return frozen_envelope
+        frozen_envelope = FrozenEnvelope(self)
+        self._frozen_envelope_cache = (key, frozen_envelope)
+        return frozen_envelope
+
     # ###################################################################### #
     #                         public properties                              #
     # ###################################################################### #
@@ -361,6 +407,26 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         """Create new event object from event type."""
         return self.default_event_class(duration=duration)
 
+    def freeze(self) -> FrozenEnvelope:
+        """Create an immutable copy of the envelope for fast evaluation.
+
+        :raises: :class:`mutwo.core_utilities.EmptyEnvelopeError` if the
+            envelope is empty.
+
+        See :class:`FrozenEnvelope` for more information.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> e = core_events.Envelope([[0, 0], [1, 2]])
+        >>> f = e.freeze()
+        >>> f.value_at(0.5)
+        1.0
+        >>> f.integrate_interval(0, 1)
+        1.0
+        """
+        return self._frozen_envelope
+
     def value_at(self, absolute_time: "core_parameters.abc.Duration.Type") -> Value:
         """Get `value` at `absolute_time`.
 
@@ -396,6 +462,50 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         """
         return self.value_to_parameter(self.value_at(absolute_time))
 
+    def value_at_many(
+        self,
+        absolute_time_sequence: typing.Sequence["core_parameters.abc.Duration.Type"],
+    ) -> tuple[Value, ...]:
+        """Get `value` at each absolute time of `absolute_time_sequence`.
+
+        :param absolute_time_sequence: Absolute positions in time at which values
+            shall be found. This can also be a :class:`numpy.ndarray`.
+        :type absolute_time_sequence: typing.Sequence[core_parameters.abc.Duration.Type]
+        :return: A tuple with one value for each absolute time. If
+            `absolute_time_sequence` is a :class:`numpy.ndarray`, the values
+            are returned in a :class:`numpy.ndarray` of the same shape.
+
+        This is equal to ``tuple(map(envelope.value_at, absolute_time_sequence))``,
+        but much faster if many values are needed (e.g. if an envelope is
+        sampled at control rate), because the envelope is only analysed once.
+        If a :class:`numpy.ndarray` is passed, all values are calculated
+        at once with `numpy`. In this case values can differ due to floating
+        point inaccuracies from the values returned by
+        :meth:`Envelope.value_at`.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> e = core_events.Envelope([[0, 0], [1, 2]])
+        >>> e.value_at_many([0, 0.25, 0.5, 2])
+        (0, 0.5, 1.0, 2)
+        """
+        return self._frozen_envelope.value_at_many(absolute_time_sequence)
+
+    def parameter_at_many(
+        self,
+        absolute_time_sequence: typing.Sequence["core_parameters.abc.Duration.Type"],
+    ) -> tuple[typing.Any, ...]:
+        """Get `parameter` at each absolute time of `absolute_time_sequence`.
+
+        :param absolute_time_sequence: Absolute positions in time at which
+            parameters shall be found. This can also be a :class:`numpy.ndarray`.
+        :type absolute_time_sequence: typing.Sequence[core_parameters.abc.Duration.Type]
+
+        See :meth:`Envelope.value_at_many` for more information.
+        """
+        return self._frozen_envelope.parameter_at_many(absolute_time_sequence)
+
     def curve_shape_at(
         self, absolute_time: "core_parameters.abc.Duration.Type"
     ) -> float:
@@ -468,6 +578,11 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         # given point in time.
         if abst not in abst_tuple:
             p = self._point_at(abst, abst_tuple, dur)
+            # The curve of the event at 'abst' now ends at our new point.
+            e_idx = self._get_index_at_from_absolute_time_tuple(abst, abst_tuple, dur)
+            if e_idx is not None:
+                e = self[e_idx]
+                self.apply_curve_shape_on_event(e, self.event_to_curve_shape(e) - p[2])
             e = self._make_event(
                 find_dur(abst, abst_tuple), self.value_to_parameter(p[1]), p[2]
             )
@@ -519,6 +634,11 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         for t, ev in zip(abst_tuple[i0:i1], self[i0:i1]):
             plist.append((t, self._event_to_value(ev), self.event_to_curve_shape(ev)))
         if last_point is not None:
+            # The curve of the previous point ends at 'end' now and
+            # not at the next control point anymore.
+            if plist and i1 < len(abst_tuple):
+                t, v, cs = plist[-1]
+                plist[-1] = (t, v, cs * ((end - t) / (abst_tuple[i1] - t)).beat_count)
             plist.append(last_point)
         return tuple(plist)
 
@@ -537,31 +657,7 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
         if start == end:
             return 0
-
-        point_tuple = self.time_range_to_point_tuple(ranges.Range(start, end))
-        integral = 0
-        for p0, p1 in zip(point_tuple, point_tuple[1:]):
-            t0, v0, cchr0 = p0  # (absolute_time, value, curve_shape)
-            t1, v1, _ = p1
-            if (d0 := float(t1 - t0)) > 0:
-                if cchr0 != 0:
-                    # See https://git.sr.ht/~marcevanstein/expenvelope/tree/cd4a3710/item/expenvelope/envelope_segment.py#L102-103
-                    A = v0 - (v1 - v0) / (math.exp(cchr0) - 1)
-                    B = (v1 - v0) / (cchr0 * (math.exp(cchr0) - 1))
-
-                    def antiderivative(tn):
-                        # See https://git.sr.ht/~marcevanstein/expenvelope/tree/cd4a3710/item/expenvelope/envelope_segment.py#L239
-                        return A * tn + B * math.exp(cchr0 * tn)
-
-                    a0, a1 = (antiderivative(i) for i in (0, 1))
-                    integral += d0 * (a1 - a0)
-                else:  # linear interpolation
-                    diff = v1 - v0 if v1 > v0 else v0 - v1
-                    square = d0 * min((v0, v1))
-                    triangle = 0.5 * d0 * diff
-                    integral += square + triangle
-
-        return float(integral)
+        return self._frozen_envelope.integrate_interval(start, end)
 
     def get_average_value(
         self,
@@ -636,6 +732,7 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
         start, end = (core_parameters.abc.Duration.from_any(o) for o in (start, end))
         # _assert_correct_start_and_end_values and _assert_valid_absolute_time
         # is called when super().cut_out is called later.
+        self._copy_interned_chronons()
 
         self.sample_at(start, append_duration=end - start)
         self.sample_at(end)
@@ -745,3 +842,335 @@ class Envelope(core_events.Consecution, typing.Generic[T]):
                 add(s, v)
 
         return segment_tuple
+
+
+class FrozenEnvelope(core_utilities.MutwoObject):
+    """Immutable and fast to evaluate version of an :class:`Envelope`.
+
+    :param envelope: The envelope which shall be frozen.
+    :type envelope: Envelope
+    :raises: :class:`mutwo.core_utilities.EmptyEnvelopeError` if the
+        envelope is empty.
+
+    A :class:`FrozenEnvelope` is usually created via :meth:`Envelope.freeze`.
+    All start times, values, curve shapes and the integral of each segment
+    between two control points are calculated once when freezing the
+    envelope. Therefore :meth:`value_at`, :meth:`integrate_interval` and
+    :meth:`get_average_value` only need a binary search and some float
+    arithmetic. Later changes of the original envelope aren't reflected by
+    the frozen envelope.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> e = core_events.Envelope([[0, 1], [2, 0]]).freeze()
+    >>> e.value_at(1)
+    0.5
+    >>> e.get_average_value(0.5, 1)
+    0.625
+    """
+
+    __slots__ = (
+        "_abstf_tuple",
+        "_abstf_last",
+        "_durf",
+        "_value_tuple",
+        "_segment_tuple",
+        "_integral_tuple",
+        "_value_to_parameter",
+    )
+
+    def __init__(self, envelope: Envelope):
+        if not envelope:
+            raise core_utilities.EmptyEnvelopeError(envelope, "freeze")
+        abst_tuple, dur = envelope._abst_tuple_and_dur
+        self._abstf_tuple = abstf_tuple = tuple(map(float, abst_tuple))
+        self._durf = float(dur)
+        # See comment in 'Envelope._value_at'.
+        self._abstf_last = abstf_tuple[-1] if envelope[-1].duration > 0 else self._durf
+        self._value_tuple = value_tuple = envelope.value_tuple
+        self._value_to_parameter = envelope.value_to_parameter
+        # Constants of each segment between two neighbouring control points
+        # and the integral of the envelope from 0 until each control point.
+        segment_list, integral_list = [], [0.0]
+        for t0, t1, v0, v1, cs in zip(
+            abstf_tuple,
+            abstf_tuple[1:],
+            value_tuple,
+            value_tuple[1:],
+            envelope.curve_shape_tuple,
+        ):
+            t_span, v_span = t1 - t0, v1 - v0
+            if cs:
+                f = v_span / (math.exp(cs) - 1)
+                # Antiderivative is 'a * x + b * exp(cs * x)', see
+                # https://git.sr.ht/~marcevanstein/expenvelope/tree/cd4a3710/item/expenvelope/envelope_segment.py#L102-103
+                a, b = v0 - f, v_span / (cs * (math.exp(cs) - 1))
+            else:
+                f, a, b = 0, 0, 0
+            segment = (t0, t_span, v0, v_span, cs, f, a, b)
+            segment_list.append(segment)
+            integral_list.append(
+                integral_list[-1] + FrozenEnvelope._integrate_segment(segment, 0, 1)
+            )
+        self._segment_tuple = tuple(segment_list)
+        self._integral_tuple = tuple(integral_list)
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    @staticmethod
+    def _integrate_segment(segment: tuple, x0: float, x1: float) -> float:
+        # Integrate segment between relative positions x0 and x1 (0 <= x <= 1).
+        t0, t_span, v0, v_span, cs, _, a, b = segment
+        if t_span <= 0:
+            return 0.0
+        if cs:
+            exp = math.exp
+            return t_span * ((a * x1 + b * exp(cs * x1)) - (a * x0 + b * exp(cs * x0)))
+        # Linear: mean of start and end value multiplied by duration
+        return t_span * (x1 - x0) * (v0 + v_span * 0.5 * (x0 + x1))
+
+    def _value_at(self, abstf: float) -> Envelope.Value:
+        if abstf <= self._abstf_tuple[0]:
+            return self._value_tuple[0]
+        if abstf >= self._abstf_last:
+            return self._value_tuple[-1]
+        t0, t_span, v0, v_span, cs, f, _, _ = self._segment_tuple[
+            bisect.bisect_right(self._abstf_tuple, abstf) - 1
+        ]
+        # Equal to 'core_utilities.scale'
+        percentage = (abstf - t0) / t_span
+        if cs:
+            return f * (math.exp(cs * percentage) - 1) + v0
+        return v_span * percentage + v0
+
+    def _integral_at(self, abstf: float) -> float:
+        # Integral of the envelope from 0 until 'abstf'.
+        abstf_tuple = self._abstf_tuple
+        if abstf <= abstf_tuple[0]:
+            return self._value_tuple[0] * (abstf - abstf_tuple[0])
+        if abstf >= self._abstf_last:
+            return self._integral_tuple[-1] + self._value_tuple[-1] * (
+                abstf - abstf_tuple[-1]
+            )
+        index = bisect.bisect_right(abstf_tuple, abstf) - 1
+        segment = self._segment_tuple[index]
+        return self._integral_tuple[index] + self._integrate_segment(
+            segment, 0, (abstf - segment[0]) / segment[1]
+        )
+
+    def _integral_at_sorted(
+        self, abstf_iterable: typing.Iterable[float]
+    ) -> typing.Iterator[float]:
+        # Same as '_integral_at', but for ascending absolute times we
+        # don't need a binary search: we simply walk once through our
+        # segments and carry the current segment forward.
+        abstf_tuple, integral_tuple, segment_tuple = (
+            self._abstf_tuple,
+            self._integral_tuple,
+            self._segment_tuple,
+        )
+        abstf_first, abstf_last = abstf_tuple[0], self._abstf_last
+        index, index_max = 0, len(segment_tuple) - 1
+        for abstf in abstf_iterable:
+            if abstf <= abstf_first or abstf >= abstf_last:
+                yield self._integral_at(abstf)
+                continue
+            if abstf < abstf_tuple[index]:  # Times aren't sorted: start again
+                index = 0
+            while index < index_max and abstf_tuple[index + 1] <= abstf:
+                index += 1
+            segment = segment_tuple[index]
+            yield integral_tuple[index] + self._integrate_segment(
+                segment, 0, (abstf - segment[0]) / segment[1]
+            )
+
+    def _value_at_many_numpy(self, absolute_time_array: np.ndarray) -> np.ndarray:
+        abstf_array = np.round(
+            absolute_time_array.astype(float),
+            core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS,
+        )
+        value_array = np.full(abstf_array.shape, float(self._value_tuple[0]))
+        if not self._segment_tuple:
+            return value_array
+        is_first = abstf_array <= self._abstf_tuple[0]
+        is_last = ~is_first & (abstf_array >= self._abstf_last)
+        value_array[is_last] = self._value_tuple[-1]
+        is_between = ~(is_first | is_last)
+        abstf_array = abstf_array[is_between]
+        index_array = np.searchsorted(self._abstf_tuple, abstf_array, side="right") - 1
+        t0, t_span, v0, v_span, cs, f, _, _ = (
+            a[index_array] for a in np.array(self._segment_tuple, dtype=float).T
+        )
+        percentage = (abstf_array - t0) / t_span
+        value_array[is_between] = (
+            np.where(cs != 0, f * (np.exp(cs * percentage) - 1), v_span * percentage)
+            + v0
+        )
+        return value_array
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def duration(self) -> core_parameters.DirectDuration:
+        """The duration of the frozen envelope."""
+        return core_parameters.DirectDuration(self._durf)
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def value_at(
+        self, absolute_time: "core_parameters.abc.Duration.Type"
+    ) -> Envelope.Value:
+        """Get `value` at `absolute_time`.
+
+        :param absolute_time: Absolute position in time at which value shall be found.
+        :type absolute_time: core_parameters.abc.Duration.Type
+
+        See :meth:`Envelope.value_at` for more information.
+        """
+        return self._value_at(_to_abstf(absolute_time))
+
+    def parameter_at(
+        self, absolute_time: "core_parameters.abc.Duration.Type"
+    ) -> typing.Any:
+        """Get `parameter` at `absolute_time`.
+
+        :param absolute_time: Absolute position in time at which parameter
+            shall be found.
+        :type absolute_time: core_parameters.abc.Duration.Type
+        """
+        return self._value_to_parameter(self.value_at(absolute_time))
+
+    def value_at_many(
+        self,
+        absolute_time_sequence: typing.Sequence["core_parameters.abc.Duration.Type"],
+    ) -> tuple[Envelope.Value, ...]:
+        """Get `value` at each absolute time of `absolute_time_sequence`.
+
+        :param absolute_time_sequence: Absolute positions in time at which values
+            shall be found. This can also be a :class:`numpy.ndarray`.
+        :type absolute_time_sequence: typing.Sequence[core_parameters.abc.Duration.Type]
+
+        See :meth:`Envelope.value_at_many` for more information.
+        """
+        if np is not None and isinstance(absolute_time_sequence, np.ndarray):
+            return self._value_at_many_numpy(absolute_time_sequence)
+        return tuple(self._value_at(_to_abstf(t)) for t in absolute_time_sequence)
+
+    def parameter_at_many(
+        self,
+        absolute_time_sequence: typing.Sequence["core_parameters.abc.Duration.Type"],
+    ) -> tuple[typing.Any, ...]:
+        """Get `parameter` at each absolute time of `absolute_time_sequence`.
+
+        :param absolute_time_sequence: Absolute positions in time at which
+            parameters shall be found. This can also be a :class:`numpy.ndarray`.
+        :type absolute_time_sequence: typing.Sequence[core_parameters.abc.Duration.Type]
+        """
+        value_sequence = self.value_at_many(absolute_time_sequence)
+        if np is not None and isinstance(value_sequence, np.ndarray):
+            value_sequence = value_sequence.ravel().tolist()
+        return tuple(map(self._value_to_parameter, value_sequence))
+
+    def integrate_interval(
+        self,
+        start: "core_parameters.abc.Duration.Type",
+        end: "core_parameters.abc.Duration.Type",
+    ) -> float:
+        """Integrate envelope above given interval.
+
+        :param start: Beginning of integration interval.
+        :type start: core_parameters.abc.Duration.Type
+        :param end: End of integration interval.
+        :type end: core_parameters.abc.Duration.Type
+        """
+        abstf0, abstf1 = _to_abstf(start), _to_abstf(end)
+        if abstf0 == abstf1:
+            return 0
+        return float(self._integral_at(abstf1) - self._integral_at(abstf0))
+
+    def integrate_consecutive_intervals(
+        self,
+        absolute_time_sequence: typing.Sequence["core_parameters.abc.Duration.Type"],
+    ) -> tuple[float, ...]:
+        """Integrate envelope above each pair of neighbouring absolute times.
+
+        :param absolute_time_sequence: The borders of the integration
+            intervals. The first interval starts at the first absolute time
+            and ends at the second one, the second interval starts at the
+            second absolute time and ends at the third one and so on.
+        :type absolute_time_sequence: typing.Sequence[core_parameters.abc.Duration.Type]
+
+        This is equal to calling :meth:`integrate_interval` for each
+        interval, but if the absolute times are sorted the frozen envelope
+        is only walked once (and no binary search is needed).
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> e = core_events.Envelope([[0, 1], [2, 0]]).freeze()
+        >>> e.integrate_consecutive_intervals([0, 1, 2, 3])
+        (0.75, 0.25, 0.0)
+        """
+        abstf_tuple = tuple(map(_to_abstf, absolute_time_sequence))
+        integral_tuple = tuple(self._integral_at_sorted(abstf_tuple))
+        return tuple(
+            0 if abstf0 == abstf1 else float(integral1 - integral0)
+            for abstf0, abstf1, integral0, integral1 in zip(
+                abstf_tuple, abstf_tuple[1:], integral_tuple, integral_tuple[1:]
+            )
+        )
+
+    def get_average_value(
+        self,
+        start: typing.Optional["core_parameters.abc.Duration.Type"] = None,
+        end: typing.Optional["core_parameters.abc.Duration.Type"] = None,
+    ) -> Envelope.Value:
+        """Find average `value` in given interval.
+
+        :param start: The beginning of the interval. If set to `None` this
+            is set to 0. Default to `None`.
+        :type start: typing.Optional[core_parameters.abc.Duration.Type]
+        :param end: The end of the interval. If set to `None` this
+            is set to the duration of the envelope. Default to `None`.
+        :type end: typing.Optional[core_parameters.abc.Duration.Type]
+        """
+        abstf0 = 0.0 if start is None else _to_abstf(start)
+        abstf1 = self._durf if end is None else _to_abstf(end)
+        if (durf := abstf1 - abstf0) == 0:
+            self._logger.warning(core_utilities.InvalidAverageValueStartAndEndWarning())
+            return self._value_at(abstf0)
+        return self.integrate_interval(abstf0, abstf1) / durf
+
+    def get_average_parameter(
+        self,
+        start: typing.Optional["core_parameters.abc.Duration.Type"] = None,
+        end: typing.Optional["core_parameters.abc.Duration.Type"] = None,
+    ) -> typing.Any:
+        """Find average `parameter` in given interval.
+
+        :param start: The beginning of the interval. If set to `None` this
+            is set to 0. Default to `None`.
+        :type start: typing.Optional[core_parameters.abc.Duration.Type]
+        :param end: The end of the interval. If set to `None` this
+            is set to the duration of the envelope. Default to `None`.
+        :type end: typing.Optional[core_parameters.abc.Duration.Type]
+        """
+        return self._value_to_parameter(self.get_average_value(start, end))
+
+
+def _to_abstf(absolute_time: "core_parameters.abc.Duration.Type") -> float:
+    # Same as 'core_parameters.abc.Duration.from_any(absolute_time).beat_count',
+    # but faster for the most common types.
+    if isinstance(absolute_time, (float, int)):
+        return round(
+            float(absolute_time),
+            core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS,
+        )
+    return core_parameters.abc.Duration.from_any(absolute_time).beat_count
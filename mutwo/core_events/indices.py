@@ -0,0 +1,452 @@
+# This file is part of mutwo, ecosystem for time-based arts.
+#
+# Copyright (C) 2020-2024
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Indices for fast time based queries of nested events."""
+
+from __future__ import annotations
+
+import bisect
+import typing
+
+from mutwo import core_events
+from mutwo import core_parameters
+from mutwo import core_utilities
+
+
+__all__ = ("IntervalIndex",)
+
+IndexTuple: typing.TypeAlias = tuple[int, ...]
+
+
+def _get_item_key(item: IntervalIndex.Item) -> tuple[float, IndexTuple]:
+    # Sort items by their start time and position, so that the order
+    # doesn't depend on how the items were found.
+    return item.start, item.index_tuple
+
+
+class _Level(object):
+    # A sorted part of an 'IntervalIndex'. Its items are sorted by their
+    # start time and an implicit binary tree holds the latest end time of
+    # all items below each of its nodes. Items can't be added, but they
+    # can be removed: they are replaced by 'None' and their end time is
+    # removed from the tree.
+
+    __slots__ = ("item_list", "start_list", "size", "max_end_tree", "alive_count")
+
+    def __init__(self, item_list: list[IntervalIndex.Item]):
+        item_list.sort(key=_get_item_key)
+        self.item_list = item_list
+        self.start_list = [item.start for item in item_list]
+        self.alive_count = len(item_list)
+        size = 1
+        while size < len(item_list):
+            size *= 2
+        self.size = size
+        tree = [float("-inf")] * (2 * size)
+        for i, item in enumerate(item_list):
+            tree[size + i] = item.end
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.max_end_tree = tree
+
+    def remove(self, position: int):
+        self.item_list[position] = None
+        self.alive_count -= 1
+        tree = self.max_end_tree
+        node = self.size + position
+        tree[node] = float("-inf")
+        while node := node // 2:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+    def find_ending_after(self, index_end: int, absolute_time: float) -> list[int]:
+        # Return the positions (smaller than 'index_end') of all items which
+        # end after 'absolute_time'. Subtrees whose latest end time is
+        # earlier are skipped.
+        tree, size = self.max_end_tree, self.size
+        position_list, node_stack = [], [(1, 0, size)]
+        while node_stack:
+            node, lo, hi = node_stack.pop()
+            if lo >= index_end or tree[node] <= absolute_time:
+                continue
+            if node >= size:
+                position_list.append(lo)
+                continue
+            mid = (lo + hi) // 2
+            node_stack.append((2 * node + 1, mid, hi))
+            node_stack.append((2 * node, lo, mid))
+        return position_list
+
+
+class IntervalIndex(core_utilities.MutwoObject):
+    """Find all chronons of a compound which sound at a given time.
+
+    :param compound: The event which shall be indexed.
+    :type compound: core_events.abc.Compound
+
+    The index stores the start and end time of each chronon of the
+    compound, sorted by their start times. An implicit binary tree
+    over these intervals knows the latest end time of each group of
+    intervals. So all chronons which sound in a given time range can be
+    found in `O(log n + k)`, where `n` is the number of chronons in the
+    compound and `k` the number of found chronons.
+
+    The index doesn't notice if the compound is changed. After changes call
+    :meth:`update` with the index sequence of the changed event (this only
+    re-indexes the changed event and the events it moved in time) or
+    :meth:`rebuild` to re-index the complete compound. :meth:`update` keeps
+    the re-indexed chronons in additional smaller sorted parts, which are
+    merged when they grow, so that there are at most `log n` of them.
+    Until the next :meth:`rebuild` queries then take `O(log² n + k log k)`.
+
+    **Example:**
+
+    >>> from mutwo import core_events
+    >>> cnc = core_events.Concurrence(
+    ...     [
+    ...         core_events.Consecution(
+    ...             [core_events.Chronon(2, tag="a"), core_events.Chronon(2, tag="b")]
+    ...         ),
+    ...         core_events.Consecution([core_events.Chronon(3, tag="c")]),
+    ...     ]
+    ... )
+    >>> index = core_events.IntervalIndex(cnc)
+    >>> [item.chronon.tag for item in index.stab(2.5)]
+    ['c', 'b']
+    >>> [item.index_tuple for item in index.overlap(0, 1)]
+    [(0, 0), (1, 0)]
+    """
+
+    class Item(typing.NamedTuple):
+        """A chronon of the indexed compound."""
+
+        start: float
+        """Absolute start time of the chronon."""
+        end: float
+        """Absolute end time of the chronon."""
+        index_tuple: IndexTuple
+        """Position of the chronon inside the indexed compound."""
+        chronon: core_events.Chronon
+        """The indexed chronon."""
+
+    def __init__(self, compound: core_events.abc.Compound):
+        self._compound = compound
+        self.rebuild()
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    @staticmethod
+    def _round(absolute_time: float) -> float:
+        return core_utilities.round_floats(
+            absolute_time, core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS
+        )
+
+    @staticmethod
+    def _walk(
+        event: core_events.abc.Event,
+        absolute_time: float,
+        index_tuple: IndexTuple,
+        item_list: list[IntervalIndex.Item],
+        start_dict: dict[IndexTuple, float],
+        child_count_dict: dict[IndexTuple, int],
+    ):
+        start_dict[index_tuple] = absolute_time
+        match event:
+            case core_events.Consecution():
+                child_count_dict[index_tuple] = len(event)
+                for i, (t, e) in enumerate(
+                    zip(event.absolute_time_in_floats_tuple, event)
+                ):
+                    IntervalIndex._walk(
+                        e,
+                        IntervalIndex._round(absolute_time + t),
+                        index_tuple + (i,),
+                        item_list,
+                        start_dict,
+                        child_count_dict,
+                    )
+            case core_events.Concurrence():
+                child_count_dict[index_tuple] = len(event)
+                for i, e in enumerate(event):
+                    IntervalIndex._walk(
+                        e,
+                        absolute_time,
+                        index_tuple + (i,),
+                        item_list,
+                        start_dict,
+                        child_count_dict,
+                    )
+            case core_events.Chronon():
+                item_list.append(
+                    IntervalIndex.Item(
+                        absolute_time,
+                        IntervalIndex._round(absolute_time + event.duration.beat_count),
+                        index_tuple,
+                        event,
+                    )
+                )
+            case _:
+                raise TypeError(
+                    f"Can't index object '{event}' of type '{type(event)}'."
+                )
+
+    def _iter_index_tuples(
+        self, index_tuple: IndexTuple
+    ) -> typing.Iterator[IndexTuple]:
+        # Yield 'index_tuple' and the index tuples of all events inside of
+        # it, as they were when they were indexed.
+        child_count_dict, index_tuple_list = self._child_count_dict, [index_tuple]
+        while index_tuple_list:
+            index_tuple = index_tuple_list.pop()
+            index_tuple_list.extend(
+                index_tuple + (i,) for i in range(child_count_dict.get(index_tuple, 0))
+            )
+            yield index_tuple
+
+    def _add(self, item_list: list[IntervalIndex.Item]):
+        # Add items as a new level. Like the digits of a binary counter,
+        # levels are merged with all smaller levels, so that there are at
+        # most 'log n' levels and each item is sorted again at most 'log n'
+        # times until it's removed.
+        level_list = self._level_list
+        while level_list and level_list[-1].alive_count <= len(item_list):
+            item_list.extend(filter(None, level_list.pop().item_list))
+        if item_list:
+            level_list.append(level := _Level(item_list))
+            self._location_dict.update(
+                (item.index_tuple, (level, position))
+                for position, item in enumerate(level.item_list)
+            )
+
+    def _remove(self, index_tuple: IndexTuple) -> typing.Optional[IntervalIndex.Item]:
+        if (location := self._location_dict.pop(index_tuple, None)) is None:
+            return None  # no chronon
+        level, position = location
+        item = level.item_list[position]
+        level.remove(position)
+        return item
+
+    def _get_relative_start(self, parent_index_tuple: IndexTuple, index: int) -> float:
+        parent = self._compound.get_event_from_index_sequence(parent_index_tuple)
+        if isinstance(parent, core_events.Consecution):
+            return parent.absolute_time_in_floats_tuple[index]
+        return 0.0
+
+    def _find_ending_after(
+        self,
+        find_index_end: typing.Callable[[list[float], float], int],
+        time_end: float,
+        absolute_time: float,
+    ) -> tuple[IntervalIndex.Item, ...]:
+        # Return all items which start before 'time_end' (the position of
+        # their end is found by 'find_index_end') and end after
+        # 'absolute_time'.
+        item_list = []
+        for level in self._level_list:
+            level_item_list = level.item_list
+            item_list.extend(
+                level_item_list[i]
+                for i in level.find_ending_after(
+                    find_index_end(level.start_list, time_end), absolute_time
+                )
+            )
+        if len(self._level_list) > 1:
+            item_list.sort(key=_get_item_key)
+        return tuple(item_list)
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def compound(self) -> core_events.abc.Compound:
+        """The indexed compound."""
+        return self._compound
+
+    # ###################################################################### #
+    #                           public methods                               #
+    # ###################################################################### #
+
+    def rebuild(self) -> IntervalIndex:
+        """Index the complete compound again."""
+        item_list: list[IntervalIndex.Item] = []
+        self._start_dict: dict[IndexTuple, float] = {}
+        self._child_count_dict: dict[IndexTuple, int] = {}
+        self._walk(
+            self._compound,
+            0.0,
+            (),
+            item_list,
+            self._start_dict,
+            self._child_count_dict,
+        )
+        self._level_list: list[_Level] = []
+        self._location_dict: dict[IndexTuple, tuple[_Level, int]] = {}
+        self._add(item_list)
+        return self
+
+    def update(self, index_sequence: typing.Sequence[int] = ()) -> IntervalIndex:
+        """Index the event at `index_sequence` again.
+
+        :param index_sequence: The position of the changed event inside
+            the compound (see
+            :meth:`~mutwo.core_events.abc.Compound.get_event_from_index_sequence`).
+            The event must contain all changes, so if children were added
+            or removed, this needs to be the index sequence of their parent.
+            Default to ``()`` (the complete compound).
+        :type index_sequence: typing.Sequence[int]
+
+        Only the changed event is walked again. If its duration changed,
+        all events which follow it inside a :class:`Consecution` are moved
+        in time. Only the chronons of these events are removed from the
+        index and added again, the other chronons aren't sorted again.
+
+        **Example:**
+
+        >>> from mutwo import core_events
+        >>> cns = core_events.Consecution(
+        ...     [core_events.Chronon(1, tag="a"), core_events.Chronon(1, tag="b")]
+        ... )
+        >>> index = core_events.IntervalIndex(cns)
+        >>> cns[0].duration = 3
+        >>> [item.chronon.tag for item in index.update([0]).stab(2.5)]
+        ['a']
+        """
+        index_tuple = tuple(index_sequence)
+        if not index_tuple:
+            return self.rebuild()
+        start_dict, child_count_dict = self._start_dict, self._child_count_dict
+        start = self._round(
+            start_dict[index_tuple[:-1]]
+            + self._get_relative_start(index_tuple[:-1], index_tuple[-1])
+        )
+        for key in self._iter_index_tuples(index_tuple):
+            start_dict.pop(key, None)
+            child_count_dict.pop(key, None)
+            self._remove(key)
+        item_list: list[IntervalIndex.Item] = []
+        self._walk(
+            self._compound.get_event_from_index_sequence(index_tuple),
+            start,
+            index_tuple,
+            item_list,
+            start_dict,
+            child_count_dict,
+        )
+        # The start of all events which follow our event inside a
+        # Consecution may have changed. Each of them is inside only one
+        # of these Consecutions, so it's moved at most once.
+        for i in range(len(index_tuple)):
+            parent_index_tuple = index_tuple[:i]
+            parent = self._compound.get_event_from_index_sequence(parent_index_tuple)
+            if not isinstance(parent, core_events.Consecution):
+                continue
+            parent_start = start_dict[parent_index_tuple]
+            for j in range(index_tuple[i] + 1, len(parent)):
+                sibling_index_tuple = parent_index_tuple + (j,)
+                if (old_start := start_dict.get(sibling_index_tuple)) is None:
+                    continue
+                if not (
+                    delta := self._round(
+                        parent_start + parent.absolute_time_in_floats_tuple[j]
+                    )
+                    - old_start
+                ):
+                    continue
+                for key in self._iter_index_tuples(sibling_index_tuple):
+                    start_dict[key] = self._round(start_dict[key] + delta)
+                    if (item := self._remove(key)) is not None:
+                        item_list.append(
+                            item._replace(
+                                start=self._round(item.start + delta),
+                                end=self._round(item.end + delta),
+                            )
+                        )
+        # Levels with many removed items are merged again, so that removed
+        # items don't pile up.
+        for level in [
+            level
+            for level in self._level_list
+            if level.alive_count * 2 < len(level.item_list)
+        ]:
+            self._level_list.remove(level)
+            item_list.extend(filter(None, level.item_list))
+        self._add(item_list)
+        return self
+
+    def overlap(
+        self,
+        start: core_parameters.abc.Duration.Type,
+        end: core_parameters.abc.Duration.Type,
+    ) -> tuple[IntervalIndex.Item, ...]:
+        """Find all chronons which sound between `start` and `end`.
+
+        :param start: The start of the time range.
+        :type start: core_parameters.abc.Duration.Type
+        :param end: The end of the time range.
+        :type end: core_parameters.abc.Duration.Type
+
+        A chronon sounds between `start` and `end` if it starts before
+        `end` and ends after `start`. The chronons are sorted by their
+        start time and their position.
+        """
+        startf, endf = (
+            core_parameters.abc.Duration.from_any(t).beat_count for t in (start, end)
+        )
+        return self._find_ending_after(bisect.bisect_left, endf, startf)
+
+    def stab(
+        self, absolute_time: core_parameters.abc.Duration.Type
+    ) -> tuple[IntervalIndex.Item, ...]:
+        """Find all chronons which sound at `absolute_time`.
+
+        :param absolute_time: The requested time.
+        :type absolute_time: core_parameters.abc.Duration.Type
+
+        A chronon sounds at `absolute_time` if it starts before or at
+        `absolute_time` and ends after `absolute_time`. Like
+        :meth:`~mutwo.core_events.Consecution.get_event_at` this ignores
+        chronons with duration == 0.
+        """
+        abstf = core_parameters.abc.Duration.from_any(absolute_time).beat_count
+        return self._find_ending_after(bisect.bisect_right, abstf, abstf)
+
+    def range(
+        self,
+        start: core_parameters.abc.Duration.Type,
+        end: core_parameters.abc.Duration.Type,
+    ) -> tuple[IntervalIndex.Item, ...]:
+        """Find all chronons which start between `start` and `end`.
+
+        :param start: The start of the time range (included).
+        :type start: core_parameters.abc.Duration.Type
+        :param end: The end of the time range (excluded).
+        :type end: core_parameters.abc.Duration.Type
+        """
+        startf, endf = (
+            core_parameters.abc.Duration.from_any(t).beat_count for t in (start, end)
+        )
+        item_list = []
+        for level in self._level_list:
+            start_list = level.start_list
+            index_start = bisect.bisect_left(start_list, startf)
+            index_end = bisect.bisect_left(start_list, endf)
+            item_list.extend(filter(None, level.item_list[index_start:index_end]))
+        if len(self._level_list) > 1:
+            item_list.sort(key=_get_item_key)
+        return tuple(item_list)
@@ -65,6 +65,8 @@ class Parameter(core_utilities.MutwoObject, abc.ABC):
     as mostly any object can be assigned as a parameter to an event.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_any(cls: typing.Type[T], object) -> T:
         """Parse any object to Parameter.
@@ -112,6 +114,8 @@ class SingleValueParameter(Parameter):
     True
     """
 
+    __slots__ = ()
+
     def __init_subclass__(
         cls, value_name: str = "", value_return_type: typing.Type = typing.Any
     ):
@@ -198,6 +202,8 @@ class SingleNumberParameter(SingleValueParameter):
     True
     """
 
+    __slots__ = ()
+
     direct_comparison_type_tuple = tuple([])
 
     @property
@@ -265,6 +271,8 @@ class Duration(
     The reason for this decision is to simplify musical usage.
     """
 
+    __slots__ = ()
+
     direct_comparison_type_tuple = (float, int, fractions.Fraction)
     if _fractions:
         direct_comparison_type_tuple += (_fractions.Fraction,)
@@ -283,6 +291,18 @@ class Duration(
         )
         return self
 
+    def _new_from_math_operation(
+        self,
+        other: Duration | core_constants.Real,
+        operation: typing.Callable[[float, float], float],
+    ) -> Duration:
+        """Return result of math operation as a new duration.
+
+        Subclasses can override this method to create the result without
+        copying and mutating themselves, which is faster.
+        """
+        return self.copy()._math_operation(other, operation)
+
     def add(self, other: Duration | core_constants.Real) -> Duration:
         return self._math_operation(other, operator.add)
 
@@ -296,16 +316,16 @@ class Duration(
         return self._math_operation(other, operator.truediv)
 
     def __add__(self, other: Duration | core_constants.Real) -> Duration:
-        return self.copy().add(other)
+        return self._new_from_math_operation(other, operator.add)
 
     def __sub__(self, other: Duration | core_constants.Real) -> Duration:
-        return self.copy().subtract(other)
+        return self._new_from_math_operation(other, operator.sub)
 
     def __mul__(self, other: Duration | core_constants.Real) -> Duration:
-        return self.copy().multiply(other)
+        return self._new_from_math_operation(other, operator.mul)
 
     def __truediv__(self, other: Duration | core_constants.Real) -> Duration:
-        return self.copy().divide(other)
+        return self._new_from_math_operation(other, operator.truediv)
 
     def __float__(self) -> float:
         return self.beat_count
@@ -353,6 +373,8 @@ class Tempo(SingleNumberParameter, value_name="bpm", value_return_type="float"):
     information at this `wikipedia article <https://en.wikipedia.org/wiki/Tempo#Measurement>`_.
     """
 
+    __slots__ = ()
+
     Type: typing.TypeAlias = typing.Union["Tempo", core_constants.Real]
     """Tempo.Type hosts all types that are supported by the tempo
     parser :func:`Tempo.from_any`."""
@@ -15,9 +15,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
 __all__ = ("DirectDuration", "RatioDuration")
 
-import functools
+import typing
 
 try:
     import quicktions as fractions
@@ -41,8 +43,46 @@ class DirectDuration(core_parameters.abc.Duration):
     10.0
     """
 
+    __slots__ = ("_beat_count",)
+
     def __init__(self, beat_count: core_constants.Real):
-        self.beat_count = beat_count
+        # Setting the slot directly is faster than using the property
+        # setter.
+        self._beat_count = core_utilities.round_floats(
+            float(beat_count),
+            core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS,
+        )
+
+    def __setstate__(self, state: typing.Any):
+        # Durations are unpickled very often (e.g. each time an event is
+        # loaded), so the usual state is restored directly. Pickles from
+        # before 'DirectDuration' had slots have a dict as their state.
+        try:
+            instance_state, slot_state = state
+            if instance_state is None and len(slot_state) == 1:
+                self._beat_count = slot_state["_beat_count"]
+                return
+        except (TypeError, ValueError, KeyError):
+            pass
+        self._set_slot_state(state)
+
+    def copy(self) -> DirectDuration:
+        # Durations are copied very often (e.g. by each arithmetic
+        # operation), so we avoid the generic pickle based copy.
+        if type(self) is not DirectDuration:
+            return super().copy()
+        return DirectDuration(self._beat_count)
+
+    def _new_from_math_operation(
+        self,
+        other: core_parameters.abc.Duration | core_constants.Real,
+        operation: typing.Callable[[float, float], float],
+    ) -> DirectDuration:
+        if type(self) is not DirectDuration:
+            return super()._new_from_math_operation(other, operation)
+        return DirectDuration(
+            operation(self._beat_count, getattr(other, "beat_count", other))
+        )
 
     @property
     def beat_count(self) -> float:
@@ -74,12 +114,35 @@ class RatioDuration(core_parameters.abc.Duration):
     0.6666666667
     """
 
+    __slots__ = ("_ratio", "_beat_count")
+
     def __init__(self, ratio: core_constants.Real | str):
         self.ratio = ratio
 
     def __str_content__(self) -> str:
         return f"{self.ratio}"
 
+    def __setstate__(self, state: typing.Any):
+        # Also load pickles from before 'RatioDuration' had slots.
+        self._set_slot_state(state)
+
+    def copy(self) -> RatioDuration:
+        # Avoid the generic pickle based copy (see 'DirectDuration.copy').
+        if type(self) is not RatioDuration:
+            return super().copy()
+        return RatioDuration(self._ratio)
+
+    def _new_from_math_operation(
+        self,
+        other: core_parameters.abc.Duration | core_constants.Real,
+        operation: typing.Callable[[float, float], float],
+    ) -> RatioDuration:
+        if type(self) is not RatioDuration:
+            return super()._new_from_math_operation(other, operation)
+        return RatioDuration(
+            float(operation(self.beat_count, getattr(other, "beat_count", other)))
+        )
+
     @property
     def ratio(self) -> fractions.Fraction:
         return self._ratio
@@ -94,15 +157,16 @@ class RatioDuration(core_parameters.abc.Duration):
 
     @property
     def beat_count(self) -> float:
-        return self._beat_count
+        # The float is only calculated when it's needed.
+        try:
+            return self._beat_count
+        except AttributeError:
+            self._beat_count = core_utilities.round_floats(
+                float(self.ratio),
+                core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS,
+            )
+            return self._beat_count
 
     @beat_count.setter
     def beat_count(self, beat_count: core_constants.Real | str):
         self.ratio = beat_count
-
-    @functools.cached_property
-    def _beat_count(self) -> float:
-        return core_utilities.round_floats(
-            float(self.ratio),
-            core_parameters.configurations.ROUND_DURATION_TO_N_DIGITS,
-        )
@@ -45,9 +45,15 @@ class DirectTempo(core_parameters.abc.Tempo):
     DirectTempo(60.0)
     """
 
+    __slots__ = ("_bpm",)
+
     def __init__(self, bpm: core_constants.Real | str):
         self.bpm = bpm
 
+    def __setstate__(self, state: typing.Any):
+        # Also load pickles from before 'DirectTempo' had slots.
+        self._set_slot_state(state)
+
     @property
     def bpm(self) -> float:
         return self._bpm
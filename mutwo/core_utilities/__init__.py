@@ -24,10 +24,11 @@ from .exceptions import *
 from .tools import *
 from .tests import *
 from .mutwo import *
+from .caches import *
 
-from . import decorators, exceptions, mutwo, tools
+from . import caches, decorators, exceptions, mutwo, tools
 
-__all__ = tools.get_all(decorators, exceptions, mutwo, tools)
+__all__ = tools.get_all(caches, decorators, exceptions, mutwo, tools)
 
 # Force flat structure
-del decorators, exceptions, mutwo, tools
+del caches, decorators, exceptions, mutwo, tools
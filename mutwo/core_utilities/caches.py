@@ -0,0 +1,215 @@
+# This file is part of mutwo, ecosystem for time-based arts.
+#
+# Copyright (C) 2020-2024
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Bounded caches for long living objects."""
+
+from __future__ import annotations
+
+import collections
+import sys
+import threading
+import typing
+
+from mutwo import core_utilities
+
+__all__ = ("LRUCache",)
+
+
+class LRUCache(core_utilities.MutwoObject):
+    """Mapping which forgets its least recently used items.
+
+    :param maxsize: How many items the cache can hold at most. If set to
+        ``None`` the number of items is unlimited. Default to ``None``.
+    :type maxsize: typing.Optional[int]
+    :param max_byte_count: How many bytes the keys and values of the cache
+        can occupy at most. The size of an item is estimated with
+        :func:`sys.getsizeof` of its key and value and of all objects
+        which they contain (items of tuples, lists, sets and dictionaries
+        and the attributes in the ``__dict__`` of other objects). The size
+        is measured once when an item is added. If set to ``None`` the
+        byte count is unlimited and sizes aren't measured at all. Default
+        to ``None``.
+    :type max_byte_count: typing.Optional[int]
+
+    If the cache exceeds one of its limits, the least recently used items
+    are removed until it fits into its limits again. The cache counts how
+    often it found a requested item (:attr:`hit_count`) and how often not
+    (:attr:`miss_count`). It's safe to use the same cache in different
+    threads.
+
+    **Example:**
+
+    >>> from mutwo import core_utilities
+    >>> cache = core_utilities.LRUCache(maxsize=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> 'b' in cache
+    False
+    >>> cache.get('b')
+    >>> cache.hit_count, cache.miss_count
+    (1, 1)
+    """
+
+    def __init__(
+        self,
+        maxsize: typing.Optional[int] = None,
+        max_byte_count: typing.Optional[int] = None,
+    ):
+        self.maxsize = maxsize
+        self.max_byte_count = max_byte_count
+        self._init()
+
+    def _init(self):
+        self._item_dict: collections.OrderedDict = collections.OrderedDict()
+        # Sizes are remembered, so that removing an item subtracts the
+        # same number of bytes which were added, even if its value has
+        # changed in the meantime.
+        self._item_byte_count_dict: dict[typing.Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._byte_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    # ###################################################################### #
+    #                           magic methods                                #
+    # ###################################################################### #
+
+    def __repr_content__(self) -> str:
+        return f"maxsize={self.maxsize}, max_byte_count={self.max_byte_count}"
+
+    def __len__(self) -> int:
+        return len(self._item_dict)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._item_dict
+
+    def __getitem__(self, key: typing.Hashable) -> typing.Any:
+        with self._lock:
+            try:
+                value = self._item_dict[key]
+            except KeyError:
+                self.miss_count += 1
+                raise
+            self._item_dict.move_to_end(key)
+            self.hit_count += 1
+            return value
+
+    def __setitem__(self, key: typing.Hashable, value: typing.Any):
+        with self._lock:
+            item_dict = self._item_dict
+            if self.max_byte_count is not None:
+                byte_count = _get_byte_count(key, value)
+                self._byte_count += byte_count - self._item_byte_count_dict.get(key, 0)
+                self._item_byte_count_dict[key] = byte_count
+            item_dict[key] = value
+            item_dict.move_to_end(key)
+            self._shrink()
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Locks can't be pickled and cached data is only a cache.
+        return {"maxsize": self.maxsize, "max_byte_count": self.max_byte_count}
+
+    def __setstate__(self, state: dict[str, typing.Any]):
+        self.__dict__.update(state)
+        self._init()
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _shrink(self):
+        item_dict = self._item_dict
+        while item_dict and (
+            (self.maxsize is not None and len(item_dict) > self.maxsize)
+            or (
+                self.max_byte_count is not None
+                and self._byte_count > self.max_byte_count
+            )
+        ):
+            key, _ = item_dict.popitem(last=False)
+            self._byte_count -= self._item_byte_count_dict.pop(key, 0)
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def byte_count(self) -> int:
+        """Estimated number of bytes occupied by the keys and values.
+
+        Only items which were added while :attr:`max_byte_count` was set
+        are counted.
+        """
+        return self._byte_count
+
+    # ###################################################################### #
+    #                           public methods                               #
+    # ###################################################################### #
+
+    def get(self, key: typing.Hashable, default: typing.Any = None) -> typing.Any:
+        """Get value of `key` or `default` if `key` isn't cached.
+
+        :param key: The key of the requested item.
+        :type key: typing.Hashable
+        :param default: Is returned if `key` isn't cached. Default to ``None``.
+        :type default: typing.Any
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        """Remove all items from the cache and reset its counters."""
+        with self._lock:
+            self._item_dict.clear()
+            self._item_byte_count_dict.clear()
+            self._byte_count = 0
+            self.hit_count = 0
+            self.miss_count = 0
+
+
+_ATOMIC_TYPE_SET = frozenset((bool, int, float, complex, str, bytes, type(None)))
+_CONTAINER_TYPE_SET = frozenset((tuple, list, set, frozenset))
+
+
+def _get_byte_count(*object_tuple: typing.Any) -> int:
+    # Estimate the size of objects together with the objects which they
+    # contain. Containers and other objects which are referenced more
+    # than once are counted only once.
+    getsizeof = sys.getsizeof
+    byte_count, id_set, object_list = 0, set(), list(object_tuple)
+    while object_list:
+        o = object_list.pop()
+        if (t := type(o)) in _ATOMIC_TYPE_SET:
+            byte_count += getsizeof(o)
+            continue
+        if (o_id := id(o)) in id_set:
+            continue
+        id_set.add(o_id)
+        byte_count += getsizeof(o)
+        if t in _CONTAINER_TYPE_SET:
+            object_list.extend(o)
+        elif t is dict:
+            object_list.extend(o.keys())
+            object_list.extend(o.values())
+        elif (attribute_dict := getattr(o, "__dict__", None)) is not None:
+            object_list.append(attribute_dict)
+    return byte_count
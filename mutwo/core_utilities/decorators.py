@@ -17,19 +17,124 @@
 
 """Generic decorators that are used within :mod:`mutwo`."""
 
+import contextlib
 import functools
+import hashlib
 import os
+import tempfile
+import time
 import types
 import typing
 
-__all__ = ("compute_lazy",)
+__all__ = ("compute_lazy", "compute_cached")
 
 from mutwo import core_utilities
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore
+
 
 F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
 G = typing.TypeVar("G")
 
+# Each file of 'compute_cached' starts with this header and the digest of
+# its key, so that we can check if the file belongs to the key without
+# loading the result.
+_CACHE_MAGIC = b"MWCACHE1"
+_TEMPORARY_SUFFIX = ".tmp"
+
+
+def _get_pickle_module(
+    pickle_module: typing.Optional[types.ModuleType],
+) -> types.ModuleType:
+    if pickle_module is None:
+        for (
+            pickle_module_name
+        ) in core_utilities.configurations.PICKLE_MODULE_TO_SEARCH_TUPLE:
+            try:
+                pickle_module = __import__(pickle_module_name)
+            except ImportError:
+                pass
+            else:
+                break
+
+    if pickle_module is None:
+        pickle_module = __import__("pickle")
+
+    return pickle_module
+
+
+@contextlib.contextmanager
+def _lock(path: str):
+    # Hold an exclusive lock on the file at 'path', so that other processes
+    # (and threads) which try to lock it wait until we are done. Without
+    # 'fcntl' nothing is locked.
+    with open(path, "ab") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _get_lock_path(path: str) -> str:
+    # Lock files are kept in the temporary directory, so that they don't
+    # pile up next to the results. They are named after the real path of
+    # the result, so all processes which save to the same file lock the
+    # same lock file.
+    directory = os.path.join(tempfile.gettempdir(), "mutwo-locks")
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256(os.path.realpath(path).encode()).hexdigest()
+    return os.path.join(directory, f"{digest}.lock")
+
+
+def _write_atomically(path: str, write: typing.Callable[[typing.BinaryIO], None]):
+    # Write to a temporary file and then move it to 'path', so that
+    # readers never see a partly written file.
+    fd, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=_TEMPORARY_SUFFIX,
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _update_digest(digest: typing.Any, o: typing.Any, pickle_module: types.ModuleType):
+    # Feed 'o' to 'digest' so that equal arguments lead to equal digests
+    # in all processes: builtin hash of strings changes with each process
+    # and the pickled form of dicts and sets depends on their order. Only
+    # builtin types are handled here, all other objects are pickled.
+    def feed(kind: bytes, data: bytes):
+        digest.update(kind + len(data).to_bytes(8, "little") + data)
+
+    cls = type(o)
+    if o is None or cls in (bool, int, float, complex, str, bytes):
+        feed(b"v", repr((cls.__name__, o)).encode())
+    elif cls in (tuple, list):
+        feed(b"t" if cls is tuple else b"l", len(o).to_bytes(8, "little"))
+        for item in o:
+            _update_digest(digest, item, pickle_module)
+    elif cls in (dict, set, frozenset):
+        item_digest_list = []
+        for item in o.items() if cls is dict else o:
+            item_digest = hashlib.sha256()
+            _update_digest(item_digest, item, pickle_module)
+            item_digest_list.append(item_digest.digest())
+        feed(b"d" if cls is dict else b"s", b"".join(sorted(item_digest_list)))
+    else:
+        feed(b"p", pickle_module.dumps(o))
+
 
 def compute_lazy(
     path: str,
@@ -55,8 +160,18 @@ def compute_lazy(
     The decorator will only run the function if its input changes
     and otherwise load the return value from the disk.
 
+    It's safe to use the decorated function from different processes
+    (e.g. in a :class:`multiprocessing.Pool`): the result is written
+    to a temporary file which then replaces the file at `path`, so that
+    no process reads a partly written file. While one process computes
+    the result, all other processes which need a new result wait for it
+    (by locking a file in the directory ``mutwo-locks`` of the temporary
+    directory) and load it afterwards.
+
     This function is helpful if there is a complex, long-taking calculation,
     which should only run once or from time to time if the input changes.
+    Only the result of the last call is saved: use :func:`compute_cached`
+    to keep the results of different inputs.
 
     **Example:**
 
@@ -73,44 +188,227 @@ def compute_lazy(
     >>> # takes long again, because the input changed
     >>> my_super_complex_calculation(N_NUMBERS + 10)
     50000095000045
+    >>> import os
+    >>> os.remove("magic_output")
     """
 
-    if pickle_module is None:
-        for (
-            pickle_module_name
-        ) in core_utilities.configurations.PICKLE_MODULE_TO_SEARCH_TUPLE:
-            try:
-                pickle_module = __import__(pickle_module_name)
-            except ImportError:
-                pass
-            else:
-                break
-
-    if pickle_module is None:
-        pickle_module = __import__("pickle")
+    pickle_module = _get_pickle_module(pickle_module)
 
     def decorator(function_to_decorate: F) -> F:
+        def load(args_and_kwargs: tuple) -> typing.Optional[tuple[typing.Any]]:
+            # Return saved result (in a tuple) if it belongs to
+            # 'args_and_kwargs', otherwise 'None'.
+            if force_to_compute:
+                return None
+            try:
+                with open(path, "rb") as f:
+                    function_result, previous_args_and_kwargs = pickle_module.load(f)
+            # The file doesn't exist yet or it's broken (older versions
+            # didn't write atomically): simply compute the result again.
+            except Exception:
+                return None
+            if previous_args_and_kwargs != args_and_kwargs:
+                return None
+            return (function_result,)
+
         @functools.wraps(function_to_decorate)
         def wrapper(*args, **kwargs) -> typing.Any:
-            has_to_compute = False
-
             current_args_and_kwargs = (args, kwargs)
-            is_file = os.path.isfile(path)
-
-            if not is_file:
-                has_to_compute = True
-            else:
-                with open(path, "rb") as f:
-                    function_result, previous_args_and_kwargs = pickle_module.load(f)
 
-                if previous_args_and_kwargs != current_args_and_kwargs:
-                    has_to_compute = True
+            if (loaded := load(current_args_and_kwargs)) is not None:
+                return loaded[0]
 
-            if has_to_compute or force_to_compute:
+            with _lock(_get_lock_path(path)):
+                # Maybe another process computed the result while we
+                # were waiting for the lock.
+                if (loaded := load(current_args_and_kwargs)) is not None:
+                    return loaded[0]
                 function_result = function_to_decorate(*args, **kwargs)
-                with open(path, "wb") as f:
-                    pickle_module.dump((function_result, current_args_and_kwargs), f)
+                _write_atomically(
+                    path,
+                    lambda f: pickle_module.dump(
+                        (function_result, current_args_and_kwargs), f
+                    ),
+                )
+
+            return function_result
+
+        wrapped_function = typing.cast(F, wrapper)
+        return wrapped_function
+
+    return decorator
+
+
+def compute_cached(
+    path: str,
+    maxsize: typing.Optional[int] = None,
+    max_byte_count: typing.Optional[int] = None,
+    memory_max_byte_count: typing.Optional[int] = 2**26,
+    force_to_compute: bool = False,
+    pickle_module: typing.Optional[types.ModuleType] = None,
+):
+    """Cache function output for each input to disk via pickle.
+
+    :param path: The directory where the computed results are saved. It's
+        created if it doesn't exist yet.
+    :type path: str
+    :param maxsize: How many results are saved at most. If set to
+        ``None`` the number of results is unlimited. Default to ``None``.
+    :type maxsize: typing.Optional[int]
+    :param max_byte_count: How many bytes the saved results can occupy
+        at most. If set to ``None`` the byte count is unlimited. Default to
+        ``None``.
+    :type max_byte_count: typing.Optional[int]
+    :param memory_max_byte_count: How many bytes of pickled results are
+        additionally kept in memory, so that they don't need to be read
+        from disk again. If set to ``None`` the byte count is unlimited.
+        Default to ``2**26`` (64 MiB).
+    :type memory_max_byte_count: typing.Optional[int]
+    :param force_to_compute: Set to ``True`` if function has to be re-computed.
+    :type force_to_compute: bool
+    :param pickle_module: Alternative pickle module (see
+        :func:`compute_lazy`).
+    :type pickle_module: typing.Optional[types.ModuleType]
+
+    Unlike :func:`compute_lazy` the decorator saves the result of each
+    input into its own file. The file name is a stable hash of the
+    function name and its input, so finding a result doesn't need to load
+    any other result. Results are written atomically (a crashed process
+    never leaves a broken file) and if the saved results exceed `maxsize`
+    or `max_byte_count`, the least recently used results are removed.
+    The directory is only scanned when the decorator counts that a limit is
+    exceeded; it then shrinks to a little below the limit. Results saved by
+    other processes are therefore only noticed at the next scan, so the
+    limits may be exceeded temporarily if several processes share `path`.
+    Inputs must be picklable. Each call returns a new object, so changing
+    a returned result doesn't change the cache.
+
+    **Example:**
+
+    >>> import shutil
+    >>> from mutwo import core_utilities
+    >>> @core_utilities.compute_cached("magic_cache", maxsize=100)
+    ... def my_super_complex_calculation(n_numbers):
+    ...     return sum(number for number in range(n_numbers))
+    >>> my_super_complex_calculation(10000000)
+    49999995000000
+    >>> my_super_complex_calculation(10000010)
+    50000095000045
+    >>> # both results are cached: this takes very little time
+    >>> my_super_complex_calculation(10000000)
+    49999995000000
+    >>> shutil.rmtree("magic_cache")
+    """
+
+    pickle_module = _get_pickle_module(pickle_module)
+    memory_cache = core_utilities.LRUCache(max_byte_count=memory_max_byte_count)
+
+    def get_file_path(key: bytes) -> str:
+        return os.path.join(path, key.hex())
+
+    def touch(file_path: str):
+        # The modification time tells which result was least recently
+        # used. Set it explicitly, because the file system may be coarse.
+        t = time.time_ns()
+        os.utime(file_path, ns=(t, t))
+
+    def read(key: bytes) -> typing.Optional[bytes]:
+        file_path = get_file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                if f.read(len(_CACHE_MAGIC) + len(key)) != _CACHE_MAGIC + key:
+                    return None
+                data = f.read()
+            touch(file_path)
+        except FileNotFoundError:  # not cached or removed in between
+            return None
+        return data
+
+    def write(key: bytes, data: bytes):
+        def write_data(f: typing.BinaryIO):
+            f.write(_CACHE_MAGIC + key)
+            f.write(data)
+
+        os.makedirs(path, exist_ok=True)
+        file_path = get_file_path(key)
+        _write_atomically(file_path, write_data)
+        try:
+            touch(file_path)
+        except FileNotFoundError:  # removed by other process
+            pass
+
+    # How many files and bytes the cache directory holds. It's counted once
+    # and then updated by our own writes, so that the directory only needs
+    # to be scanned again if a limit is exceeded. Files of other processes
+    # are only seen by the next scan.
+    usage: typing.Optional[list[int]] = None
+
+    def is_exceeded(file_count: int, byte_count: int, margin: bool = False) -> bool:
+        def exceeds(count: int, limit: typing.Optional[int]) -> bool:
+            # Shrink a bit below the limit, so that not every following
+            # write needs to scan the directory again.
+            if limit is not None and margin:
+                limit -= limit // 10
+            return limit is not None and count > limit
+
+        return exceeds(file_count, maxsize) or exceeds(byte_count, max_byte_count)
+
+    def shrink(written_byte_count: int):
+        nonlocal usage
+        if maxsize is None and max_byte_count is None:
+            return
+        if usage is not None:
+            usage[0] += 1
+            usage[1] += written_byte_count
+            if not is_exceeded(*usage):
+                return
+        entry_list = []
+        for entry in os.scandir(path):
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entry_list.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        entry_list.sort(reverse=True)
+        byte_count = sum(e[1] for e in entry_list)
+        while entry_list and is_exceeded(len(entry_list), byte_count, margin=True):
+            _, size, file_path = entry_list.pop()
+            byte_count -= size
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+        usage = [len(entry_list), byte_count]
+
+    def decorator(function_to_decorate: F) -> F:
+        function_name = (
+            f"{function_to_decorate.__module__}.{function_to_decorate.__qualname__}"
+        )
+
+        @functools.wraps(function_to_decorate)
+        def wrapper(*args, **kwargs) -> typing.Any:
+            digest = hashlib.sha256()
+            _update_digest(digest, (function_name, args, kwargs), pickle_module)
+            key = digest.digest()
+
+            if not force_to_compute:
+                if (data := memory_cache.get(key)) is not None:
+                    try:
+                        touch(get_file_path(key))
+                    except FileNotFoundError:  # removed by other process
+                        pass
+                elif (data := read(key)) is not None:
+                    memory_cache[key] = data
+                if data is not None:
+                    return pickle_module.loads(data)
 
+            function_result = function_to_decorate(*args, **kwargs)
+            data = pickle_module.dumps(function_result)
+            write(key, data)
+            memory_cache[key] = data
+            shrink(len(_CACHE_MAGIC) + len(key) + len(data))
             return function_result
 
         wrapped_function = typing.cast(F, wrapper)
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import copy
 import functools
+import logging
 import pickle
 import typing
 
@@ -36,8 +37,24 @@ class MutwoObject(object):
     mutwo ecosystem.
     """
 
+    # Empty slots allow subclasses to define '__slots__' (objects without
+    # instance dictionaries are smaller and faster to create).
+    __slots__ = ()
+
     _short_name_length = 1
 
+    def _set_slot_state(self, state: typing.Any):
+        # Restore the pickled state of an object with slots. Pickles of
+        # objects which didn't have slots yet store all attributes in one
+        # dict instead of a tuple of the instance dict and the slots.
+        if isinstance(state, tuple):
+            instance_state, state = state
+            if instance_state:
+                self.__dict__.update(instance_state)
+        if state:
+            for name, value in state.items():
+                setattr(self, name, value)
+
     def __repr__(self) -> str:
         return f"{self.__cls_name__}({self.__repr_content__()})"
 
@@ -50,18 +67,34 @@ class MutwoObject(object):
     def __str_content__(self) -> str:
         return ""
 
-    @functools.cached_property
+    @property
     def __cls_name__(self) -> str:
         return type(self).__name__
 
-    @functools.cached_property
+    @property
     def __short_cls_name__(self) -> str:
         return self.__cls_name__[: self._short_name_length]
 
-    @functools.cached_property
+    @property
     def _logger(self):
         """The class based logger."""
-        return core_utilities.get_cls_logger(type(self))
+        return MutwoObject._get_cls_logger(type(self))
+
+    # We can't cache the logger within the instance (we may not have an
+    # instance dictionary), therefore we cache it per class.
+    @staticmethod
+    @functools.cache
+    def _get_cls_logger(cls: typing.Type) -> logging.Logger:
+        return core_utilities.get_cls_logger(cls)
+
+    def _dumps(self) -> bytes:
+        """Serialize the object for :meth:`copy`."""
+        return pickle.dumps(self)
+
+    @staticmethod
+    def _loads(data: bytes) -> typing.Any:
+        """Deserialize data which was created by :meth:`_dumps`."""
+        return pickle.loads(data)
 
     def copy(self: T) -> T:
         """Return a deep copy of mutwo object."""
@@ -69,9 +102,19 @@ class MutwoObject(object):
         # Because we often need to copy events in 'mutwo', this is a very
         # useful speedup for the whole ecosystem.
         try:
-            return pickle.loads(pickle.dumps(self))
+            return self._loads(self._dumps())
         # Some objects as lambda functions or modules can't be pickled: in
         # case our MutwoObject contains such unpickable objects, fall
         # back to less efficient deepcopy method.
         except (pickle.PicklingError, TypeError, AttributeError):
             return copy.deepcopy(self)
+
+    def _copy_n(self: T, n: int) -> list[T]:
+        """Return a list with `n` deep copies of mutwo object."""
+        # Serialising is the more expensive part of a pickle based copy,
+        # so we only do this once.
+        try:
+            data = self._dumps()
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return [copy.deepcopy(self) for _ in range(n)]
+        return [self._loads(data) for _ in range(n)]
@@ -7,6 +7,7 @@ import random
 import timeit
 import unittest
 
+from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
 
@@ -51,6 +52,13 @@ class PerformanceTest(unittest.TestCase):
         split_time_list = sorted([random.uniform(0, duration) for _ in range(100)])
         e.split_at(*split_time_list)
 
+    @t(0.25, 10)
+    def test_Consecution_split_at_many(self):
+        e = cns([chn(random.uniform(1, 3)) for _ in range(2000)])
+        duration = e.duration.beat_count
+        split_time_list = sorted([random.uniform(0, duration) for _ in range(2000)])
+        e.split_at(*split_time_list)
+
     @t(0.15, 100)
     def test_Concurrence_split_at(self):
         e = cnc([chn(random.uniform(1, 3)) for _ in range(30)])
@@ -58,6 +66,19 @@ class PerformanceTest(unittest.TestCase):
         split_time_list = sorted([random.uniform(0, duration) for _ in range(25)])
         e.split_at(*split_time_list)
 
+    @t(0.15, 20)
+    def test_Concurrence_split_at_nested(self):
+        e = cnc(
+            [
+                cns([chn(random.uniform(1, 3)).set("a", 10) for _ in range(30)])
+                for _ in range(10)
+            ]
+            + [chn(random.uniform(30, 60)).set("a", 10) for _ in range(10)]
+        )
+        duration = e.duration.beat_count
+        split_time_list = sorted([random.uniform(0, duration) for _ in range(25)])
+        e.split_at(*split_time_list)
+
     @t(0.0885, 100)
     def test_metrize(self):
         e = cnc(
@@ -77,3 +98,104 @@ class PerformanceTest(unittest.TestCase):
             ]
         )
         e.copy()
+
+    @t(0.03, 100)
+    def test_Concurrence_copy_on_write(self):
+        e = cnc(
+            [
+                cns(
+                    [
+                        chn(random.uniform(1, 3)).set_parameter("a", 10)
+                        for _ in range(30)
+                    ]
+                )
+                for c in range(100)
+            ]
+        )
+        core_events.configurations.COPY_ON_WRITE = True
+        try:
+            for i in range(10):
+                e.copy()[i][0].a = 20
+        finally:
+            core_events.configurations.COPY_ON_WRITE = False
+
+    @t(0.002, 100)
+    def test_Duration_arithmetic(self):
+        d0, d1 = core_parameters.DirectDuration(1), core_parameters.DirectDuration(0.5)
+        for _ in range(100):
+            d0 + d1
+            d0 - d1
+            d0 * 2
+
+    @t(0.03, 100)
+    def test_Consecution_duration(self):
+        e = cns([chn(random.uniform(1, 3)) for _ in range(500)])
+        for _ in range(10):
+            e[0].duration = random.uniform(1, 3)
+            e.duration
+
+    @t(0.03, 100)
+    def test_Consecution_cut_out(self):
+        e = cns([chn(random.uniform(1, 3)) for _ in range(500)])
+        duration = e.duration.beat_count
+        e.cut_out(duration * 0.25, duration * 0.75)
+
+    @t(0.03, 20)
+    def test_Envelope_value_at_many(self):
+        e = core_events.Envelope(
+            [[i, random.uniform(0, 1), random.choice([0, 1])] for i in range(200)]
+        )
+        e.value_at_many([random.uniform(0, 200) for _ in range(5000)])
+
+    @t(0.03, 20)
+    def test_Envelope_integrate_interval(self):
+        e = core_events.Envelope(
+            [[i, random.uniform(0, 1), random.choice([0, 1])] for i in range(200)]
+        )
+        for _ in range(200):
+            start, end = sorted((random.uniform(0, 200), random.uniform(0, 200)))
+            e.integrate_interval(start, end)
+
+    @t(0.2, 10)
+    def test_TempoConverter_nested_tempo(self):
+        tempo = core_parameters.FlexTempo(
+            [[i, random.uniform(40, 140), random.choice([0, 1])] for i in range(500)]
+        )
+        nested_tempo = core_parameters.FlexTempo([[0, 50], [2, 70]])
+        e = cns([cns([chn(1), chn(1)], tempo=nested_tempo) for _ in range(200)])
+        core_converters.TempoConverter(tempo).convert(e)
+
+    @t(0.05, 10)
+    def test_IntervalIndex_stab(self):
+        e = cnc(
+            [cns([chn(random.uniform(0.1, 2)) for _ in range(500)]) for _ in range(4)]
+        )
+        index = core_events.IntervalIndex(e)
+        for _ in range(500):
+            index.stab(random.uniform(0, 500))
+
+    @t(0.05, 10)
+    def test_Concurrence_concatenate_by_tag(self):
+        e = cnc([cns([chn(1)], tag=str(i)) for i in range(500)])
+        e.concatenate_by_tag(e.copy())
+
+    @t(0.03, 20)
+    def test_dumps_and_loads(self):
+        e = cnc(
+            [
+                cns(
+                    [
+                        chn(random.uniform(1, 3)).set_parameter("a", 10)
+                        for _ in range(30)
+                    ]
+                )
+                for c in range(100)
+            ]
+        )
+        core_events.loads(core_events.dumps(e))
+
+    @t(0.2, 5)
+    def test_Compound_fingerprint(self):
+        e = cnc([cns([chn(random.choice([1, 2])) for _ in range(300)])] * 4)
+        for _ in range(10):
+            e.fingerprint
@@ -1,6 +1,12 @@
+import asyncio
+import concurrent.futures
+import fractions
+import random
+import threading
 import unittest
 
 from mutwo import core_converters
+from mutwo import core_events
 
 
 class ConverterTest(unittest.TestCase):
@@ -30,6 +36,255 @@ class ConverterTest(unittest.TestCase):
     def test_call(self):
         self.assertEqual(self.dummy_converter(10), 5)
 
+    def test_aconvert(self):
+        self.assertEqual(asyncio.run(self.dummy_converter.aconvert(10)), 5)
+
+
+class EventConverterTest(unittest.TestCase):
+    class DurationConverter(core_converters.abc.EventConverter):
+        def _convert_chronon(self, event_to_convert, absolute_time, depth=0):
+            return ((absolute_time, depth, event_to_convert.duration),)
+
+        def convert(self, event_to_convert):
+            return self._convert_event(event_to_convert, 0)
+
+    class CopyConverter(core_converters.abc.SymmetricalEventConverter):
+        def _convert_chronon(self, event_to_convert, absolute_time, depth=0):
+            return event_to_convert.copy().set("thread", threading.get_ident())
+
+    def setUp(self):
+        chn, cns, cnc = (
+            core_events.Chronon,
+            core_events.Consecution,
+            core_events.Concurrence,
+        )
+        self.event = cns(
+            [chn(1), cnc([cns([chn(2), chn(0.5)]), chn(3)]), chn(1.5, tag="last")]
+        )
+        self.converter = self.DurationConverter()
+
+    def test_iter_chronon(self):
+        chronon_iterator = self.converter._iter_chronon(self.event, 0)
+        self.assertEqual(
+            [(t, d, c.duration) for t, d, c in chronon_iterator],
+            [(0, 1, 1), (1, 3, 2), (3, 3, 0.5), (1, 2, 3), (4, 1, 1.5)],
+        )
+
+    def test_iter_chronon_is_lazy(self):
+        chronon_iterator = self.converter._iter_chronon(self.event, 0)
+        self.assertEqual(next(chronon_iterator)[2], self.event[0])
+
+    def test_iter_chronon_unsupported_type(self):
+        self.assertRaises(
+            TypeError, lambda: tuple(self.converter._iter_chronon([1, 2], 0))
+        )
+
+    def test_iter_chronon_by_time(self):
+        chronon_iterator = self.converter._iter_chronon_by_time(self.event, 0)
+        self.assertEqual(
+            [(t, d, c.duration) for t, d, c in chronon_iterator],
+            [(0, 1, 1), (1, 3, 2), (1, 2, 3), (3, 3, 0.5), (4, 1, 1.5)],
+        )
+
+    def test_iter_chronon_by_time_random(self):
+        random.seed(10)
+        event = core_events.Concurrence(
+            [
+                core_events.Consecution(
+                    [
+                        core_events.Chronon(random.uniform(0, 2))
+                        for _ in range(random.randint(0, 20))
+                    ]
+                )
+                for _ in range(10)
+            ]
+        )
+        item_list = list(self.converter._iter_chronon_by_time(event, 0))
+        self.assertEqual(
+            item_list,
+            sorted(self.converter._iter_chronon(event, 0), key=lambda item: item[0]),
+        )
+
+    def test_stream_event_sort_by_time(self):
+        self.assertEqual(
+            tuple(self.converter._stream_event(self.event, 0, sort_by_time=True)),
+            tuple(sorted(self.converter.convert(self.event), key=lambda d: d[0])),
+        )
+
+    def test_executor(self):
+        event = core_events.Concurrence([self.event, self.event.copy(), self.event])
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            converter = self.DurationConverter(executor)
+            self.assertEqual(converter.convert(event), self.converter.convert(event))
+
+    def test_executor_of_symmetrical_event_converter(self):
+        event = core_events.Concurrence([self.event, self.event.copy()])
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            self.assertEqual(
+                self.CopyConverter(executor).convert(event),
+                self.CopyConverter().convert(event),
+            )
+
+    def test_stream_event(self):
+        self.assertEqual(
+            tuple(self.converter._stream_event(self.event, 0)),
+            self.converter.convert(self.event),
+        )
+
+    def test_stream_event_start_time(self):
+        # Start times are summed up in the same way as 'absolute_time_tuple'.
+        cns = core_events.Consecution(
+            [core_events.Chronon(fractions.Fraction(1, 3)) for _ in range(4)]
+            + [core_events.Chronon(0.1) for _ in range(4)]
+        )
+        self.assertEqual(
+            [data[0] for data in self.converter._stream_event(cns, 0)],
+            list(cns.absolute_time_tuple),
+        )
+
+    def test_public_stream(self):
+        for kwargs in ({}, {"sort_by_time": True}):
+            self.assertEqual(
+                list(self.converter.stream(self.event, **kwargs)),
+                list(self.converter._stream_event(self.event, 0, **kwargs)),
+            )
+
+    def test_public_stream_with_overridden_conversion(self):
+        class ReversedDurationConverter(self.DurationConverter):
+            def _convert_consecution(self, consecution, absolute_time, depth=0):
+                return tuple(
+                    reversed(
+                        super()._convert_consecution(consecution, absolute_time, depth)
+                    )
+                )
+
+        converter = ReversedDurationConverter()
+        self.assertEqual(
+            tuple(converter.stream(self.event)), converter.convert(self.event)
+        )
+
+    def test_public_astream(self):
+        async def astream(converter):
+            return tuple([d async for d in converter.astream(self.event)])
+
+        self.assertEqual(
+            asyncio.run(astream(self.converter)), self.converter.convert(self.event)
+        )
+
+    def test_stream_event_of_symmetrical_event_converter(self):
+        converter = self.CopyConverter()
+        chronon_list = list(converter._stream_event(self.event, 0))
+        self.assertEqual(len(chronon_list), 5)
+        self.assertEqual(chronon_list[-1].tag, "last")
+        self.assertIsNot(chronon_list[-1], self.event[-1])
+
+    def test_aconvert_event(self):
+        self.assertEqual(
+            asyncio.run(self.converter._aconvert_event(self.event, 0)),
+            self.converter.convert(self.event),
+        )
+        converter = self.CopyConverter()
+        self.assertEqual(
+            asyncio.run(converter._aconvert_event(self.event, 0)),
+            converter.convert(self.event),
+        )
+        self.assertRaises(
+            TypeError, asyncio.run, self.converter._aconvert_event([1, 2], 0)
+        )
+
+    def test_aconvert_event_with_executor(self):
+        event = core_events.Concurrence([self.event, self.event.copy(), self.event])
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            converter = self.DurationConverter(executor)
+            self.assertEqual(
+                asyncio.run(converter._aconvert_event(event, 0)),
+                self.converter.convert(event),
+            )
+
+    def test_aconvert_event_is_cooperative(self):
+        tag_list = []
+
+        class TagConverter(core_converters.abc.EventConverter):
+            def _convert_chronon(self, event_to_convert, absolute_time, depth=0):
+                tag_list.append(event_to_convert.tag)
+                return ()
+
+            def convert(self, event_to_convert):
+                return self._convert_event(event_to_convert, 0)
+
+        async def convert_both():
+            converter = TagConverter()
+            await asyncio.gather(
+                converter._aconvert_event(core_events.Consecution([a] * 4), 0),
+                converter._aconvert_event(core_events.Consecution([b] * 4), 0),
+            )
+
+        a, b = core_events.Chronon(1, tag="a"), core_events.Chronon(1, tag="b")
+        configurations = core_converters.configurations
+        chronon_count_per_yield = configurations.ASYNC_CHRONON_COUNT_PER_YIELD
+        configurations.ASYNC_CHRONON_COUNT_PER_YIELD = 2
+        try:
+            asyncio.run(convert_both())
+        finally:
+            configurations.ASYNC_CHRONON_COUNT_PER_YIELD = chronon_count_per_yield
+        self.assertEqual("".join(tag_list), "aabbaabb")
+
+    def test_astream_event(self):
+        async def stream(converter, **kwargs):
+            return [d async for d in converter._astream_event(self.event, 0, **kwargs)]
+
+        for kwargs in ({}, {"sort_by_time": True}):
+            self.assertEqual(
+                asyncio.run(stream(self.converter, **kwargs)),
+                list(self.converter._stream_event(self.event, 0, **kwargs)),
+            )
+        chronon_list = asyncio.run(stream(self.CopyConverter()))
+        self.assertEqual([c.tag for c in chronon_list], [None] * 4 + ["last"])
+
+    def test_aconvert_of_symmetrical_event_converter(self):
+        converter = self.CopyConverter()
+        event = asyncio.run(converter.aconvert(self.event))
+        self.assertEqual(event, converter.convert(self.event))
+        # Converted in the event loop and not in another thread.
+        self.assertEqual(
+            set(event.get_parameter("thread", flat=True)), {threading.get_ident()}
+        )
+        # Converters which override more than '_convert_chronon' fall back
+        # to a thread.
+        converter = core_converters.EventToMetrizedEvent()
+        event = core_events.Consecution([core_events.Chronon(1)], tempo=120)
+        self.assertEqual(asyncio.run(converter.aconvert(event)), event.metrize())
+
+    def test_stream(self):
+        converter = self.CopyConverter()
+        for kwargs in ({}, {"sort_by_time": True}):
+            self.assertEqual(
+                list(converter.stream(self.event, **kwargs)),
+                list(converter._stream_event(self.event, 0, **kwargs)),
+            )
+
+    def test_stream_with_overridden_conversion(self):
+        converter = core_converters.EventToMetrizedEvent()
+        event = core_events.Consecution(
+            [core_events.Chronon(1), core_events.Chronon(2)], tempo=120
+        )
+        self.assertEqual(list(converter.stream(event)), list(event.copy().metrize()))
+
+    def test_astream(self):
+        async def astream(converter, event):
+            return [c async for c in converter.astream(event)]
+
+        converter = self.CopyConverter()
+        self.assertEqual(
+            asyncio.run(astream(converter, self.event)),
+            list(converter.stream(self.event)),
+        )
+        converter = core_converters.EventToMetrizedEvent()
+        event = core_events.Consecution([core_events.Chronon(1)], tempo=120)
+        self.assertEqual(
+            asyncio.run(astream(converter, event)), list(converter.stream(event))
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
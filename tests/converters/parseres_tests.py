@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 from mutwo import core_converters
@@ -21,6 +22,11 @@ class ChrononToAttributeTest(unittest.TestCase):
             float("inf"),
         )
 
+    def test_aconvert(self):
+        chronon = core_events.Chronon(10)
+        chronon.dummy_attribute = 100  # type: ignore
+        self.assertEqual(asyncio.run(self.chronon_to_attribute.aconvert(chronon)), 100)
+
 
 class MutwoParameterDictToKeywordArgumentTest(unittest.TestCase):
     def setUp(self):
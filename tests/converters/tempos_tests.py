@@ -1,8 +1,10 @@
+import concurrent.futures
 import unittest
 
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
+from mutwo import core_utilities
 
 cns = core_events.Consecution
 cnc = core_events.Concurrence
@@ -34,6 +36,19 @@ class TempoConverterTest(unittest.TestCase):
         self.assertEqual(converted_consecution[0].duration, 4)
         self.assertEqual(converted_consecution[1].duration, 6)
 
+    def test_convert_chronon_of_consecution(self):
+        class TaggingTempoConverter(core_converters.TempoConverter):
+            def _convert_chronon(self, chronon, absolute_time, depth=0):
+                chronon.tag = f"{float(absolute_time)}-{depth}"
+                return super()._convert_chronon(chronon, absolute_time, depth)
+
+        converter = TaggingTempoConverter(core_parameters.DirectTempo(30))
+        consecution = converter.convert(cns([chn(2), cns([chn(1), chn(3)])]))
+        self.assertEqual(
+            consecution.get_parameter("tag", flat=True), ("0.0-1", "2.0-2", "3.0-2")
+        )
+        self.assertEqual(consecution.get_parameter("duration", flat=True), (4, 2, 6))
+
     def test_convert_consecution_with_flex_tempo(self):
         consecution = cns([chn(2) for _ in range(5)])
         tempo_list = [
@@ -65,6 +80,21 @@ class TempoConverterTest(unittest.TestCase):
             expected_duration_tuple,
         )
 
+    def test_convert_consecution_with_curved_flex_tempo(self):
+        # Converting a consecution with a symmetric tempo curve needs to
+        # return symmetric durations, regardless of the curve shapes.
+        consecution = cns([chn(0.5) for _ in range(8)])
+        tempo = core_parameters.FlexTempo([[0, 30, 1], [2, 60, -1], [4, 30]])
+        converter = core_converters.TempoConverter(tempo)
+        duration_tuple = tuple(
+            float(duration)
+            for duration in converter.convert(consecution).get_parameter("duration")
+        )
+        self.assertEqual(duration_tuple, tuple(reversed(duration_tuple)))
+        self.assertAlmostEqual(
+            sum(duration_tuple), converter.convert(chn(4)).duration.beat_count
+        )
+
     def test_convert_concurrence(self):
         concurrence = cnc([chn(2), chn(3)])
         converter = core_converters.TempoConverter(core_parameters.DirectTempo(30))
@@ -104,6 +134,65 @@ class TempoConverterTest(unittest.TestCase):
         # doubled).
         self.assertEqual(converted_consecution[1].tempo.duration, 2)
 
+    def test_convert_tempo_of_nested_event(self):
+        # Global beat length in seconds goes linearly from 1 to 0.5.
+        tempo = core_parameters.FlexTempo([[0, 60], [4, 120]])
+        consecution = cns(
+            [
+                chn(1),
+                cns([chn(2)], tempo=core_parameters.FlexTempo([[0, 30], [3, 30]])),
+            ]
+        )
+        converter = core_converters.TempoConverter(tempo)
+        converted_consecution = converter.convert(consecution)
+        self.assertEqual(converted_consecution[1].duration, 1.5)
+        # The tempo of the nested event exceeds the nested event:
+        # the global tempo at the end of the nested event is hold.
+        self.assertEqual(
+            converted_consecution[1].tempo.get_parameter("duration"), (2.125, 0)
+        )
+
+    def test_cache(self):
+        tempo = core_parameters.FlexTempo([[0, 30], [4, 60]])
+        converter = core_converters.TempoConverter(tempo)
+        concurrence = cnc([chn(2), chn(2), chn(3)])
+        converter.convert(concurrence)
+        self.assertEqual(converter.cache.miss_count, 2)
+        self.assertEqual(converter.cache.hit_count, 1)
+
+    def test_cache_of_consecution(self):
+        tempo = core_parameters.FlexTempo([[0, 30], [4, 60]])
+        converter = core_converters.TempoConverter(tempo)
+        consecution = cns([chn(2), chn(2), chn(3)])
+        converted_consecution = converter.convert(consecution)
+        self.assertEqual(len(converter.cache), 3)
+        self.assertEqual(converter.cache.miss_count, 0)
+        # All integrals are cached: they are used without calculating
+        # them again.
+        for key in list(converter.cache._item_dict):
+            converter.cache[key] *= 2
+        self.assertEqual(
+            converter.convert(consecution).duration,
+            converted_consecution.duration * 2,
+        )
+
+    def test_cache_is_bounded(self):
+        tempo = core_parameters.FlexTempo([[0, 30], [4, 60]])
+        converter = core_converters.TempoConverter(
+            tempo, cache=core_utilities.LRUCache(maxsize=2)
+        )
+        converter.convert(cnc([chn(d) for d in range(1, 10)]))
+        self.assertEqual(len(converter.cache), 2)
+
+    def test_shared_cache(self):
+        tempo = core_parameters.FlexTempo([[0, 30], [4, 60]])
+        converter0 = core_converters.TempoConverter(tempo)
+        converter1 = core_converters.TempoConverter(tempo, cache=converter0.cache)
+        self.assertEqual(
+            converter0.convert(chn(4)).duration, converter1.convert(chn(4)).duration
+        )
+        self.assertEqual(converter1.cache.hit_count, 1)
+
 
 class EventToMetrizedEventTest(unittest.TestCase):
     def test_convert_chronon(self):
@@ -178,6 +267,33 @@ class EventToMetrizedEventTest(unittest.TestCase):
             event_to_metrized_event.convert(consecution), expected_consecution
         )
 
+    def test_convert_with_executor(self):
+        chronon_tempo = core_parameters.FlexTempo([[0, 30], [1, 60]])
+        concurrence = cnc(
+            [
+                cns(
+                    [chn(1, tempo=chronon_tempo.copy()), chn(1)],
+                    tempo=core_parameters.FlexTempo([[0, 40], [2, 50]]),
+                )
+                for _ in range(3)
+            ],
+            tempo=core_parameters.FlexTempo([[0, 30], [3, 60]]),
+        )
+        for executor_class in (
+            concurrent.futures.ThreadPoolExecutor,
+            concurrent.futures.ProcessPoolExecutor,
+        ):
+            with executor_class(2) as executor:
+                # Children of top-level consecutions are converted
+                # concurrently, too.
+                for event in (concurrence, concurrence[0]):
+                    self.assertEqual(
+                        core_converters.EventToMetrizedEvent(executor=executor).convert(
+                            event
+                        ),
+                        core_converters.EventToMetrizedEvent().convert(event),
+                    )
+
     def test_convert_with_maxima_depth_count(self):
         """
         Ensure maxima_depth_count takes effect
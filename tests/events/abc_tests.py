@@ -1,6 +1,11 @@
+import concurrent.futures
+import pickle
+import threading
 import unittest
+import weakref
 
 from mutwo import core_events
+from mutwo import core_parameters
 
 
 class EventTest(unittest.TestCase):
@@ -20,5 +25,431 @@ class CompoundTest(unittest.TestCase):
         self.assertRaises(TypeError, core_events.abc.Compound)
 
 
+class TagIndexTest(unittest.TestCase):
+    def setUp(self):
+        chn = core_events.Chronon
+        self.event = core_events.Consecution(
+            [chn(1, tag="a"), chn(2, tag="b"), chn(3), chn(4, tag="c")]
+        )
+        # Build tag index, so that tests check if it's kept up to date.
+        self.event._get_tag_dict()
+
+    def assertTagIndex(self, event):
+        # The index must be equal to a linear search.
+        for i, e in enumerate(event):
+            if e.tag is not None:
+                self.assertIs(event[e.tag], event[[x.tag for x in event].index(e.tag)])
+        self.assertEqual(
+            event._get_tag_dict(),
+            {e.tag: i for i, e in reversed(list(enumerate(event))) if e.tag},
+        )
+
+    def test_getitem(self):
+        self.assertEqual(self.event["b"].duration, 2)
+        self.assertRaises(KeyError, lambda: self.event["d"])
+        self.assertTagIndex(self.event)
+
+    def test_first_tag_wins(self):
+        self.event.append(core_events.Chronon(5, tag="a"))
+        self.assertEqual(self.event["a"].duration, 1)
+        del self.event[0]
+        self.assertEqual(self.event["a"].duration, 5)
+
+    def test_append_and_extend(self):
+        self.event.append(core_events.Chronon(5, tag="d"))
+        self.event.extend([core_events.Chronon(6, tag="e")])
+        self.event += [core_events.Chronon(7, tag="f")]
+        self.assertTagIndex(self.event)
+
+    def test_insert(self):
+        self.event.insert(0, core_events.Chronon(5, tag="d"))
+        self.assertEqual(self.event["a"].duration, 1)
+        self.assertTagIndex(self.event)
+
+    def test_setitem(self):
+        self.event[1] = core_events.Chronon(5, tag="d")
+        self.assertRaises(KeyError, lambda: self.event["b"])
+        self.event[2:] = [core_events.Chronon(6, tag="e")]
+        self.assertTagIndex(self.event)
+        self.event["a"] = core_events.Chronon(7, tag="f")
+        self.assertTagIndex(self.event)
+
+    def test_delitem(self):
+        del self.event["a"]
+        self.assertTagIndex(self.event)
+        del self.event[:1]
+        self.assertTagIndex(self.event)
+
+    def test_other_list_methods(self):
+        for method_name, arg_tuple, kwarg_dict in (
+            ("reverse", (), {}),
+            ("pop", (0,), {}),
+            ("remove", (self.event[1],), {}),
+            ("sort", (), {"key": lambda e: -e.duration.beat_count}),
+            ("__imul__", (2,), {}),
+            ("clear", (), {}),
+        ):
+            getattr(self.event, method_name)(*arg_tuple, **kwarg_dict)
+            self.assertTagIndex(self.event)
+
+    def test_slice(self):
+        self.assertTagIndex(self.event[1:])
+
+    def test_change_tag_of_child(self):
+        self.event[0].tag = "d"
+        self.assertRaises(KeyError, lambda: self.event["a"])
+        self.assertEqual(self.event["d"].duration, 1)
+        self.event[2].tag = "a"
+        self.assertEqual(self.event["a"].duration, 3)
+
+    def test_copy(self):
+        e = self.event.copy()
+        self.assertTagIndex(e)
+        self.assertEqual(pickle.loads(pickle.dumps(self.event)), self.event)
+
+
+class FingerprintTest(unittest.TestCase):
+    def setUp(self):
+        chn = core_events.Chronon
+        self.event = core_events.Concurrence(
+            [
+                core_events.Consecution(
+                    [chn(1).set("pitch", [0]), chn(2).set("pitch", [1])], tag="a"
+                ),
+                core_events.Consecution([chn(3)], tag="b"),
+            ]
+        )
+
+    def assertFingerprintChanged(self, function):
+        fingerprint = self.event.fingerprint
+        function(self.event)
+        self.assertNotEqual(self.event.fingerprint, fingerprint)
+        # The new fingerprint needs to be equal to the one of an event
+        # which never had a cached fingerprint.
+        self.assertEqual(self.event.fingerprint, self.event.copy().fingerprint)
+
+    def test_equal_events(self):
+        e = self.event.copy()
+        self.assertEqual(e.fingerprint, self.event.fingerprint)
+        self.assertEqual(hash(e), hash(self.event))
+        self.assertEqual(e, self.event)
+
+    def test_equal_parameters(self):
+        chn0, chn1 = core_events.Chronon(1), core_events.Chronon(
+            core_parameters.RatioDuration(1), tempo=60
+        )
+        self.assertEqual(chn0, chn1)
+        self.assertEqual(chn0.fingerprint, chn1.fingerprint)
+        chn1.tempo = core_parameters.FlexTempo([[0, 60], [1, 30]])
+        self.assertEqual(chn0, chn1)
+        self.assertEqual(chn0.fingerprint, chn1.fingerprint)
+
+    def test_set_parameter(self):
+        self.assertFingerprintChanged(lambda e: setattr(e[0][0], "pitch", [3]))
+        self.assertFingerprintChanged(lambda e: setattr(e[1][0], "volume", 3))
+        self.assertFingerprintChanged(lambda e: e.set_parameter("pitch", [4]))
+
+    def test_mutate_parameter(self):
+        self.assertFingerprintChanged(
+            lambda e: e.mutate_parameter("pitch", lambda p: p.append(2))
+        )
+
+    def test_duration(self):
+        self.assertFingerprintChanged(lambda e: setattr(e[1][0], "duration", 4))
+
+    def test_tag(self):
+        self.assertFingerprintChanged(lambda e: setattr(e[1], "tag", "c"))
+
+    def test_structure(self):
+        self.assertFingerprintChanged(lambda e: e[1].append(core_events.Chronon(1)))
+        self.assertFingerprintChanged(lambda e: e.reverse())
+        self.assertFingerprintChanged(lambda e: e.pop(0))
+
+    def test_dict_key(self):
+        chn = core_events.Chronon
+        event_list = [chn(1), chn(2), chn(1).set("pitch", 3), chn(1), chn(2)]
+        self.assertEqual(len(set(event_list)), 3)
+        self.assertEqual({self.event: 1}[self.event.copy()], 1)
+
+    def test_not_equal_with_cached_fingerprint(self):
+        e = self.event.copy()
+        e[1][0].duration = 10
+        # Now '__eq__' can use the cached fingerprints.
+        e.fingerprint, self.event.fingerprint
+        self.assertNotEqual(e, self.event)
+        e[1][0].duration = 3
+        self.assertEqual(e, self.event)
+
+    def test_change_in_place(self):
+        chn = core_events.Chronon
+        chn0, chn1 = chn(1).set("pitch", [1]), chn(1).set("pitch", [1, 2])
+        hash(chn0), hash(chn1)
+        chn0.pitch.append(2)
+        self.assertEqual(chn0, chn1)
+        fingerprint = chn0.fingerprint
+        chn0.duration.add(1)
+        self.assertNotEqual(chn0, chn1)
+        self.assertNotEqual(chn0.fingerprint, fingerprint)
+        cns0, cns1 = core_events.Consecution([chn0]), core_events.Consecution([chn1])
+        hash(cns0), hash(cns1)
+        chn1.duration.add(1)
+        self.assertEqual(cns0, cns1)
+
+    def test_copy_does_not_reuse_cache(self):
+        self.event.fingerprint
+        chn = pickle.loads(pickle.dumps(self.event[0][0]))
+        self.assertEqual(chn._get_cached_fingerprint(), None)
+        self.assertEqual(chn.fingerprint, self.event[0][0].fingerprint)
+
+    def test_column_consecution(self):
+        e = core_events.ColumnConsecution(self.event[0], ("pitch",))
+        self.assertEqual(e.fingerprint, e.copy().fingerprint)
+        fingerprint = e.fingerprint
+        e[0].pitch = [10]
+        self.assertNotEqual(e.fingerprint, fingerprint)
+
+
+class CopyOnWriteTest(unittest.TestCase):
+    def setUp(self):
+        cns, cnc, chn = (
+            core_events.Consecution,
+            core_events.Concurrence,
+            core_events.Chronon,
+        )
+        self.event = cnc(
+            [
+                cns([chn(1).set("pitch", [0]), chn(2).set("pitch", [1])]),
+                cns([chn(3).set("pitch", [2])]),
+            ],
+            tempo=core_parameters.FlexTempo([[0, 60], [1, 30]]),
+            tag="abc",
+        )
+        self.event_copy = self.event.copy()
+        core_events.configurations.COPY_ON_WRITE = True
+
+    def tearDown(self):
+        core_events.configurations.COPY_ON_WRITE = False
+
+    def test_copy(self):
+        e = self.event.copy()
+        self.assertEqual(e, self.event)
+        self.assertEqual(e.tag, "abc")
+        self.assertIsNot(e.tempo, self.event.tempo)
+
+    def test_children_are_shared(self):
+        e = self.event.copy()
+        for child, shared_child in zip(list.__iter__(e), list.__iter__(self.event)):
+            self.assertIs(child, shared_child)
+
+    def test_copy_is_independent(self):
+        e = self.event.copy()
+        e[0][1].duration = 10
+        e[0][1].pitch.append(100)
+        e[1].append(core_events.Chronon(1))
+        self.assertEqual(self.event, self.event_copy)
+        self.assertEqual(e[0][1].duration, 10)
+        self.assertEqual(e[0][1].pitch, [1, 100])
+
+    def test_original_is_independent(self):
+        e = self.event.copy()
+        for consecution in self.event:
+            consecution.set_parameter("pitch", None)
+        self.assertEqual(e, self.event_copy)
+
+    def test_copy_only_changed_children(self):
+        e = self.event.copy()
+        e[0][0].duration = 3
+        self.assertIs(list.__getitem__(e, 1), list.__getitem__(self.event, 1))
+        self.assertIs(e[0][1], list.__getitem__(e[0], 1))
+
+    def test_read_only_access_does_not_copy(self):
+        e = self.event.copy()
+        self.assertEqual(e.duration, 3)
+        self.assertIs(list.__getitem__(e, 0), list.__getitem__(self.event, 0))
+
+    def test_slice_pop_and_mul_are_independent(self):
+        e = self.event.copy()
+        for e_derived in (e[:1], e * 2, [e.pop(0)]):
+            e_derived[0][0].pitch.append(100)
+        self.assertEqual(self.event, self.event_copy)
+
+    def test_child_which_appears_twice(self):
+        e = self.event.copy() * 2
+        e[0][0].pitch.append(100)
+        e[2][0].pitch.append(100)
+        self.assertEqual(self.event, self.event_copy)
+
+    def test_reference_from_before_copy(self):
+        chronon, pitch = self.event[0][1], self.event[1][0].pitch
+        e = self.event.copy()
+        chronon.duration = 10
+        pitch.append(100)
+        self.assertEqual(e, self.event_copy)
+        self.assertEqual(self.event[0][1].duration, 10)
+        self.assertEqual(self.event[1][0].pitch, [2, 100])
+
+    def test_weak_reference_from_before_copy(self):
+        reference = weakref.ref(self.event[0][1])
+        e = self.event.copy()
+        reference().duration = 10
+        self.assertEqual(e, self.event_copy)
+
+    def test_added_event_belongs_to_compound(self):
+        chronon = core_events.Chronon(1)
+        e = core_events.Consecution([chronon]).copy()
+        self.assertIs(list.__getitem__(e, 0), chronon)
+        self.assertIsNot(e[0], chronon)
+
+    def test_concurrent_read(self):
+        e = core_events.Concurrence(
+            [
+                core_events.Consecution([core_events.Chronon(1) for _ in range(50)])
+                for _ in range(50)
+            ]
+        ).copy()
+        barrier = threading.Barrier(thread_count := 8)
+
+        def read(_):
+            barrier.wait()
+            return [list(consecution) for consecution in e]
+
+        with concurrent.futures.ThreadPoolExecutor(thread_count) as executor:
+            read_list = list(executor.map(read, range(thread_count)))
+        # All threads get the same copies of the shared children.
+        for read_consecution_list in read_list:
+            for consecution, read_chronon_list in zip(
+                list.__iter__(e), read_consecution_list
+            ):
+                for chronon, read_chronon in zip(
+                    list.__iter__(consecution), read_chronon_list
+                ):
+                    self.assertIs(read_chronon, chronon)
+        self.assertFalse(e._cow_dict)
+
+    def test_shared_children_are_forgotten(self):
+        e0 = core_events.Consecution([core_events.Chronon(1) for _ in range(10)])
+        e = e0
+        for i in range(200):
+            e = e.copy()
+            e[i % 10].duration = 2
+        self.assertLessEqual(len(e0._cow_dict), 10)
+        self.assertLessEqual(len(e._cow_dict), 10)
+        for i in range(10):
+            e[i]
+        self.assertFalse(e._cow_dict)
+
+    def test_pickle(self):
+        e = self.event.copy()
+        self.assertEqual(pickle.loads(pickle.dumps(e)), self.event_copy)
+        self.assertNotIn("_cow_dict", e.__getstate__())
+
+    def test_split_at(self):
+        core_events.configurations.COPY_ON_WRITE = False
+        split_event_tuple = self.event.split_at(1.5)
+        core_events.configurations.COPY_ON_WRITE = True
+        self.assertEqual(self.event.split_at(1.5), split_event_tuple)
+        self.assertEqual(self.event, self.event_copy)
+
+
+class DeduplicateTest(unittest.TestCase):
+    def setUp(self):
+        cns, cnc, chn = (
+            core_events.Consecution,
+            core_events.Concurrence,
+            core_events.Chronon,
+        )
+        self.event = cnc(
+            [
+                cns([chn(1).set("pitch", [0]) for _ in range(3)] + [chn(2)]),
+                cns([chn(1).set("pitch", [0]), chn(2), chn(2)]),
+            ]
+        )
+        self.event_copy = self.event.copy()
+
+    def get_chronon_count(self, event):
+        chronon_set, compound_list = set([]), [event]
+        while compound_list:
+            for e in list.__iter__(compound_list.pop()):
+                if isinstance(e, core_events.abc.Compound):
+                    compound_list.append(e)
+                else:
+                    chronon_set.add(id(e))
+        return len(chronon_set)
+
+    def test_deduplicate(self):
+        self.assertGreater(self.event.deduplicate(), 0)
+        self.assertEqual(self.get_chronon_count(self.event), 2)
+        self.assertEqual(self.event, self.event_copy)
+        self.assertEqual(self.event.deduplicate(), 0)
+
+    def test_different_types_are_not_merged(self):
+        class Chronon(core_events.Chronon):
+            pass
+
+        cns = core_events.Consecution([core_events.Chronon(1), Chronon(1)])
+        self.assertEqual(cns.deduplicate(), 0)
+        self.assertEqual(type(cns[1]), Chronon)
+
+    def test_read_does_not_copy(self):
+        self.event.deduplicate()
+        for cns in self.event:
+            list(cns), cns[0], cns.get_parameter("pitch"), cns.duration
+        self.assertEqual(self.get_chronon_count(self.event), 2)
+
+    def test_change_is_isolated(self):
+        self.event.deduplicate()
+        self.event[1].mutate_parameter("pitch", lambda p: p.append(1))
+        self.event[0].set_parameter("duration", 3)
+        self.assertEqual(self.event[0][0].pitch, [0])
+        self.assertEqual(self.event[1][0].pitch, [0, 1])
+        self.assertEqual(self.event[0][3].duration, 3)
+        self.assertEqual(self.event[1][1].duration, 2)
+
+    def test_in_place_methods(self):
+        chn = core_events.Chronon
+        self.event.append(core_events.Consecution([chn(1), chn(1)]))
+        self.event_copy = self.event.copy()
+        self.event.deduplicate()
+        for e in (self.event, self.event_copy):
+            e[0].cut_out(0.5, 4.5)
+            e[1].squash_in(0.5, chn(0.25))
+            e[2].tie_by(lambda e0, e1: True)
+            e.cut_off(3, 4)
+        self.assertEqual(self.event, self.event_copy)
+        cnc = core_events.Concurrence([chn(1), chn(1)])
+        cnc_copy = cnc.copy()
+        cnc.deduplicate()
+        for e in (cnc, cnc_copy):
+            e.cut_off(0, 0.5).cut_out(0, 0.25).extend_until(2)
+        self.assertEqual(cnc, cnc_copy)
+
+    def test_set_and_mutate_parameter(self):
+        self.event.deduplicate()
+        self.event.set_parameter("duration", lambda d: d * 2)
+        self.event.mutate_parameter("pitch", lambda p: p.append(1))
+        self.event_copy.set_parameter("duration", lambda d: d * 2)
+        self.event_copy.mutate_parameter("pitch", lambda p: p.append(1))
+        self.assertEqual(self.event, self.event_copy)
+        self.assertEqual(self.event[0][0].pitch, [0, 1])
+
+    def test_pool(self):
+        pool = {}
+        cns = core_events.Consecution([core_events.Chronon(2)])
+        self.event.deduplicate(pool)
+        self.assertGreater(cns.deduplicate(pool), 0)
+        self.assertIs(list.__getitem__(cns, 0), list.__getitem__(self.event[0], 3))
+        cns.set_parameter("duration", 1)
+        self.assertEqual(self.event, self.event_copy)
+
+    def test_copy(self):
+        self.event.deduplicate()
+        e = self.event.copy()
+        self.assertEqual(self.get_chronon_count(e), 2)
+        e[0].mutate_parameter("pitch", lambda p: p.append(1))
+        self.assertEqual(e[0][1].pitch, [0, 1])
+        self.assertEqual(e[1][0].pitch, [0])
+        self.assertEqual(self.event, self.event_copy)
+
+
 if __name__ == "__main__":
     unittest.main()
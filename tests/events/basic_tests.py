@@ -1,4 +1,5 @@
 import abc
+import pickle
 import typing
 import unittest
 
@@ -139,6 +140,20 @@ class ChrononTest(unittest.TestCase, EventTest):
         self.assertEqual(chronon0.duration.beat_count, 20)
         self.assertEqual(chronon1.duration.beat_count, 300)
 
+    def test_unpickle_tag(self):
+        # Pickle of 'Chronon(1, tag="a")' from before 'tag' was a property.
+        data = (
+            b"\x80\x04\x95\xa2\x00\x00\x00\x00\x00\x00\x00\x8c\x17mutwo.core_events"
+            b".basic\x94\x8c\x07Chronon\x94\x93\x94)\x81\x94}\x94(\x8c\x06_tempo\x94N"
+            b"\x8c\x03tag\x94\x8c\x01a\x94\x8c\t_duration\x94\x8c\x1fmutwo"
+            b".core_parameters.durations\x94\x8c\x0eDirectDuration\x94\x93\x94)\x81"
+            b"\x94}\x94\x8c\x0b_beat_count\x94G?\xf0\x00\x00\x00\x00\x00\x00sbub."
+        )
+        chronon = pickle.loads(data)
+        self.assertEqual(chronon.tag, "a")
+        self.assertEqual(chronon, core_events.Chronon(1, tag="a"))
+        self.assertNotIn("tag", vars(chronon))
+
     def test_set(self):
         chronon = core_events.Chronon(1)
         self.assertEqual(chronon.duration, 1)
@@ -281,6 +296,12 @@ class ChrononTest(unittest.TestCase, EventTest):
         event1.cut_off(0, 5)
         self.assertEqual(event1, cut_off_event1)
 
+    def test_cut_keeps_duration_type(self):
+        for method_name in ("cut_out", "cut_off"):
+            event = core_events.Chronon(core_parameters.RatioDuration("3/2"))
+            getattr(event, method_name)(0, 1)
+            self.assertEqual(type(event.duration), core_parameters.RatioDuration)
+
     def test_split_at(self):
         event = core_events.Chronon(4)
 
@@ -293,6 +314,65 @@ class ChrononTest(unittest.TestCase, EventTest):
         self.assertEqual(event.split_at(3), split2)
 
 
+class SlottedChrononTest(unittest.TestCase, EventTest):
+    class Note(core_events.SlottedChronon):
+        __slots__ = ("pitch", "volume")
+
+    def setUp(self) -> None:
+        EventTest.setUp(self)
+
+    def get_event_class(self) -> typing.Type:
+        return self.Note
+
+    def get_event_instance(self) -> core_events.SlottedChronon:
+        return self.get_event_class()(10).set("pitch", [60])
+
+    def test_no_instance_dictionary(self):
+        self.assertFalse(hasattr(self.event, "__dict__"))
+        self.assertFalse(hasattr(core_events.SlottedChronon(1), "__dict__"))
+
+    def test_metrize(self):
+        e = core_events.SlottedChronon(1, tempo=120)
+        self.assertIs(e.metrize(), e)
+        self.assertEqual(e.duration, 0.5)
+        self.assertEqual(e.tempo, core_parameters.FlexTempo([[0, 60], [1, 60]]))
+        self.assertEqual(self.event.metrize().duration, 10)
+
+    def test_is_chronon(self):
+        self.assertIsInstance(self.event, core_events.Chronon)
+        self.assertTrue(issubclass(self.Note, core_events.Chronon))
+
+    def test_parameter(self):
+        self.assertEqual(self.event.get_parameter("pitch"), [60])
+        self.assertEqual(self.event.get_parameter("volume"), None)
+        self.event.set_parameter("volume", 1, set_unassigned_parameter=False)
+        self.assertFalse(hasattr(self.event, "volume"))
+        self.event.set_parameter("volume", 1)
+        self.assertEqual(self.event.volume, 1)
+        self.assertRaises(AttributeError, self.event.set, "unknown", 1)
+
+    def test_equal(self):
+        self.assertEqual(self.event, self.Note(10).set("pitch", [60]))
+        self.assertNotEqual(self.event, self.Note(10))
+        self.assertNotEqual(self.event, self.event.copy().set("volume", 1))
+
+    def test_copy(self):
+        self.event.tag = "a"
+        event_copy = self.event.copy()
+        self.assertEqual(event_copy, self.event)
+        self.assertEqual(event_copy.tag, "a")
+        self.assertIsNot(event_copy.pitch, self.event.pitch)
+
+    def test_fingerprint(self):
+        fingerprint = self.event.fingerprint
+        self.assertEqual(self.event.copy().fingerprint, fingerprint)
+        self.event.mutate_parameter("pitch", lambda pitch: pitch.append(61))
+        self.assertNotEqual(self.event.fingerprint, fingerprint)
+        self.assertEqual(
+            self.event.fingerprint, self.Note(10).set("pitch", [60, 61]).fingerprint
+        )
+
+
 class ConsecutionTest(unittest.TestCase, CompoundTest):
     def setUp(self):
         EventTest.setUp(self)
@@ -309,6 +389,16 @@ class ConsecutionTest(unittest.TestCase, CompoundTest):
             ]
         )
 
+    def test_unpickle_tag(self):
+        # Pickle of 'Consecution([], tag="b")' from before 'tag' was a
+        # property.
+        data = (
+            b"\x80\x04\x95G\x00\x00\x00\x00\x00\x00\x00\x8c\x17mutwo.core_events"
+            b".basic\x94\x8c\x0bConsecution\x94\x93\x94)\x81\x94}\x94(\x8c\x06_tempo"
+            b"\x94N\x8c\x03tag\x94\x8c\x01b\x94ub."
+        )
+        self.assertEqual(pickle.loads(data).tag, "b")
+
     def tag_sequence(self) -> tuple[str, ...]:
         tag_sequence = "abc"
         for tag, item in zip(tag_sequence, self.sequence):
@@ -359,6 +449,18 @@ class ConsecutionTest(unittest.TestCase, CompoundTest):
             core_events.Consecution().duration, core_parameters.DirectDuration(0)
         )
 
+    def test_duration_type(self):
+        r = core_parameters.RatioDuration
+        consecution = core_events.Consecution(
+            [core_events.Chronon(r("1/3")), core_events.Chronon(r("2/3"))]
+        )
+        self.assertEqual(type(consecution.duration), r)
+        consecution.append(core_events.Chronon(1))
+        self.assertEqual(type(consecution.duration), r)
+        self.assertEqual(consecution.duration, 2)
+        consecution[0].duration = 1
+        self.assertEqual(type(consecution.duration), core_parameters.DirectDuration)
+
     def test_set(self):
         consecution = core_events.Consecution(
             [core_events.Chronon(1), core_events.Chronon(1)]
@@ -407,6 +509,23 @@ class ConsecutionTest(unittest.TestCase, CompoundTest):
             core_converters.EventToMetrizedEvent().convert(consecution),
         )
 
+    def test_metrize_workers(self):
+        consecution = core_events.Consecution(
+            [
+                core_events.Chronon(
+                    1, tempo=core_parameters.FlexTempo([[0, 120], [1, 60]])
+                ),
+                core_events.Consecution(
+                    [core_events.Chronon(2)],
+                    tempo=core_parameters.FlexTempo([[0, 40], [2, 80]]),
+                ),
+            ],
+            tempo=core_parameters.FlexTempo([[0, 30], [3, 120]]),
+        )
+        self.assertEqual(
+            consecution.copy().metrize(workers=2), consecution.copy().metrize()
+        )
+
     def test_concatenate_tempo(self):
         cns0 = self.get_event_class()([core_events.Chronon(1)], tempo=50)
         cns1 = self.get_event_class()([core_events.Chronon(2)], tempo=50)
@@ -507,6 +626,95 @@ class ConsecutionTest(unittest.TestCase, CompoundTest):
             ),
         )
 
+    def test_absolute_time_cache_invalidation(self):
+        cns, chn = core_events.Consecution, core_events.Chronon
+        s = self.sequence
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 1, 3))
+        # Structural changes
+        s.append(chn(1))
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 1, 3, 6))
+        s.insert(0, chn(2))
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 2, 3, 5, 8))
+        del s[0]
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 1, 3, 6))
+        s[0] = chn(0.5)
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 0.5, 2.5, 5.5))
+        s.extend([chn(1)])
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 0.5, 2.5, 5.5, 6.5))
+        s.pop()
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 0.5, 2.5, 5.5))
+        # Duration changes of children
+        self.chronon1.duration = 1
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 0.5, 1.5, 4.5))
+        self.chronon1.duration.add(1)
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 0.5, 2.5, 5.5))
+        self.assertEqual(
+            s.absolute_time_tuple,
+            tuple(core_parameters.DirectDuration(t) for t in (0, 0.5, 2.5, 5.5)),
+        )
+        # Changes of nested events
+        nested = cns([cns([chn(1)]), chn(1)])
+        self.assertEqual(nested.absolute_time_in_floats_tuple, (0, 1))
+        nested[0].append(chn(2))
+        self.assertEqual(nested.absolute_time_in_floats_tuple, (0, 3))
+        nested[0][0].duration = 2
+        self.assertEqual(nested.absolute_time_in_floats_tuple, (0, 4))
+
+    def test_absolute_time_cache_with_silent_duration(self):
+        # A duration which is changed in place without telling anyone.
+        class SilentDuration(core_parameters.abc.Duration):
+            def __init__(self, beat_count):
+                self._beat_count = beat_count
+
+            @property
+            def beat_count(self):
+                return self._beat_count
+
+            @beat_count.setter
+            def beat_count(self, beat_count):
+                self._beat_count = beat_count
+
+        duration = SilentDuration(1)
+        s = core_events.Consecution([core_events.Chronon(duration)] * 2)
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 1))
+        duration._beat_count = 2
+        self.assertEqual(s.absolute_time_in_floats_tuple, (0, 2))
+
+    def test_absolute_time_cache_is_kept(self):
+        s = self.sequence
+        abstf_tuple = s.absolute_time_in_floats_tuple
+        # Changes of other events don't affect our cache.
+        core_events.Consecution([core_events.Chronon(1)])[0].duration = 3
+        self.assertIs(s.absolute_time_in_floats_tuple, abstf_tuple)
+        # The cache only holds floats and duration types.
+        item_list = list(s._abstf_cache)
+        while item_list:
+            item = item_list.pop()
+            if isinstance(item, tuple):
+                item_list.extend(item)
+            else:
+                self.assertIsInstance(item, (float, int, type))
+
+    def test_absolute_time_cache_with_new_duration_type(self):
+        s = core_events.Consecution([core_events.Chronon(1), core_events.Chronon(1)])
+        self.assertEqual(type(s.duration), core_parameters.DirectDuration)
+        # Same beat count, but another type
+        s[0].duration = core_parameters.RatioDuration(1)
+        s[1].duration = core_parameters.RatioDuration(1)
+        self.assertEqual(type(s.duration), core_parameters.RatioDuration)
+
+    def test_absolute_time_cache_after_append(self):
+        s = core_events.Consecution([])
+        for d in (0.1, 0.2, 0.3, 1 / 3, 2 / 3, 0.7):
+            s.get_event_index_at(0)  # Fill cache
+            s.append(core_events.Chronon(d))
+        patched = s._abstf_tuple_and_dur
+        self.assertEqual(patched, s.copy()._abstf_tuple_and_dur)
+
+    def test_absolute_time_cache_is_not_copied(self):
+        self.sequence.get_event_index_at(0)  # Fill cache
+        self.assertFalse(hasattr(self.sequence.copy(), "_abstf_cache"))
+
     def test_get_event_at(self):
         result = self.sequence.get_event_at(1.5)
         self.assertEqual(result, self.sequence[1])
@@ -822,6 +1030,42 @@ class ConsecutionTest(unittest.TestCase, CompoundTest):
             ),
         )
 
+    def test_split_at_multi_nested(self):
+        cns, chn = core_events.Consecution, core_events.Chronon
+        consecution = cns(
+            [cns([chn(1).set("i", 0), chn(2).set("i", 1)]), chn(3).set("i", 2)]
+        )
+        self.assertEqual(
+            consecution.split_at(0.5, 2, 4),
+            (
+                cns([cns([chn(0.5).set("i", 0)])]),
+                cns([cns([chn(0.5).set("i", 0), chn(1).set("i", 1)])]),
+                cns([cns([chn(1).set("i", 1)]), chn(1).set("i", 2)]),
+                cns([chn(2).set("i", 2)]),
+            ),
+        )
+
+    def test_split_at_multi_duplicates(self):
+        cns, chn = core_events.Consecution, core_events.Chronon
+        self.assertEqual(
+            self.sequence.split_at(2, 2, 3),
+            (cns([chn(1), chn(1)]), cns([]), cns([chn(1)]), cns([chn(3)])),
+        )
+
+    def test_split_child_at_nested(self):
+        cns, chn = core_events.Consecution, core_events.Chronon
+        consecution = cns([cns([chn(1).set("i", 0), chn(2).set("i", 1)])])
+        consecution.split_child_at(2)
+        self.assertEqual(
+            consecution,
+            cns(
+                [
+                    cns([chn(1).set("i", 0), chn(1).set("i", 1)]),
+                    cns([chn(1).set("i", 1)]),
+                ]
+            ),
+        )
+
     def test_start_and_end_time_per_event(self):
         self.assertEqual(
             self.sequence.start_and_end_time_per_event,
@@ -926,6 +1170,11 @@ class ConcurrenceTest(unittest.TestCase, CompoundTest):
             core_events.Concurrence().duration, core_parameters.DirectDuration(0)
         )
 
+    def test_duration_is_duration_of_longest_child(self):
+        chronon = core_events.Chronon(core_parameters.RatioDuration("1/3"))
+        concurrence = core_events.Concurrence([chronon, core_events.Chronon(0.25)])
+        self.assertIs(concurrence.duration, chronon.duration)
+
     def test_get_event_from_index_sequence(self):
         self.assertEqual(
             self.sequence.get_event_from_index_sequence((0,)), self.sequence[0]
@@ -1460,6 +1709,29 @@ class ConcurrenceTest(unittest.TestCase, CompoundTest):
         self.assertEqual(chn1, cnc([cns([chn(2), chn(1)]), cns([chn(2), chn(1)])]))
         self.assertEqual(chn2, cnc([cns([chn(2)]), cns([chn(2)])]))
 
+    def test_split_at_multi_duplicates(self):
+        cns, cnc, chn = (
+            core_events.Consecution,
+            core_events.Concurrence,
+            core_events.Chronon,
+        )
+        e = cnc([cns([chn(1), chn(2)]), chn(3)])
+        self.assertEqual(e.split_at(1, 1, 2), e.split_at(1, 2))
+        self.assertEqual(
+            e.split_at(2, 1, 2, 1),
+            (
+                cnc([cns([chn(1)]), chn(1)]),
+                cnc([cns([chn(1)]), chn(1)]),
+                cnc([cns([chn(1)]), chn(1)]),
+            ),
+        )
+
+    def test_split_at_does_not_change_children(self):
+        e = self.nested_sequence.copy()
+        for e_split in e.split_at(1, 4):
+            e_split[0][0].duration = 100
+        self.assertEqual(e, self.nested_sequence)
+
 
 if __name__ == "__main__":
     unittest.main()
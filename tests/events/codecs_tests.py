@@ -0,0 +1,175 @@
+import os
+import pickle
+import unittest
+
+from mutwo import core_events
+from mutwo import core_parameters
+
+chn = core_events.Chronon
+cns = core_events.Consecution
+cnc = core_events.Concurrence
+
+
+class Note(core_events.SlottedChronon):
+    __slots__ = ("pitch",)
+
+
+class CodecTest(unittest.TestCase):
+    def setUp(self):
+        self.event = cnc(
+            [
+                cns(
+                    [
+                        chn(1).set("pitch", [0]),
+                        chn(core_parameters.RatioDuration("1/3"), tag="a"),
+                        cnc([chn(2, tempo=30), Note(1).set("pitch", 3)]),
+                    ],
+                    tag="v0",
+                ),
+                cns([chn(0.5).set("volume", 0.2), Note(2)], tag="v1"),
+            ],
+            tempo=core_parameters.FlexTempo([[0, 60], [1, 30]]),
+        )
+
+    def assertLoadsEqual(self, event):
+        event_copy = core_events.loads(core_events.dumps(event))
+        self.assertEqual(event_copy, event)
+        self.assertEqual(type(event_copy), type(event))
+        return event_copy
+
+    def test_dumps_and_loads(self):
+        e = self.assertLoadsEqual(self.event)
+        self.assertEqual(e["v0"].tag, "v0")
+        self.assertEqual(e[0][1].duration, core_parameters.RatioDuration("1/3"))
+        self.assertEqual(e[0][2][0].tempo.bpm, 30)
+        self.assertEqual(e.tempo, self.event.tempo)
+        self.assertFalse(hasattr(e[0][2][1], "__dict__"))
+
+    def test_copy_is_independent(self):
+        e = core_events.loads(core_events.dumps(self.event))
+        e[0][0].pitch.append(1)
+        e[0][0].duration = 3
+        self.assertEqual(self.event[0][0].pitch, [0])
+        self.assertEqual(self.event[0][0].duration, 1)
+
+    def test_identity(self):
+        chronon, pitch = chn(1), [0]
+        e = cns([chronon, chronon, chn(2).set("pitch", pitch), chn(3)])
+        e[3].pitch = pitch
+        e = core_events.loads(core_events.dumps(e))
+        self.assertIs(e[0], e[1])
+        self.assertIs(e[2].pitch, e[3].pitch)
+
+    def test_events_which_are_pickled(self):
+        self.assertLoadsEqual(
+            cnc(
+                [
+                    core_events.ColumnConsecution(
+                        [chn(1).set("pitch", 0), chn(2)], ("pitch",)
+                    ),
+                    core_events.Envelope([[0, 1], [1, 0]]),
+                ]
+            )
+        )
+
+    def test_deduplicated_compound(self):
+        e = cns([chn(1).set("pitch", [0]) for _ in range(3)])
+        e.deduplicate()
+        e_copy = core_events.loads(core_events.dumps(e))
+        e_copy[:1].mutate_parameter("pitch", lambda p: p.append(1))
+        self.assertEqual(e_copy[1].pitch, [0])
+        self.assertEqual(e[0].pitch, [0])
+
+    def test_fingerprint(self):
+        fingerprint = self.event.fingerprint
+        e = self.assertLoadsEqual(self.event)
+        self.assertEqual(e.fingerprint, fingerprint)
+        e[0][0].pitch = [1]
+        self.assertNotEqual(e.fingerprint, fingerprint)
+
+    def test_other_objects(self):
+        o = [1, "a", chn(1)]
+        self.assertEqual(core_events.loads(core_events.dumps(o)), o)
+
+    def test_smaller_than_pickle(self):
+        e = cns([chn(i % 4 + 1).set("pitch", i % 12) for i in range(100)])
+        self.assertLess(len(core_events.dumps(e)), len(pickle.dumps(e)) * 0.75)
+
+    def test_invalid_data(self):
+        self.assertRaises(ValueError, core_events.loads, pickle.dumps(self.event))
+        data = bytearray(core_events.dumps(self.event))
+        data[4] = 255
+        self.assertRaises(ValueError, core_events.loads, bytes(data))
+
+    def test_compound_copy(self):
+        self.assertEqual(self.event.copy(), self.event)
+        self.assertEqual(self.event._copy_n(2), [self.event, self.event])
+
+
+class EventFileTest(unittest.TestCase):
+    path = "tests/events/event_file_test.mwef"
+
+    def setUp(self):
+        self.event = cnc(
+            [
+                cns([chn(1).set("pitch", [0]), cns([chn(2)])], tag="violin"),
+                cns([chn(3), chn(4).set("pitch", 1)], tag="cello"),
+                chn(5, tag="rest"),
+            ],
+            tempo=core_parameters.FlexTempo([[0, 60], [1, 30]]),
+        )
+        core_events.dump(self.event, self.path)
+        self.event_file = core_events.EventFile(self.path)
+
+    def tearDown(self):
+        self.event_file.close()
+        os.remove(self.path)
+
+    def test_load(self):
+        e = self.event_file.load()
+        self.assertEqual(e, self.event)
+        self.assertEqual(e.tempo, self.event.tempo)
+        self.assertEqual(e["cello"].tag, "cello")
+
+    def test_getitem(self):
+        self.assertEqual(len(self.event_file), 3)
+        self.assertEqual(self.event_file["cello"], self.event["cello"])
+        self.assertEqual(self.event_file[2], self.event[2])
+        self.assertRaises(KeyError, self.event_file.__getitem__, "flute")
+        self.assertRaises(IndexError, self.event_file.__getitem__, 3)
+
+    def test_get_event_from_index_sequence(self):
+        for index_sequence in ((0, 1, 0), (1, 1), ("violin", 1), (0,), ()):
+            self.assertEqual(
+                self.event_file.get_event_from_index_sequence(index_sequence),
+                self.event.get_event_from_index_sequence(index_sequence),
+            )
+
+    def test_loaded_events_are_independent(self):
+        e = self.event_file["violin"]
+        e[0].pitch.append(1)
+        self.assertEqual(self.event_file["violin"][0].pitch, [0])
+        self.event_file.load().tempo[0].duration = 3
+        self.assertEqual(self.event_file.load().tempo, self.event.tempo)
+
+    def test_copy_on_write(self):
+        e = self.event.copy()
+        e[0][0].pitch = [3]
+        core_events.dump(e, self.path)
+        with core_events.EventFile(self.path) as event_file:
+            self.assertEqual(event_file.load(), e)
+            self.assertEqual(event_file["violin"][0].pitch, [3])
+
+    def test_chronon(self):
+        core_events.dump(chn(2), self.path)
+        with core_events.EventFile(self.path) as event_file:
+            self.assertEqual(event_file.load(), chn(2))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(core_events.dumps(self.event))
+        self.assertRaises(ValueError, core_events.EventFile, self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
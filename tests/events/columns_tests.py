@@ -0,0 +1,203 @@
+import pickle
+import typing
+import unittest
+
+from mutwo import core_converters
+from mutwo import core_events
+from mutwo import core_parameters
+
+from .basic_tests import CompoundTest
+
+
+class ColumnConsecutionTest(unittest.TestCase, CompoundTest):
+    def setUp(self):
+        CompoundTest.setUp(self)
+        chronon_list = []
+        for duration, pitch in ((1, 0), (2, 10), (3, 20), (1.5, 30)):
+            chronon = core_events.Chronon(duration)
+            chronon.pitch = pitch
+            chronon_list.append(chronon)
+        chronon_list[2].volume = 0.5
+        self.consecution = core_events.Consecution(chronon_list)
+        self.column_consecution = core_events.ColumnConsecution(
+            chronon_list, parameter_name_tuple=("pitch",)
+        )
+
+    def get_event_class(self) -> typing.Type:
+        return core_events.ColumnConsecution
+
+    def get_event_instance(self) -> core_events.ColumnConsecution:
+        return self.get_event_class()([core_events.Chronon(3)])
+
+    def assertEqualToConsecution(
+        self,
+        consecution: core_events.Consecution,
+        column_consecution: core_events.ColumnConsecution,
+    ):
+        self.assertEqual(list(consecution), list(column_consecution))
+
+    def test_getitem_index(self):
+        for i, chronon in enumerate(self.consecution):
+            self.assertEqual(self.column_consecution[i], chronon)
+        self.assertEqual(self.column_consecution[-1], self.consecution[-1])
+        self.assertRaises(IndexError, lambda: self.column_consecution[4])
+
+    def test_getitem_slice(self):
+        self.assertEqual(
+            self.column_consecution[1:3],
+            core_events.ColumnConsecution(
+                self.consecution[1:3], parameter_name_tuple=("pitch",)
+            ),
+        )
+
+    def test_getitem_tag(self):
+        self.column_consecution[1].tag = "b"
+        self.assertEqual(self.column_consecution["b"].pitch, 10)
+
+    def test_view_writes_to_columns(self):
+        chronon = self.column_consecution[0]
+        chronon.pitch = 100
+        chronon.duration = 5
+        chronon.new_parameter = "abc"
+        self.assertEqual(self.column_consecution.get_parameter("pitch")[0], 100)
+        self.assertEqual(self.column_consecution.duration, 11.5)
+        self.assertEqual(self.column_consecution[0].new_parameter, "abc")
+
+    def test_view_undefined_parameter(self):
+        self.assertRaises(AttributeError, lambda: self.column_consecution[0].volume)
+        self.assertEqual(self.column_consecution[0].get_parameter("volume"), None)
+        self.assertEqual(self.column_consecution[0].tag, None)
+
+    def test_copy_of_view_is_chronon(self):
+        chronon = self.column_consecution[2].copy()
+        self.assertEqual(type(chronon), core_events.Chronon)
+        self.assertEqual(chronon, self.consecution[2])
+        chronon.pitch = 100
+        self.assertEqual(self.column_consecution[2].pitch, 20)
+
+    def test_setitem_index(self):
+        chronon = core_events.Chronon(100).set("unique-id", 100)
+        self.column_consecution[0] = chronon
+        self.assertEqual(self.column_consecution[0], chronon)
+
+    def test_setitem_slice(self):
+        self.column_consecution[1:] = [core_events.Chronon(1)]
+        self.assertEqual(len(self.column_consecution), 2)
+        self.assertEqual(self.column_consecution.duration, 2)
+
+    def test_delitem(self):
+        del self.column_consecution[1]
+        del self.consecution[1]
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+
+    def test_only_chronon(self):
+        self.assertRaises(
+            TypeError,
+            self.column_consecution.append,
+            core_events.Consecution([core_events.Chronon(1)]),
+        )
+
+    def test_list_methods(self):
+        chronon = core_events.Chronon(4).set("pitch", 40)
+        for e in (self.consecution, self.column_consecution):
+            e.append(chronon)
+            e.insert(1, chronon)
+            e.extend([chronon, chronon])
+            e.pop(0)
+            e.reverse()
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+        self.assertEqual(self.column_consecution.index(chronon), 0)
+        self.assertEqual(self.column_consecution.count(chronon), 4)
+        self.assertIn(chronon, self.column_consecution)
+        self.column_consecution.clear()
+        self.assertFalse(self.column_consecution)
+
+    def test_absolute_time_tuple(self):
+        self.assertEqual(
+            self.column_consecution.absolute_time_tuple,
+            self.consecution.absolute_time_tuple,
+        )
+        self.assertEqual(
+            self.column_consecution.absolute_time_in_floats_tuple,
+            (0, 1, 3, 6),
+        )
+
+    def test_duration(self):
+        self.assertEqual(self.column_consecution.duration, 7.5)
+        self.column_consecution.duration = 15
+        self.assertEqual(
+            self.column_consecution.get_parameter("duration"), (2, 4, 6, 3)
+        )
+
+    def test_get_parameter(self):
+        for parameter_name in ("duration", "pitch", "volume"):
+            for filter_undefined in (True, False):
+                self.assertEqual(
+                    self.column_consecution.get_parameter(
+                        parameter_name, filter_undefined=filter_undefined
+                    ),
+                    self.consecution.get_parameter(
+                        parameter_name, filter_undefined=filter_undefined
+                    ),
+                )
+
+    def test_set_parameter(self):
+        for e in (self.consecution, self.column_consecution):
+            e.set_parameter("pitch", lambda pitch: pitch + 1)
+            e.set_parameter("volume", 1, set_unassigned_parameter=False)
+            e.set_parameter("duration", lambda duration: duration * 2)
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+
+    def test_mutate_parameter(self):
+        for e in (self.consecution, self.column_consecution):
+            e.mutate_parameter("duration", lambda duration: duration.add(1))
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+
+    def test_cut_out(self):
+        self.consecution.cut_out(0.5, 5)
+        self.column_consecution.cut_out(0.5, 5)
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+
+    def test_cut_off(self):
+        self.consecution.cut_off(1, 3.5)
+        self.column_consecution.cut_off(1, 3.5)
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+
+    def test_squash_in(self):
+        self.consecution.squash_in(2.5, core_events.Chronon(1))
+        self.column_consecution.squash_in(2.5, core_events.Chronon(1))
+        self.assertEqualToConsecution(self.consecution, self.column_consecution)
+
+    def test_split_at(self):
+        for split_at_consecution, split_at_column_consecution in zip(
+            self.consecution.split_at(0.5, 2.5, 6),
+            self.column_consecution.split_at(0.5, 2.5, 6),
+        ):
+            self.assertEqualToConsecution(
+                split_at_consecution, split_at_column_consecution
+            )
+
+    def test_copy(self):
+        column_consecution = self.column_consecution.copy()
+        self.assertEqual(column_consecution, self.column_consecution)
+        column_consecution[0].pitch = 100
+        self.assertNotEqual(column_consecution, self.column_consecution)
+
+    def test_pickle(self):
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.column_consecution)),
+            self.column_consecution,
+        )
+
+    def test_tempo_converter(self):
+        tempo_converter = core_converters.TempoConverter(
+            core_parameters.FlexTempo([[0, 60], [4, 120]])
+        )
+        self.assertEqual(
+            tempo_converter.convert(self.column_consecution).get_parameter("duration"),
+            tempo_converter.convert(self.consecution).get_parameter("duration"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
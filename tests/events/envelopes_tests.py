@@ -3,6 +3,11 @@ import unittest
 
 import ranges
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from mutwo import core_constants
 from mutwo import core_events
 from mutwo import core_parameters
@@ -123,6 +128,42 @@ class EnvelopeTest(unittest.TestCase, CompoundTest):
             core_utilities.EmptyEnvelopeError, core_events.Envelope([]).value_at, 0
         )
 
+    def test_value_at_many(self):
+        absolute_time_list = [-1, 0, 0.25, 1.25, 2.5, 4, 5, 100, 0.5, 1.75]
+        self.assertEqual(
+            self.envelope.value_at_many(absolute_time_list),
+            tuple(map(self.envelope.value_at, absolute_time_list)),
+        )
+
+    def test_value_at_many_empty_envelope(self):
+        self.assertRaises(
+            core_utilities.EmptyEnvelopeError,
+            core_events.Envelope([]).value_at_many,
+            [0],
+        )
+
+    def test_value_at_many_zero_duration(self):
+        envelope = core_events.Envelope([[0, 1], [0, 2]])
+        self.assertEqual(envelope.value_at_many([-1, 0, 1]), (1, 1, 2))
+
+    @unittest.skipIf(np is None, "numpy isn't installed")
+    def test_value_at_many_numpy(self):
+        absolute_time_array = np.array([[-1, 0, 0.25, 1.25], [2.5, 4, 5, 100]])
+        value_array = self.envelope.value_at_many(absolute_time_array)
+        self.assertIsInstance(value_array, np.ndarray)
+        self.assertEqual(value_array.shape, absolute_time_array.shape)
+        for value, absolute_time in zip(
+            value_array.ravel(), absolute_time_array.ravel()
+        ):
+            self.assertAlmostEqual(value, self.envelope.value_at(absolute_time))
+
+    def test_parameter_at_many(self):
+        absolute_time_list = [-1, 0.25, 2.5, 100]
+        self.assertEqual(
+            self.envelope.parameter_at_many(absolute_time_list),
+            tuple(map(self.envelope.parameter_at, absolute_time_list)),
+        )
+
     def test_curve_shape_at_before(self):
         self.assertEqual(self.envelope.curve_shape_at(-1), 0)
         self.assertEqual(self.envelope.curve_shape_at(-100), 0)
@@ -213,6 +254,63 @@ class EnvelopeTest(unittest.TestCase, CompoundTest):
         )
         self.assertAlmostEqual(self.envelope.integrate_interval(-3, 0.25), 0.03125)
 
+    def test_integrate_interval_is_pure(self):
+        curve_shape_tuple = self.envelope.curve_shape_tuple
+        integral = self.envelope.integrate_interval(0.5, 3.5)
+        self.envelope.curve_shape_at(2.5)
+        self.envelope.value_at(1.5)
+        self.assertEqual(self.envelope.integrate_interval(0.5, 3.5), integral)
+        self.assertEqual(self.envelope.curve_shape_tuple, curve_shape_tuple)
+
+    def test_integrate_interval_partial_segments(self):
+        self.assertAlmostEqual(
+            self.envelope.integrate_interval(1, 1.25)
+            + self.envelope.integrate_interval(1.25, 1.5)
+            + self.envelope.integrate_interval(1.5, 2),
+            self.envelope.integrate_interval(1, 2),
+        )
+
+    def test_integrate_interval_after_change(self):
+        self.assertAlmostEqual(self.envelope.integrate_interval(4, 5), 0.625)
+        self.envelope[3].set_parameter("value", 0)
+        self.assertAlmostEqual(self.envelope.integrate_interval(4, 5), 0.375)
+        self.envelope[3].duration = 4
+        self.assertAlmostEqual(self.envelope.integrate_interval(4, 5), 0.1875)
+
+    def test_value_at_after_change(self):
+        self.assertAlmostEqual(self.envelope.value_at(1.5), 0.6224593312018545)
+        self.envelope.set_parameter("curve_shape", 0)
+        self.assertEqual(self.envelope.value_at(1.5), 0.5)
+
+        class Point(core_events.SlottedChronon):
+            __slots__ = ("value", "curve_shape")
+
+        point_list = [Point(1).set("value", 0), Point(0).set("value", 1)]
+        envelope = core_events.Envelope([p.set("curve_shape", 0) for p in point_list])
+        self.assertEqual(envelope.value_at(0.5), 0.5)
+        envelope[1].set_parameter("value", 2)
+        self.assertEqual(envelope.value_at(0.5), 1)
+
+    def test_cached_methods_after_assignment(self):
+        # Directly assigned values and curve shapes aren't reported by the
+        # events, but the cached frozen envelope mustn't become outdated.
+        e = core_events.Envelope([[0, 1], [2, 1]])
+        self.assertEqual(e.integrate_interval(0, 2), 2)
+        self.assertEqual(e.value_at_many([1]), (1,))
+        e[0].value = 2
+        self.assertEqual(e.integrate_interval(0, 2), 3)
+        self.assertEqual(e.get_average_value(0, 2), 1.5)
+        self.assertEqual(e.get_average_parameter(0, 2), 1.5)
+        self.assertEqual(e.value_at_many([1]), (1.5,))
+        self.assertEqual(e.parameter_at_many([1]), (1.5,))
+        e[0].curve_shape = 3
+        self.assertAlmostEqual(e.integrate_interval(0, 2), 3.4381247263158454)
+        self.assertAlmostEqual(e.get_average_value(0, 2), 1.7190623631579227)
+        self.assertEqual(e.value_at_many([1]), (e.value_at(1),))
+        self.assertEqual(e.parameter_at_many([1]), (e.parameter_at(1),))
+        e[0].duration = 1
+        self.assertEqual(e.value_at_many([1]), (1,))
+
     def test_get_average_value(self):
         self.assertEqual(self.envelope.get_average_value(-1, 0), 0)
         self.assertAlmostEqual(
@@ -352,5 +450,102 @@ class EnvelopeTest(unittest.TestCase, CompoundTest):
         )
 
 
+class FrozenEnvelopeTest(unittest.TestCase):
+    def setUp(self):
+        e = EnvelopeTest.EnvelopeEvent
+        self.envelope = core_events.Envelope(
+            [e(1, 0), e(1, 1, 1), e(1, 0, -1), e(2, 1), e(1, 0.5)]
+        )
+        self.frozen_envelope = self.envelope.freeze()
+
+    def test_empty_envelope(self):
+        self.assertRaises(
+            core_utilities.EmptyEnvelopeError, core_events.Envelope([]).freeze
+        )
+
+    def test_value_at(self):
+        for absolute_time in (-1, 0, 0.25, 1.25, 2.5, 3, 4, 5, 100):
+            self.assertEqual(
+                self.frozen_envelope.value_at(absolute_time),
+                self.envelope.value_at(absolute_time),
+            )
+
+    def test_parameter_at(self):
+        tempo = core_parameters.FlexTempo([[0, 60, 1], [4, 30]])
+        frozen_tempo = tempo.freeze()
+        for absolute_time in (0, 1.5, 4):
+            self.assertEqual(
+                frozen_tempo.parameter_at(absolute_time),
+                tempo.parameter_at(absolute_time),
+            )
+
+    def test_duration(self):
+        self.assertEqual(self.frozen_envelope.duration, self.envelope.duration)
+
+    def test_is_independent(self):
+        self.envelope[0].value = 100
+        self.assertEqual(self.frozen_envelope.value_at(0), 0)
+
+    def test_integrate_interval(self):
+        self.assertAlmostEqual(
+            self.frozen_envelope.integrate_interval(0, 5), 3.163953413738653
+        )
+        self.assertEqual(self.frozen_envelope.integrate_interval(1, 1), 0)
+        self.assertAlmostEqual(
+            self.frozen_envelope.integrate_interval(0, 30), 15.663953413738653
+        )
+        self.assertAlmostEqual(
+            self.frozen_envelope.integrate_interval(-3, 0.25), 0.03125
+        )
+
+    def test_integrate_interval_inside_segment(self):
+        # Sum of integrals of parts of a curved segment needs to
+        # be equal to the integral of the complete segment.
+        self.assertAlmostEqual(
+            self.frozen_envelope.integrate_interval(1, 1.25)
+            + self.frozen_envelope.integrate_interval(1.25, 1.75)
+            + self.frozen_envelope.integrate_interval(1.75, 2),
+            self.frozen_envelope.integrate_interval(1, 2),
+        )
+
+    def test_integrate_consecutive_intervals(self):
+        for absolute_time_list in (
+            [-3, 0.25, 1.25, 1.25, 2.5, 5, 30],
+            # Unsorted absolute times
+            [4, 1.5, 2.5, -1, 6],
+        ):
+            self.assertEqual(
+                self.frozen_envelope.integrate_consecutive_intervals(
+                    absolute_time_list
+                ),
+                tuple(
+                    self.frozen_envelope.integrate_interval(start, end)
+                    for start, end in zip(absolute_time_list, absolute_time_list[1:])
+                ),
+            )
+
+    def test_get_average_value(self):
+        self.assertEqual(self.frozen_envelope.get_average_value(-1, 0), 0)
+        self.assertAlmostEqual(
+            self.frozen_envelope.get_average_value(0, 5), 0.6327906827477305
+        )
+        self.assertAlmostEqual(
+            self.frozen_envelope.get_average_value(), 0.6106589022895331
+        )
+        self.assertEqual(self.frozen_envelope.get_average_value(1, 1), 1)
+
+    def test_get_average_parameter(self):
+        self.assertAlmostEqual(
+            self.frozen_envelope.get_average_parameter(0, 5), 0.6327906827477305
+        )
+
+    def test_value_at_many(self):
+        absolute_time_list = [-1, 0, 0.25, 1.25, 2.5, 4, 5, 100]
+        self.assertEqual(
+            self.frozen_envelope.value_at_many(absolute_time_list),
+            self.envelope.value_at_many(absolute_time_list),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,165 @@
+import random
+import unittest
+
+from mutwo import core_events
+
+chn = core_events.Chronon
+cns = core_events.Consecution
+cnc = core_events.Concurrence
+
+
+class IntervalIndexTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(100)
+        self.event = cnc(
+            [
+                cns([chn(1), cnc([cns([chn(2), chn(0.5)]), chn(3)]), chn(1.5)]),
+                cns([chn(0.25) for _ in range(20)]),
+                cns([chn(4), chn(0), chn(1)]),
+            ]
+        )
+        self.index = core_events.IntervalIndex(self.event)
+
+    def get_random_event(self, depth: int = 3):
+        if depth == 0 or random.random() < 0.3:
+            return chn(random.choice([0, random.uniform(0.1, 2)]))
+        return random.choice([cns, cnc])(
+            [self.get_random_event(depth - 1) for _ in range(random.randint(0, 4))]
+        )
+
+    def get_brute_force_item_list(self, event, absolute_time=0, index_tuple=()):
+        match event:
+            case core_events.Chronon():
+                return [
+                    (
+                        absolute_time,
+                        absolute_time + event.duration.beat_count,
+                        index_tuple,
+                    )
+                ]
+            case core_events.Consecution():
+                time_tuple = event.absolute_time_in_floats_tuple
+            case core_events.Concurrence():
+                time_tuple = (0,) * len(event)
+        item_list = []
+        for i, (t, e) in enumerate(zip(time_tuple, event)):
+            item_list.extend(
+                self.get_brute_force_item_list(e, absolute_time + t, index_tuple + (i,))
+            )
+        return item_list
+
+    def assertItemsEqual(self, item_tuple, brute_force_item_list):
+        self.assertEqual(
+            sorted(item.index_tuple for item in item_tuple),
+            sorted(item[2] for item in brute_force_item_list),
+        )
+
+    def test_stab(self):
+        self.assertEqual(
+            [item.index_tuple for item in self.index.stab(2.5)],
+            [(2, 0), (0, 1, 0, 0), (0, 1, 1), (1, 10)],
+        )
+
+    def test_stab_ignores_chronons_without_duration(self):
+        self.assertNotIn((2, 1), [item.index_tuple for item in self.index.stab(4)])
+
+    def test_overlap(self):
+        self.assertEqual(
+            [item.index_tuple for item in self.index.overlap(4.5, 5)],
+            [(0, 2), (2, 2), (1, 18), (1, 19)],
+        )
+        self.assertEqual(self.index.overlap(100, 200), ())
+
+    def test_range(self):
+        self.assertEqual(
+            [item.index_tuple for item in self.index.range(3, 3.5)],
+            [(0, 1, 0, 1), (1, 12), (1, 13)],
+        )
+
+    def test_item(self):
+        item = self.index.stab(0)[0]
+        self.assertEqual(item.start, 0)
+        self.assertEqual(item.end, 1)
+        self.assertIs(item.chronon, self.event[0][0])
+
+    def test_random(self):
+        for _ in range(20):
+            event = self.get_random_event()
+            if isinstance(event, core_events.Chronon):
+                continue
+            index = core_events.IntervalIndex(event)
+            brute_force_item_list = self.get_brute_force_item_list(event)
+            for _ in range(10):
+                start = random.uniform(0, 5)
+                end = start + random.uniform(0, 3)
+                self.assertItemsEqual(
+                    index.overlap(start, end),
+                    [i for i in brute_force_item_list if i[0] < end and i[1] > start],
+                )
+                self.assertItemsEqual(
+                    index.stab(start),
+                    [i for i in brute_force_item_list if i[0] <= start < i[1]],
+                )
+                self.assertItemsEqual(
+                    index.range(start, end),
+                    [i for i in brute_force_item_list if start <= i[0] < end],
+                )
+
+    def assertIndexEqual(self, index):
+        expected_index = core_events.IntervalIndex(index.compound)
+        self.assertEqual(
+            [item[:3] for item in index.overlap(0, 100)],
+            [item[:3] for item in expected_index.overlap(0, 100)],
+        )
+        self.assertEqual(
+            [item[:3] for item in index.range(0, 100)],
+            [item[:3] for item in expected_index.range(0, 100)],
+        )
+        self.assertEqual(index._start_dict, expected_index._start_dict)
+
+    def test_update_duration(self):
+        self.event[0][1][0][0].duration = 4
+        self.index.update((0, 1, 0, 0))
+        self.assertIndexEqual(self.index)
+
+    def test_update_is_incremental(self):
+        self.event[1][17].duration = 0.5
+        self.index.update((1, 17))
+        self.assertIndexEqual(self.index)
+        # Only the changed chronon and the two chronons after it, which
+        # were moved in time, are indexed again.
+        self.assertEqual(
+            [level.alive_count for level in self.index._level_list], [25, 3]
+        )
+        # Items of both levels are sorted by their start time and position.
+        self.assertEqual(
+            [item.index_tuple for item in self.index.stab(4.25)],
+            [(0, 2), (2, 2), (1, 17)],
+        )
+
+    def test_update_structure(self):
+        self.event[0][1][0].insert(0, chn(2))
+        self.event[1].pop(3)
+        self.index.update((0, 1, 0))
+        self.index.update((1,))
+        self.assertIndexEqual(self.index)
+
+    def test_update_random(self):
+        for _ in range(20):
+            event = cnc([self.get_random_event() for _ in range(3)])
+            index = core_events.IntervalIndex(event)
+            for _ in range(10):
+                index_list, e = [], event
+                while isinstance(e, core_events.abc.Compound) and e:
+                    index_list.append(random.randrange(len(e)))
+                    e = e[index_list[-1]]
+                if isinstance(e, core_events.Chronon):
+                    e.duration = random.uniform(0, 2)
+                else:
+                    e.append(chn(1))
+                index.update(index_list)
+                self.assertIndexEqual(index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 try:
@@ -11,6 +12,33 @@ from mutwo import core_parameters
 f = fractions.Fraction
 
 
+class DirectDurationWithDict(core_parameters.DirectDuration):
+    pass
+
+
+class DirectDurationTest(unittest.TestCase):
+    def test_pickle(self):
+        d = core_parameters.DirectDuration(2)
+        self.assertEqual(pickle.loads(pickle.dumps(d)), d)
+
+    def test_unpickle_dict_state(self):
+        # Pickle of 'DirectDuration(2)' from before it had slots.
+        data = (
+            b"\x80\x04\x95T\x00\x00\x00\x00\x00\x00\x00\x8c\x1fmutwo.core_parameters"
+            b".durations\x94\x8c\x0eDirectDuration\x94\x93\x94)\x81\x94}\x94\x8c\x0b"
+            b"_beat_count\x94G@\x00\x00\x00\x00\x00\x00\x00sb."
+        )
+        d = pickle.loads(data)
+        self.assertEqual(d.beat_count, 2)
+        self.assertFalse(hasattr(d, "__dict__"))
+
+    def test_pickle_subclass(self):
+        d = DirectDurationWithDict(3)
+        d.x = 1
+        d = pickle.loads(pickle.dumps(d))
+        self.assertEqual((d.beat_count, d.x), (3, 1))
+
+
 class RatioDurationTest(unittest.TestCase):
     def setUp(self):
         self.d = core_parameters.RatioDuration
@@ -50,3 +78,22 @@ class RatioDurationTest(unittest.TestCase):
     def test_add(self):
         self.assertEqual(self.d0 + 1, self.d(2))
         self.assertEqual(self.d0 + self.d1, self.d("5/2"))
+
+    def test_no_instance_dictionary(self):
+        self.assertFalse(hasattr(self.d1, "__dict__"))
+        self.assertEqual(self.d1.copy().beat_count, 1.5)
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.d1)).ratio, f(3, 2))
+
+    def test_unpickle_dict_state(self):
+        # Pickle of 'RatioDuration("2/3")' from before it had slots.
+        data = (
+            b"\x80\x04\x95f\x00\x00\x00\x00\x00\x00\x00\x8c\x1fmutwo.core_parameters"
+            b".durations\x94\x8c\rRatioDuration\x94\x93\x94)\x81\x94}\x94\x8c\x06_ratio"
+            b"\x94\x8c\tfractions\x94\x8c\x08Fraction\x94\x93\x94K\x02K\x03\x86\x94R"
+            b"\x94sb."
+        )
+        d = pickle.loads(data)
+        self.assertEqual(d.ratio, f(2, 3))
+        self.assertEqual(d.beat_count, 0.6666666667)
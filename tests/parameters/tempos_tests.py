@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import ranges
@@ -20,6 +21,22 @@ class DirectTempoTest(unittest.TestCase):
         self.assertEqual(d(30).seconds, 2)
         self.assertEqual(d(120).seconds, 0.5)
 
+    def test_no_instance_dictionary(self):
+        self.assertFalse(hasattr(core_parameters.DirectTempo(60), "__dict__"))
+
+    def test_pickle(self):
+        t = pickle.loads(pickle.dumps(core_parameters.DirectTempo(30)))
+        self.assertEqual(t.bpm, 30)
+
+    def test_unpickle_dict_state(self):
+        # Pickle of 'DirectTempo(60)' from before it had slots.
+        data = (
+            b"\x80\x04\x95G\x00\x00\x00\x00\x00\x00\x00\x8c\x1cmutwo.core_parameters"
+            b".tempos\x94\x8c\x0bDirectTempo\x94\x93\x94)\x81\x94}\x94\x8c\x04_bpm\x94"
+            b"G@N\x00\x00\x00\x00\x00\x00sb."
+        )
+        self.assertEqual(pickle.loads(data).bpm, 60)
+
 
 class WesternTempoTest(unittest.TestCase):
     def setUp(self):
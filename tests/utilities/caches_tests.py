@@ -0,0 +1,101 @@
+import pickle
+import sys
+import threading
+import unittest
+
+from mutwo import core_utilities
+
+
+class LRUCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = core_utilities.LRUCache(maxsize=3)
+
+    def test_getitem(self):
+        self.cache["a"] = 1
+        self.assertEqual(self.cache["a"], 1)
+        self.assertRaises(KeyError, lambda: self.cache["b"])
+        self.assertEqual(self.cache.hit_count, 1)
+        self.assertEqual(self.cache.miss_count, 1)
+
+    def test_maxsize(self):
+        for i in range(5):
+            self.cache[i] = i
+        self.assertEqual(len(self.cache), 3)
+        self.assertNotIn(0, self.cache)
+        self.assertNotIn(1, self.cache)
+        self.assertIn(4, self.cache)
+
+    def test_least_recently_used_is_removed(self):
+        for i in range(3):
+            self.cache[i] = i
+        self.cache[0]
+        self.cache[3] = 3
+        self.assertIn(0, self.cache)
+        self.assertNotIn(1, self.cache)
+
+    def test_max_byte_count(self):
+        cache = core_utilities.LRUCache(max_byte_count=1000)
+        for i in range(100):
+            cache[i] = float(i)
+        self.assertLessEqual(cache.byte_count, 1000)
+        self.assertGreater(len(cache), 0)
+        self.assertLess(len(cache), 100)
+        self.assertIn(99, cache)
+
+    def test_byte_count_includes_content(self):
+        cache = core_utilities.LRUCache(max_byte_count=1000)
+        key, value = (1.5, 2.5), [0.5]
+        cache[key] = value
+        self.assertEqual(
+            cache.byte_count,
+            sum(sys.getsizeof(o) for o in (key, *key, value, *value)),
+        )
+        # Changes of a cached value don't change the byte count of the cache.
+        value.extend(range(100))
+        cache.maxsize = 0
+        cache["b"] = 1
+        self.assertEqual(cache.byte_count, 0)
+
+    def test_override(self):
+        self.cache.max_byte_count = 1000
+        self.cache["a"] = 1
+        byte_count = self.cache.byte_count
+        self.assertGreater(byte_count, 0)
+        self.cache["a"] = 2
+        self.assertEqual(self.cache["a"], 2)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.byte_count, byte_count)
+
+    def test_clear(self):
+        self.cache["a"] = 1
+        self.cache.get("a")
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.byte_count, 0)
+        self.assertEqual(self.cache.hit_count, 0)
+
+    def test_pickle(self):
+        self.cache["a"] = 1
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(cache.maxsize, 3)
+        self.assertEqual(len(cache), 0)
+        cache["b"] = 2
+        self.assertEqual(cache["b"], 2)
+
+    def test_threads(self):
+        def fill(n):
+            for i in range(1000):
+                self.cache[(n, i)] = i
+                self.cache.get((n, i - 1))
+
+        thread_list = [threading.Thread(target=fill, args=(n,)) for n in range(4)]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.hit_count + self.cache.miss_count, 4000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
 import os
+import shutil
+import threading
+import time
 import unittest
 
 from mutwo import core_utilities
@@ -37,6 +40,138 @@ class DecoratorsTest(unittest.TestCase):
         # and file which became saved in between
         del nth_calculation
         os.remove(pickle_path)
+        # The lock file isn't saved next to the result.
+        self.assertEqual(
+            [n for n in os.listdir("tests/utilities") if n.endswith(".lock")], []
+        )
+
+    def test_compute_lazy_single_flight(self):
+        pickle_path = "tests/utilities/compute_lazy_single_flight_test.pickle"
+        call_list = []
+
+        @core_utilities.compute_lazy(path=pickle_path)
+        def make_complex_calculation(n):
+            call_list.append(n)
+            time.sleep(0.05)
+            return [n]
+
+        result_list = []
+        thread_list = [
+            threading.Thread(
+                target=lambda: result_list.append(make_complex_calculation(3))
+            )
+            for _ in range(4)
+        ]
+        try:
+            for thread in thread_list:
+                thread.start()
+            for thread in thread_list:
+                thread.join()
+            self.assertEqual(call_list, [3])
+            self.assertEqual(result_list, [[3]] * 4)
+            # Broken files are computed again.
+            with open(pickle_path, "wb") as f:
+                f.write(b"broken")
+            self.assertEqual(make_complex_calculation(3), [3])
+            self.assertEqual(call_list, [3, 3])
+            self.assertEqual(
+                [n for n in os.listdir("tests/utilities") if n.endswith(".tmp")], []
+            )
+        finally:
+            os.remove(pickle_path)
+
+
+class ComputeCachedTest(unittest.TestCase):
+    path = "tests/utilities/compute_cached_test"
+
+    def setUp(self):
+        self.call_list = []
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def decorate(self, **kwargs):
+        @core_utilities.compute_cached(self.path, **kwargs)
+        def f(*args, **kwargs):
+            self.call_list.append((args, kwargs))
+            return [len(self.call_list)]
+
+        return f
+
+    def get_file_count(self) -> int:
+        return len(os.listdir(self.path))
+
+    def test_many_inputs(self):
+        f = self.decorate()
+        self.assertEqual(f(1), [1])
+        self.assertEqual(f(2), [2])
+        self.assertEqual(f(1), [1])
+        self.assertEqual(f(a={"x": 1, "y": {2, 3}}, b=0), [3])
+        self.assertEqual(f(b=0, a={"y": {3, 2}, "x": 1}), [3])
+        self.assertEqual(f(1.0), [4])
+        self.assertEqual(len(self.call_list), 4)
+        self.assertEqual(self.get_file_count(), 4)
+
+    def test_results_are_independent(self):
+        f = self.decorate()
+        f(1).append(10)
+        self.assertEqual(f(1), [1])
+
+    def test_disk(self):
+        self.decorate()(1)
+        # A new decorator has an empty memory layer, but finds the file.
+        f = self.decorate()
+        self.assertEqual(f(1), [1])
+        self.assertEqual(len(self.call_list), 1)
+        # Files with a wrong header aren't loaded.
+        with open(os.path.join(self.path, os.listdir(self.path)[0]), "wb") as file:
+            file.write(b"broken")
+        self.assertEqual(self.decorate()(1), [2])
+
+    def test_memory_cache(self):
+        f = self.decorate()
+        f(1)
+        shutil.rmtree(self.path)
+        self.assertEqual(f(1), [1])
+        self.assertEqual(self.decorate(memory_max_byte_count=0)(1), [2])
+
+    def test_maxsize(self):
+        f = self.decorate(maxsize=2, memory_max_byte_count=0)
+        f(1), f(2), f(1), f(3)
+        self.assertEqual(self.get_file_count(), 2)
+        # '2' was least recently used
+        self.assertEqual(f(1), [1])
+        self.assertEqual(f(2), [4])
+
+    def test_max_byte_count(self):
+        f = self.decorate(max_byte_count=1)
+        f(1)
+        self.assertEqual(self.get_file_count(), 0)
+
+    def test_shrink_scans_rarely(self):
+        scandir, scan_list = os.scandir, []
+
+        def counting_scandir(*args):
+            scan_list.append(args)
+            return scandir(*args)
+
+        f = self.decorate(maxsize=20, memory_max_byte_count=0)
+        os.scandir = counting_scandir
+        try:
+            for n in range(40):
+                f(n)
+        finally:
+            os.scandir = scandir
+        self.assertLessEqual(self.get_file_count(), 20)
+        # Once for the initial count and then only when 'maxsize' is
+        # exceeded: each scan shrinks to 18 files, so that the cache is
+        # scanned again after 3 more writes (at write 21, 24, ..., 39).
+        self.assertEqual(len(scan_list), 8)
+
+    def test_force_to_compute(self):
+        f = self.decorate(force_to_compute=True)
+        f(1), f(1)
+        self.assertEqual(len(self.call_list), 2)
 
 
 if __name__ == "__main__":